@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+DCRP Compact Graph Format (.npz)
+
+Binary companion to dependency_graph_production.json for downstream consumers
+that only need the graph. Instead of node_link JSON, the graph is stored as:
+
+    indptr, indices     int32 CSR adjacency (outgoing edges, node order)
+    string_data         uint8 interned string table: UTF-8 strings, concatenated
+    string_offsets      int32 string i is string_data[offsets[i]:offsets[i + 1]]
+    node_path           int32 -> strings    file rel_path
+    node_spectral       int32 -> strings    PRISM spectral frequency
+    node_role           int32 -> strings    architectural role
+    node_essence        int32 -> strings    theatrical essence
+    node_exports        int32               exports_count
+    node_scc            int32               SCC id (dense, condensation order)
+    cyclic_sccs         int32               SCC ids that contain a cycle
+    edge_method         int32 -> strings    per-edge extraction method
+    meta                JSON string         format, version, generated_at
+
+The archive is written uncompressed: the arrays are small, and a plain .npz
+loads without zlib while the UTF-8 table is a quarter of fixed-width UCS-4.
+
+Usage:
+    from dcrp_compact_graph import load_compact_graph
+    compact = load_compact_graph("dependency_graph_production.npz")
+    compact.successors("mas_mcp/server.py")
+    graph = compact.to_networkx()           # Only when networkx is needed
+
+    python dcrp_compact_graph.py dependency_graph_production.npz   # Summary
+"""
+
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+COMPACT_FORMAT = "dcrp-compact-graph"
+COMPACT_VERSION = "2.0"
+
+
+@dataclass
+class CompactGraph:
+    """A loaded compact graph - plain arrays, networkx built on demand."""
+    indptr: np.ndarray
+    indices: np.ndarray
+    string_data: np.ndarray
+    string_offsets: np.ndarray
+    node_path: np.ndarray
+    node_spectral: np.ndarray
+    node_role: np.ndarray
+    node_essence: np.ndarray
+    node_exports: np.ndarray
+    node_scc: np.ndarray
+    cyclic_sccs: np.ndarray
+    edge_method: np.ndarray
+    meta: dict
+    _strings: list[str] | None = None
+    _index: dict[str, int] | None = None
+
+    @property
+    def strings(self) -> list[str]:
+        """The interned string table, decoded on first use."""
+        if self._strings is None:
+            blob = self.string_data.tobytes()
+            offsets = self.string_offsets.tolist()
+            bounds = zip(offsets[:-1], offsets[1:], strict=True)
+            self._strings = [blob[a:b].decode("utf-8") for a, b in bounds]
+        return self._strings
+
+    @property
+    def number_of_nodes(self) -> int:
+        return len(self.node_path)
+
+    @property
+    def number_of_edges(self) -> int:
+        return len(self.indices)
+
+    def nodes(self) -> list[str]:
+        strings = self.strings
+        return [strings[code] for code in self.node_path.tolist()]
+
+    def index_of(self, node: str) -> int:
+        if self._index is None:
+            self._index = {name: i for i, name in enumerate(self.nodes())}
+        return self._index[node]
+
+    def successors(self, node: str) -> list[str]:
+        i = self.index_of(node)
+        targets = self.indices[self.indptr[i]:self.indptr[i + 1]]
+        strings = self.strings
+        return [strings[code] for code in self.node_path[targets].tolist()]
+
+    def to_networkx(self):
+        """Rebuild the nx.DiGraph with the same node/edge attributes as the JSON export."""
+        import networkx as nx
+
+        strings = self.strings
+        names = self.nodes()
+        graph = nx.DiGraph()
+        for i, name in enumerate(names):
+            graph.add_node(
+                name,
+                spectral_freq=strings[self.node_spectral[i]],
+                role=strings[self.node_role[i]],
+                essence=strings[self.node_essence[i]],
+                exports_count=int(self.node_exports[i]),
+            )
+
+        sources = np.repeat(np.arange(len(names)), np.diff(self.indptr))
+        edges = zip(sources.tolist(), self.indices.tolist(), self.edge_method.tolist(), strict=True)
+        for source, target, method in edges:
+            graph.add_edge(names[source], names[target], method=strings[method])
+        return graph
+
+
+def write_compact_graph(graph, scc_of: dict[str, int], cyclic: list[int], path: str | Path) -> Path:
+    """
+    Write graph (nx.DiGraph with DCRP node attributes) as a compact .npz.
+
+    Args:
+        graph: DCRP dependency graph
+        scc_of: node -> SCC id (any integer labels; renumbered densely)
+        cyclic: SCC ids that contain a cycle
+        path: Output .npz path
+    """
+    strings: dict[str, int] = {}
+
+    def intern(value) -> int:
+        return strings.setdefault(str(value if value is not None else ""), len(strings))
+
+    nodes = list(graph.nodes())
+    position = {node: i for i, node in enumerate(nodes)}
+    scc_dense = {scc_id: i for i, scc_id in enumerate(dict.fromkeys(scc_of[n] for n in nodes))}
+
+    node_path = np.empty(len(nodes), dtype=np.int32)
+    node_spectral = np.empty(len(nodes), dtype=np.int32)
+    node_role = np.empty(len(nodes), dtype=np.int32)
+    node_essence = np.empty(len(nodes), dtype=np.int32)
+    node_exports = np.empty(len(nodes), dtype=np.int32)
+    node_scc = np.empty(len(nodes), dtype=np.int32)
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+    indices = []
+    edge_method = []
+
+    for i, (node, attrs) in enumerate(graph.nodes(data=True)):
+        node_path[i] = intern(node)
+        node_spectral[i] = intern(attrs.get('spectral_freq'))
+        node_role[i] = intern(attrs.get('role'))
+        node_essence[i] = intern(attrs.get('essence'))
+        node_exports[i] = attrs.get('exports_count', 0)
+        node_scc[i] = scc_dense[scc_of[node]]
+        for target, edge_attrs in graph.succ[node].items():
+            indices.append(position[target])
+            edge_method.append(intern(edge_attrs.get('method')))
+        indptr[i + 1] = len(indices)
+
+    encoded = [value.encode("utf-8") for value in strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype=np.int32)
+    np.cumsum([len(value) for value in encoded], out=string_offsets[1:])
+
+    path = Path(path)
+    meta = {
+        "format": COMPACT_FORMAT,
+        "version": COMPACT_VERSION,
+        "generated_at": datetime.now().isoformat(),
+        "nodes": len(nodes),
+        "edges": len(indices),
+    }
+    np.savez(
+        path,
+        indptr=indptr,
+        indices=np.asarray(indices, dtype=np.int32),
+        string_data=np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        string_offsets=string_offsets,
+        node_path=node_path,
+        node_spectral=node_spectral,
+        node_role=node_role,
+        node_essence=node_essence,
+        node_exports=node_exports,
+        node_scc=node_scc,
+        cyclic_sccs=np.asarray(sorted(scc_dense[c] for c in cyclic if c in scc_dense), dtype=np.int32),
+        edge_method=np.asarray(edge_method, dtype=np.int32),
+        meta=np.asarray(json.dumps(meta)),
+    )
+    return path
+
+
+def load_compact_graph(path: str | Path) -> CompactGraph:
+    """Load a compact graph (no pickle, no networkx import)."""
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+    meta = json.loads(str(arrays.pop("meta")))
+    if meta.get("format") != COMPACT_FORMAT:
+        raise ValueError(f"Not a DCRP compact graph: {path}")
+    if meta.get("version") != COMPACT_VERSION:
+        raise ValueError(f"Unsupported DCRP compact graph version {meta.get('version')}: {path}")
+    return CompactGraph(meta=meta, **arrays)
+
+
+if __name__ == "__main__":
+    compact = load_compact_graph(sys.argv[1] if len(sys.argv) > 1 else "dependency_graph_production.npz")
+    print(json.dumps({
+        **compact.meta,
+        "strings": len(compact.strings),
+        "cyclic_sccs": len(compact.cyclic_sccs),
+    }, indent=2))
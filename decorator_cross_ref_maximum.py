@@ -30,6 +30,11 @@ from dataclasses import dataclass, field
 from collections import defaultdict
 import networkx as nx
 
+# Shared pruned scandir walker and module-resolution index (mas_mcp/lib/)
+sys.path.insert(0, str(Path(__file__).parent / "mas_mcp"))
+from lib.fs_walk import walk_files
+from lib.module_index import ModuleIndex
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  CONFIGURATION: The Decorator's Parameters
 # ═══════════════════════════════════════════════════════════════════════════
@@ -177,39 +182,17 @@ class PythonASTAnalyzer:
     def resolve_import_to_path(
         import_stmt: ImportStatement,
         current_file: Path,
-        repo_root: Path
+        index: ModuleIndex
     ) -> Optional[Path]:
-        """Resolve import statement to actual file path."""
+        """Resolve import statement to actual file path (index lookups, no stat calls)."""
         if import_stmt.is_relative:
             # Relative import: resolve from current directory
-            base_dir = current_file.parent
-            module_parts = import_stmt.module.split('.') if import_stmt.module else []
-            
-            potential_path = base_dir
-            for part in module_parts:
-                potential_path = potential_path / part
-            
             # Try .py file first, then __init__.py
-            if (potential_path.with_suffix('.py')).exists():
-                return potential_path.with_suffix('.py')
-            elif (potential_path / '__init__.py').exists():
-                return potential_path / '__init__.py'
-        
-        else:
-            # Absolute import: search from repo root
-            module_parts = import_stmt.module.split('.')
-            potential_path = repo_root
-            
-            for part in module_parts:
-                potential_path = potential_path / part
-            
-            # Try .py file first, then __init__.py
-            if (potential_path.with_suffix('.py')).exists():
-                return potential_path.with_suffix('.py')
-            elif (potential_path / '__init__.py').exists():
-                return potential_path / '__init__.py'
+            module_parts = import_stmt.module.split('.') if import_stmt.module else []
+            return index.module_file(current_file.parent, module_parts, '.py', '__init__.py')
         
-        return None
+        # Absolute import: search from repo root
+        return index.python_module(import_stmt.module)
 
 
 class RustAnalyzer:
@@ -254,9 +237,9 @@ class RustAnalyzer:
     def resolve_use_to_path(
         import_stmt: ImportStatement,
         current_file: Path,
-        repo_root: Path
+        index: ModuleIndex
     ) -> Optional[Path]:
-        """Resolve Rust use statement to file path."""
+        """Resolve Rust use statement to file path (index lookups, no stat calls)."""
         module_path = import_stmt.module.replace('/', '::')
         
         if import_stmt.is_relative:
@@ -266,24 +249,16 @@ class RustAnalyzer:
             
             # Navigate based on crate/super/self
             if 'crate::' in module_path:
-                base_dir = repo_root / 'src'
                 parts = [p for p in parts if p not in ['crate', '']]
+                return index.rust_module('::'.join(['crate'] + parts))
             elif 'super::' in module_path:
                 base_dir = current_file.parent.parent
                 parts = [p for p in parts if p not in ['super', '']]
             elif 'self::' in module_path:
                 parts = [p for p in parts if p not in ['self', '']]
             
-            # Build path
-            potential_path = base_dir
-            for part in parts:
-                potential_path = potential_path / part
-            
             # Try .rs file or mod.rs
-            if (potential_path.with_suffix('.rs')).exists():
-                return potential_path.with_suffix('.rs')
-            elif (potential_path / 'mod.rs').exists():
-                return potential_path / 'mod.rs'
+            return index.module_file(base_dir, parts, '.rs', 'mod.rs')
         
         return None
     
@@ -297,8 +272,9 @@ class MLSynthesizer:
     via pattern recognition, not rigid templates.
     """
     
-    def __init__(self, ssot_content: str):
+    def __init__(self, ssot_content: str, index: ModuleIndex):
         self.ssot = ssot_content
+        self.index = index  # Import resolution, built from the scan's walk
         # Extract key concepts from SSOT for context-aware synthesis
         self.ssot_concepts = self._extract_ssot_concepts()
         
@@ -336,9 +312,9 @@ class MLSynthesizer:
         # Resolve use statements to actual file dependencies
         for import_stmt in imports:
             resolved_path = RustAnalyzer.resolve_use_to_path(
-                import_stmt, path, REPO_ROOT
+                import_stmt, path, self.index
             )
-            if resolved_path and resolved_path.exists():
+            if resolved_path:
                 identity.dependencies.add(resolved_path)
         
         # Synthesize theatrical essence based on content
@@ -376,9 +352,9 @@ class MLSynthesizer:
         # Resolve imports to actual file dependencies
         for import_stmt in imports:
             resolved_path = PythonASTAnalyzer.resolve_import_to_path(
-                import_stmt, path, REPO_ROOT
+                import_stmt, path, self.index
             )
-            if resolved_path and resolved_path.exists():
+            if resolved_path:
                 identity.dependencies.add(resolved_path)
         
         # Synthesize essence based on content patterns
@@ -526,7 +502,7 @@ class MLSynthesizer:
                 # Relative import
                 try:
                     potential_dep = (path.parent / imp).with_suffix(path.suffix)
-                    if potential_dep.exists():
+                    if self.index.is_file(potential_dep):
                         identity.dependencies.add(potential_dep)
                 except:
                     pass
@@ -580,40 +556,36 @@ def scan_repository() -> Tuple[List[FileIdentity], List[DirectoryIdentity]]:
     print("║  THE DECORATOR'S CROSS-REFERENCE PROTOCOL: INITIALIZATION   ║")
     print("╚══════════════════════════════════════════════════════════════╝\n")
     
-    # Load SSOT for context
-    ssot_content = SSOT_PATH.read_text(encoding='utf-8')
-    synthesizer = MLSynthesizer(ssot_content)
-    
     file_identities = []
     dir_identities = []
     
     print("Scanning repository structure...")
     
-    for path in REPO_ROOT.rglob('*'):
-        # Skip excluded directories
-        if any(excluded in path.parts for excluded in EXCLUDE_DIRS):
-            continue
-        
-        # Skip excluded files
-        if path.name in EXCLUDE_FILES:
-            continue
-        
-        if path.is_file():
-            print(f"  Analyzing: {path.relative_to(REPO_ROOT)}")
-            identity = synthesizer.synthesize_identity(path)
-            file_identities.append(identity)
-        
-        elif path.is_dir():
-            # Check if directory is empty or sparse
-            children = list(path.iterdir())
-            if not children or all(c.name.startswith('.') for c in children):
-                # Empty or hidden-only directory
-                dir_identity = DirectoryIdentity(
-                    path=path,
-                    intended_purpose="Awaiting architectural materialization",
-                    architectural_significance="Violet frequency - potential space"
-                )
-                dir_identities.append(dir_identity)
+    # Single pruned walk: excluded dirs are never descended into, and the
+    # same listing feeds void-dir detection and the module-resolution index
+    void_dirs = []
+    paths = [
+        Path(entry.path)
+        for entry in walk_files(REPO_ROOT, EXCLUDE_DIRS, EXCLUDE_FILES, void_dirs=void_dirs)
+    ]
+    
+    # Load SSOT for context
+    ssot_content = SSOT_PATH.read_text(encoding='utf-8')
+    synthesizer = MLSynthesizer(ssot_content, ModuleIndex(REPO_ROOT, paths))
+    
+    for path in paths:
+        print(f"  Analyzing: {path.relative_to(REPO_ROOT)}")
+        identity = synthesizer.synthesize_identity(path)
+        file_identities.append(identity)
+    
+    for path in void_dirs:
+        # Empty or hidden-only directory
+        dir_identity = DirectoryIdentity(
+            path=path,
+            intended_purpose="Awaiting architectural materialization",
+            architectural_significance="Violet frequency - potential space"
+        )
+        dir_identities.append(dir_identity)
     
     print(f"\n✅ Scanned {len(file_identities)} files")
     print(f"✅ Identified {len(dir_identities)} void directories\n")
@@ -14,7 +14,7 @@
 ║           intelligent circular dependency breaking and sustainable design   ║
 ║                                                                              ║
 ║  Invocation: uv run python decorator_cross_ref_production.py                ║
-║              [--dry-run] [--inject] [--watch]                               ║
+║              [--dry-run] [--inject] [--watch] [--jobs N]                    ║
 ║                                                                              ║
 ║  The Decorator's Mandate: "Self-aware. Self-updating. Self-correcting."     ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
@@ -23,13 +23,15 @@
 import argparse
 import hashlib
 import json
+import os
 import re
 import ast
+import struct
 import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional, Any
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
 from collections import defaultdict
 from datetime import datetime
 import networkx as nx
@@ -37,12 +39,27 @@ import networkx as nx
 # TypeScript dependency resolution (Session 3 enhancement)
 from typescript_dependency_resolver import TypeScriptRegexExtractor
 
+# Shared pruned scandir walker and module-resolution index (mas_mcp/lib/)
+sys.path.insert(0, str(Path(__file__).parent / "mas_mcp"))
+from lib.fs_walk import walk_files
+from lib.module_index import ModuleIndex
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════
 
 REPO_ROOT = Path(__file__).parent
 SSOT_PATH = REPO_ROOT / ".github" / "copilot-instructions.md"
+STATE_PATH = REPO_ROOT / ".dcrp_state.json"  # Incremental state (identities + edges)
+REPORT_PATH = REPO_ROOT / "DCRP_PRODUCTION_ANALYSIS.md"
+GRAPH_PATH = REPO_ROOT / "dependency_graph_production.json"
+COMPACT_GRAPH_PATH = REPO_ROOT / "dependency_graph_production.npz"  # CSR + interned strings
+
+# Shared TS import extractor (per process - memoizes specifier resolution)
+TS_EXTRACTOR = TypeScriptRegexExtractor()
+
+# Module-resolution index from the scan's directory walk (see set_module_index)
+MODULE_INDEX: Optional[ModuleIndex] = None
 
 # Exclusions (never process these)
 EXCLUDE_DIRS = {
@@ -106,10 +123,30 @@ class EvolutionSnapshot:
         }
 
 class EvolutionTracker:
-    """Track repository evolution over time with historical metrics."""
+    """
+    Track repository evolution over time with historical metrics.
+    
+    Storage is append-only, so a run costs the same after a thousand CI runs
+    as after ten:
+    - HISTORY_FILE: one full snapshot per JSONL line (spectral distribution,
+      top dependencies, ...), appended and never rewritten
+    - SUMMARY_FILE: fixed-size binary records (SUMMARY_RECORD) of the trend
+      columns, so the last N rows are a single seek + read
     
-    HISTORY_FILE = REPO_ROOT / ".dcrp_evolution.json"
-    MAX_SNAPSHOTS = 100  # Keep last 100 runs
+    The evolution report renders only the last REPORT_WINDOW snapshots.
+    """
+    
+    HISTORY_FILE = REPO_ROOT / ".dcrp_evolution.jsonl"
+    SUMMARY_FILE = REPO_ROOT / ".dcrp_evolution.summary"
+    LEGACY_HISTORY_FILE = REPO_ROOT / ".dcrp_evolution.json"  # Pre-JSONL format, migrated once
+    REPORT_WINDOW = 100  # Snapshots rendered in the evolution report
+    
+    # epoch seconds, files, dependencies, cycles, largest cluster, cache hit rate
+    SUMMARY_RECORD = struct.Struct('<d4id')
+    SUMMARY_FIELDS = (
+        'timestamp', 'total_files', 'total_dependencies', 'circular_cycles',
+        'largest_cluster_size', 'cache_hit_rate'
+    )
     
     @staticmethod
     def record_snapshot(
@@ -143,36 +180,109 @@ class EvolutionTracker:
             largest_cluster_size=largest_cluster
         )
         
-        # Load existing history
-        history = EvolutionTracker.load_history()
-        
-        # Append new snapshot
-        history.append(snapshot.to_dict())
-        
-        # Keep only last MAX_SNAPSHOTS
-        if len(history) > EvolutionTracker.MAX_SNAPSHOTS:
-            history = history[-EvolutionTracker.MAX_SNAPSHOTS:]
-        
-        # Save
-        with open(EvolutionTracker.HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=2)
+        EvolutionTracker._migrate_legacy_history()
+        EvolutionTracker._append(snapshot.to_dict())
         
         return snapshot
     
     @staticmethod
-    def load_history() -> List[dict]:
-        """Load historical snapshots."""
-        if not EvolutionTracker.HISTORY_FILE.exists():
-            return []
+    def _append(snapshot: dict) -> None:
+        """Append one snapshot to the JSONL log and the columnar summary."""
+        with open(EvolutionTracker.HISTORY_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(snapshot) + '\n')
+        
+        record = EvolutionTracker.SUMMARY_RECORD
+        with open(EvolutionTracker.SUMMARY_FILE, 'ab') as f:
+            # Drop a torn trailing record from an interrupted run
+            size = f.tell()
+            if size % record.size:
+                f.truncate(size - size % record.size)
+            f.write(record.pack(
+                datetime.fromisoformat(snapshot['timestamp']).timestamp(),
+                snapshot['total_files'],
+                snapshot['total_dependencies'],
+                snapshot['circular_cycles'],
+                snapshot.get('largest_cluster_size', 0),
+                snapshot.get('cache_hit_rate', 0.0),
+            ))
+    
+    @staticmethod
+    def _migrate_legacy_history() -> None:
+        """Convert a pre-JSONL .dcrp_evolution.json once, then remove it."""
+        legacy = EvolutionTracker.LEGACY_HISTORY_FILE
+        if not legacy.exists() or EvolutionTracker.HISTORY_FILE.exists():
+            return
         try:
-            with open(EvolutionTracker.HISTORY_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
+            with open(legacy, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            return
+        for snapshot in history:
+            EvolutionTracker._append(snapshot)
+        legacy.unlink()
+    
+    @staticmethod
+    def snapshot_count() -> int:
+        """Total snapshots recorded (from the summary file size)."""
+        try:
+            return EvolutionTracker.SUMMARY_FILE.stat().st_size // EvolutionTracker.SUMMARY_RECORD.size
+        except OSError:
+            return 0
+    
+    @staticmethod
+    def load_summary(limit: int = REPORT_WINDOW) -> List[dict]:
+        """Last `limit` summary rows (oldest first), read with one seek."""
+        record = EvolutionTracker.SUMMARY_RECORD
+        total = EvolutionTracker.snapshot_count()
+        count = min(total, limit)
+        if count == 0:
             return []
+        with open(EvolutionTracker.SUMMARY_FILE, 'rb') as f:
+            f.seek((total - count) * record.size)
+            data = f.read(count * record.size)
+        
+        rows = []
+        for values in record.iter_unpack(data[:len(data) - len(data) % record.size]):
+            row = dict(zip(EvolutionTracker.SUMMARY_FIELDS, values, strict=True))
+            row['timestamp'] = datetime.fromtimestamp(row['timestamp']).isoformat()
+            rows.append(row)
+        return rows
     
     @staticmethod
-    def generate_evolution_report(history: List[dict]) -> str:
-        """Generate markdown report showing repository evolution."""
+    def load_history(limit: int = REPORT_WINDOW) -> List[dict]:
+        """Last `limit` full snapshots from the JSONL log, reading backwards from the end."""
+        path = EvolutionTracker.HISTORY_FILE
+        if limit <= 0 or not path.exists():
+            return []
+        
+        block_size = 64 * 1024
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            tail = b''
+            while position > 0 and tail.count(b'\n') <= limit:
+                step = min(block_size, position)
+                position -= step
+                f.seek(position)
+                tail = f.read(step) + tail
+        
+        history = []
+        for line in tail.splitlines()[-limit:]:
+            try:
+                history.append(json.loads(line))
+            except ValueError:
+                continue  # Partial first line of the window, or a torn write
+        return history
+    
+    @staticmethod
+    def generate_evolution_report(history: List[dict], total_snapshots: Optional[int] = None) -> str:
+        """
+        Generate markdown report showing repository evolution.
+        
+        Args:
+            history: Summary rows to compare (first vs last), oldest first
+            total_snapshots: All snapshots ever recorded, if more than len(history)
+        """
         if len(history) < 2:
             return "## Repository Evolution\n\n*Insufficient data (need at least 2 snapshots)*\n"
         
@@ -183,7 +293,9 @@ class EvolutionTracker:
         last = history[-1]
         
         lines.append(f"**Tracking Period:** {first['timestamp'][:10]} to {last['timestamp'][:10]}")
-        lines.append(f"**Snapshots Recorded:** {len(history)}")
+        lines.append(f"**Snapshots Recorded:** {total_snapshots or len(history)}")
+        if total_snapshots and total_snapshots > len(history):
+            lines.append(f"**Window:** last {len(history)} snapshots")
         lines.append("")
         
         # File growth
@@ -342,19 +454,42 @@ class ProgressTracker:
 #  STATE MANAGEMENT (Incremental Processing)
 # ═══════════════════════════════════════════════════════════════════════════
 
+def compute_listing_fingerprint(rel_paths) -> str:
+    """
+    Fingerprint the set of tracked files.
+    
+    Import resolution probes for files by existence (module.py vs
+    package/__init__.py, mod.rs, index.ts, markdown link targets), so cached
+    edges are only valid while the directory listing is unchanged.
+    """
+    digest = hashlib.sha256()
+    for rel_path in sorted(rel_paths):
+        digest.update(rel_path.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
 @dataclass
 class ProcessingState:
     """Track processing state for incremental updates."""
-    file_states: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # rel_path -> {mtime, hash, identity}
+    file_states: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # rel_path -> {mtime, hash, identity, edges}
     last_run: str = ""
+    listing_fingerprint: str = ""  # Directory listing the cached edges were resolved against
+    fresh_edges: Dict[str, List[str]] = field(default_factory=dict)  # Edges extracted by the current scan (not persisted)
     
     def save(self, path: Path):
-        """Save state to JSON."""
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump({
-                'file_states': self.file_states,
-                'last_run': datetime.now().isoformat()
-            }, f, indent=2)
+        """Save state to JSON (temp file + os.replace, so an interrupted run keeps the old state)."""
+        tmp = path.with_name(f".{path.name}.dcrp-tmp")
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'file_states': self.file_states,
+                    'last_run': datetime.now().isoformat(),
+                    'listing_fingerprint': self.listing_fingerprint
+                }, f, indent=2)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
     
     @staticmethod
     def load(path: Path) -> 'ProcessingState':
@@ -367,7 +502,8 @@ class ProcessingState:
                 data = json.load(f)
                 return ProcessingState(
                     file_states=data.get('file_states', {}),
-                    last_run=data.get('last_run', '')
+                    last_run=data.get('last_run', ''),
+                    listing_fingerprint=data.get('listing_fingerprint', '')
                 )
         except:
             return ProcessingState()
@@ -394,11 +530,29 @@ class ProcessingState:
         if isinstance(identity_dict.get('dependents'), set):
             identity_dict['dependents'] = list(identity_dict['dependents'])
         
+        # Replacing the entry drops any cached edges - the file changed
         self.file_states[rel_path] = {
             'mtime': mtime,
             'hash': content_hash,
             'identity': identity_dict
         }
+    
+    def get_cached_edges(self, rel_path: str) -> Optional[List[str]]:
+        """Resolved outgoing edges from the last run, or None if they must be re-extracted."""
+        entry = self.file_states.get(rel_path)
+        return entry.get('edges') if entry else None
+    
+    def update_edges(self, rel_path: str, edges: List[str], fresh: bool = False):
+        """
+        Record resolved outgoing edges (relative paths) for an unchanged-file fast path.
+        
+        fresh=True marks edges resolved against the current filesystem during
+        this run, so the graph builder uses them even when the listing changed.
+        """
+        if rel_path in self.file_states:
+            self.file_states[rel_path]['edges'] = edges
+        if fresh:
+            self.fresh_edges[rel_path] = edges
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  CORE DATA STRUCTURES
@@ -416,15 +570,18 @@ class FileIdentity:
     dependencies: Set[str] = field(default_factory=set)  # Relative paths as strings
     dependents: Set[str] = field(default_factory=set)
     content_hash: str = ""
-    circular_with: List[List[str]] = field(default_factory=list)  # Cycles this file participates in
+    scc_id: Optional[int] = None  # Cyclic SCC this file belongs to (None = not in a cycle)
     last_updated: str = ""
 
+FILE_IDENTITY_FIELDS = set(FileIdentity.__dataclass_fields__)
+
 @dataclass
 class CircularCluster:
     """Group of files in circular dependency."""
     members: Set[str]
     break_edges: List[Tuple[str, str]]  # Edges to remove to break cycle
     resolution_strategy: str
+    scc_id: Optional[int] = None
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  DEPENDENCY ANALYZER (AST-based for Python/Rust)
@@ -485,27 +642,11 @@ class DependencyExtractor:
                 target = base_dir
             
             # Try .py file, then __init__.py
-            if (target.with_suffix('.py')).exists():
-                return target.with_suffix('.py')
-            elif (target / '__init__.py').exists():
-                return target / '__init__.py'
-            return None
+            return get_module_index().module_file(target, [], '.py', '__init__.py')
         
-        # Absolute imports
-        module_parts = module_name.split('.')
-        
-        # Try from repo root first (local packages)
-        target = repo_root
-        for part in module_parts:
-            target = target / part
-        
-        if (target.with_suffix('.py')).exists():
-            return target.with_suffix('.py')
-        elif (target / '__init__.py').exists():
-            return target / '__init__.py'
-        
-        # Not a local import (stdlib or site-packages)
-        return None
+        # Absolute imports: local packages from repo root, otherwise
+        # stdlib or site-packages (None)
+        return get_module_index().python_module(module_name)
     
     @staticmethod
     def extract_rust_deps(path: Path, content: str) -> Set[Path]:
@@ -534,9 +675,9 @@ class DependencyExtractor:
         parts = use_path.replace('::', '/').split('/')
         
         if 'crate' in parts:
-            # From src root
-            base_dir = repo_root / 'src'
+            # From src root (indexed by crate path)
             parts = [p for p in parts if p not in ['crate', '']]
+            return get_module_index().rust_module('::'.join(['crate'] + parts))
         elif 'super' in parts:
             # Up one directory
             base_dir = current_file.parent.parent
@@ -548,18 +689,8 @@ class DependencyExtractor:
         else:
             return None  # External crate
         
-        # Build path
-        target = base_dir
-        for part in parts:
-            target = target / part
-        
         # Try .rs or mod.rs
-        if (target.with_suffix('.rs')).exists():
-            return target.with_suffix('.rs')
-        elif (target / 'mod.rs').exists():
-            return target / 'mod.rs'
-        
-        return None
+        return get_module_index().module_file(base_dir, parts, '.rs', 'mod.rs')
     
     @staticmethod
     def extract_markdown_deps(path: Path, content: str) -> Set[Path]:
@@ -593,21 +724,20 @@ class DependencyExtractor:
         - Re-exports (export { X } from "path")
         - Bun path aliases (@/ → mas_mcp/frontend/)
         - Index file resolution (./components → ./components/index.ts)
-        """
-        extractor = TypeScriptRegexExtractor()
-        
-        # Use robust extraction from typescript_dependency_resolver
-        deps = extractor.extract_and_resolve(path, REPO_ROOT)
         
-        return deps
+        Uses the shared TS_EXTRACTOR so resolutions are memoized across files
+        and existence checks come from the module index.
+        """
+        return TS_EXTRACTOR.extract_and_resolve(path, REPO_ROOT, content)
     
     @staticmethod
-    def extract_dependencies(path: Path) -> Set[Path]:
+    def extract_dependencies(path: Path, content: Optional[str] = None) -> Set[Path]:
         """Route to appropriate extractor based on file type."""
-        try:
-            content = path.read_text(encoding='utf-8', errors='ignore')
-        except:
-            return set()
+        if content is None:
+            try:
+                content = path.read_text(encoding='utf-8', errors='ignore')
+            except:
+                return set()
         
         if path.suffix == '.py':
             return DependencyExtractor.extract_python_deps(path, content)
@@ -624,86 +754,215 @@ class DependencyExtractor:
 #  CIRCULAR DEPENDENCY RESOLVER
 # ═══════════════════════════════════════════════════════════════════════════
 
+@dataclass
+class SCCAnalysis:
+    """Strongly connected components of the dependency graph."""
+    components: Dict[int, Set[str]]          # SCC id -> member rel_paths
+    scc_of: Dict[str, int]                   # file rel_path -> SCC id
+    cyclic: List[int] = field(default_factory=list)  # SCC ids that contain a cycle
+    next_id: int = 0                         # Next free SCC id (incremental updates)
+    
+    def members(self, scc_id: int) -> Set[str]:
+        return self.components[scc_id]
+    
+    def condensation_size(self, graph: nx.DiGraph) -> Tuple[int, int]:
+        """(components, edges) of the condensation DAG."""
+        scc_of = self.scc_of
+        dag_edges = {(scc_of[u], scc_of[v]) for u, v in graph.edges() if scc_of[u] != scc_of[v]}
+        return len(self.components), len(dag_edges)
+
 class CircularDependencyResolver:
     """Detect and resolve circular dependencies using graph algorithms."""
     
+    # Bounds for cycle enumeration - simple_cycles output is exponential in
+    # dense SCCs (the markdown cross-link mesh), so only a sample is listed
+    MAX_CYCLES_PER_SCC = 20
+    MAX_CYCLE_LENGTH = 8
+    
     @staticmethod
-    def detect_cycles(graph: nx.DiGraph) -> List[List[str]]:
-        """Find all simple cycles using Johnson's algorithm."""
-        try:
-            return list(nx.simple_cycles(graph))
-        except:
-            return []
+    def analyze_components(graph: nx.DiGraph) -> SCCAnalysis:
+        """Compute SCCs via the condensation DAG - O(V+E)."""
+        condensation = nx.condensation(graph)
+        components = dict(condensation.nodes(data='members'))
+        cyclic = [
+            scc_id for scc_id, members in components.items()
+            if CircularDependencyResolver._is_cyclic(graph, members)
+        ]
+        return SCCAnalysis(
+            components=components,
+            scc_of=condensation.graph['mapping'],
+            cyclic=cyclic,
+            next_id=len(components)
+        )
+    
+    @staticmethod
+    def _is_cyclic(graph: nx.DiGraph, members: Set[str]) -> bool:
+        if len(members) > 1:
+            return True
+        node = next(iter(members))
+        return graph.has_edge(node, node)
+    
+    @staticmethod
+    def update_components(
+        graph: nx.DiGraph,
+        analysis: SCCAnalysis,
+        node: str,
+        added_targets: Set[str]
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Re-derive SCCs after node's outgoing edges changed (graph already updated).
+        
+        Only the affected region is recomputed: node's old SCC (removed edges
+        can split it) plus, for each added edge node -> target that closes a
+        cycle, the SCCs on target -> node paths (they merge).
+        
+        Returns:
+            (retired SCC ids, new SCC ids)
+        """
+        region = set(analysis.components[analysis.scc_of[node]])
+        ancestors = None
+        for target in added_targets:
+            if analysis.scc_of[target] == analysis.scc_of[node]:
+                continue
+            if ancestors is None:
+                ancestors = nx.ancestors(graph, node) | {node}
+            if target in ancestors:
+                on_path = (nx.descendants(graph, target) | {target}) & ancestors
+                for v in on_path:
+                    region |= analysis.components[analysis.scc_of[v]]
+        
+        retired = sorted({analysis.scc_of[v] for v in region})
+        for scc_id in retired:
+            del analysis.components[scc_id]
+        analysis.cyclic = [scc_id for scc_id in analysis.cyclic if scc_id not in retired]
+        
+        created = []
+        for members in nx.strongly_connected_components(graph.subgraph(region)):
+            scc_id = analysis.next_id
+            analysis.next_id += 1
+            analysis.components[scc_id] = set(members)
+            for v in members:
+                analysis.scc_of[v] = scc_id
+            if CircularDependencyResolver._is_cyclic(graph, members):
+                analysis.cyclic.append(scc_id)
+            created.append(scc_id)
+        return retired, created
+    
+    @staticmethod
+    def detect_cycles(
+        graph: nx.DiGraph,
+        analysis: Optional[SCCAnalysis] = None,
+        max_cycles_per_scc: int = MAX_CYCLES_PER_SCC,
+        max_length: int = MAX_CYCLE_LENGTH,
+        scc_ids: Optional[List[int]] = None
+    ) -> List[List[str]]:
+        """
+        List representative simple cycles, at most max_cycles_per_scc per
+        cyclic SCC and none longer than max_length.
+        
+        Every cyclic SCC contributes at least one cycle; if none fits the
+        length bound, one longer cycle is taken from a DFS. scc_ids limits
+        enumeration to those (cyclic) components.
+        """
+        from itertools import islice
+        
+        if analysis is None:
+            analysis = CircularDependencyResolver.analyze_components(graph)
+        
+        cycles = []
+        for scc_id in (analysis.cyclic if scc_ids is None else scc_ids):
+            subgraph = graph.subgraph(analysis.members(scc_id))
+            found = list(islice(
+                nx.simple_cycles(subgraph, length_bound=max_length),
+                max_cycles_per_scc
+            ))
+            if not found:
+                found = [[source for source, _ in nx.find_cycle(subgraph)]]
+            cycles.extend(found)
+        return cycles
+    
+    @staticmethod
+    def _feedback_arcs(subgraph: nx.DiGraph) -> List[Tuple[str, str]]:
+        """
+        Greedy feedback arc set (Eades-Lin-Smyth ordering).
+        
+        Sinks go to the back of the ordering, sources to the front, otherwise
+        the node with the largest out-in degree surplus goes to the front.
+        Edges pointing backwards in the ordering break every cycle, so no
+        acyclicity re-check is needed after each removal.
+        """
+        remaining = subgraph.copy()
+        front, back = [], []
+        
+        while remaining:
+            changed = True
+            while changed:
+                changed = False
+                for node in [n for n in remaining if remaining.out_degree(n) == 0]:
+                    back.append(node)
+                    remaining.remove_node(node)
+                    changed = True
+                for node in [n for n in remaining if remaining.in_degree(n) == 0]:
+                    front.append(node)
+                    remaining.remove_node(node)
+                    changed = True
+            if remaining:
+                node = max(remaining, key=lambda n: (remaining.out_degree(n) - remaining.in_degree(n), n))
+                front.append(node)
+                remaining.remove_node(node)
+        
+        position = {node: i for i, node in enumerate(front + back[::-1])}
+        return sorted(
+            (source, target) for source, target in subgraph.edges()
+            if position[source] >= position[target]
+        )
     
     @staticmethod
     def break_cycles_intelligently(
         graph: nx.DiGraph,
-        cycles: List[List[str]]
+        analysis: Optional[SCCAnalysis] = None,
+        scc_ids: Optional[List[int]] = None
     ) -> Tuple[List[CircularCluster], List[Tuple[str, str]]]:
         """
         Break cycles using SCC-aware strategy (optimized for documentation clusters).
         
         Strategy:
-        1. Find strongly connected components (SCCs) - O(V+E)
+        1. Take the cyclic strongly connected components (SCCs) - O(V+E)
         2. Identify "documentation meshes" (tightly coupled navigational docs)
         3. For documentation meshes: PRESERVE bidirectional links (they're intentional)
-        4. For code SCCs: Use greedy heuristic to break with minimal impact
+        4. For code SCCs: one greedy feedback-arc pass per SCC
+        
+        scc_ids limits the pass to those (cyclic) components.
         """
+        if analysis is None:
+            analysis = CircularDependencyResolver.analyze_components(graph)
+        
         clusters = []
         edges_to_remove = []
         
-        # Group cycles into SCCs
-        sccs = list(nx.strongly_connected_components(graph))
-        sccs = [scc for scc in sccs if len(scc) > 1]  # Filter single-node SCCs
-        
         # Documentation mesh detection
         def is_documentation_mesh(scc_nodes: Set[str]) -> bool:
             """Detect if SCC is intentional navigation mesh (all markdown)."""
             return all(node.endswith('.md') for node in scc_nodes)
         
-        for scc in sccs:
-            subgraph = graph.subgraph(scc).copy()
+        for scc_id in (analysis.cyclic if scc_ids is None else scc_ids):
+            scc = analysis.members(scc_id)
+            if len(scc) < 2:
+                continue  # Self-import - nothing to cluster
             
             # Check if this is a documentation navigation mesh
             if is_documentation_mesh(scc):
                 # PRESERVE documentation meshes - they're intentional navigation
-                strategy = "DOCUMENTATION_MESH_PRESERVED"
-                removed = []  # Don't break any edges
-                
-                cluster = CircularCluster(
+                clusters.append(CircularCluster(
                     members=scc,
-                    break_edges=removed,
-                    resolution_strategy=strategy
-                )
-                clusters.append(cluster)
-                # Don't add to edges_to_remove - preserve all edges
+                    break_edges=[],  # Don't break any edges
+                    resolution_strategy="DOCUMENTATION_MESH_PRESERVED",
+                    scc_id=scc_id
+                ))
                 continue
             
-            # For code SCCs: Use greedy heuristic to break cycles
-            out_degrees = dict(subgraph.out_degree())
-            in_degrees = dict(subgraph.in_degree())
-            
-            # Score each edge by target's degree (higher = more impact when broken)
-            edge_scores = {}
-            for edge in subgraph.edges():
-                source, target = edge
-                # Score = combined degree of target (centrality measure)
-                edge_scores[edge] = out_degrees[target] + in_degrees[target]
-            
-            # Sort edges by score (highest first - break most central edges)
-            sorted_edges = sorted(edge_scores.items(), key=lambda x: x[1], reverse=True)
-            
-            # Remove edges until acyclic (greedy)
-            temp_graph = subgraph.copy()
-            removed = []
-            
-            for edge, score in sorted_edges:
-                temp_graph.remove_edge(*edge)
-                removed.append(edge)
-                
-                # Check if acyclic now
-                if nx.is_directed_acyclic_graph(temp_graph):
-                    break  # Success - no more cycles
+            # For code SCCs: break with a single feedback arc pass
+            removed = CircularDependencyResolver._feedback_arcs(graph.subgraph(scc))
             
             # Determine resolution strategy for code
             if len(scc) == 2:
@@ -713,26 +972,26 @@ class CircularDependencyResolver:
             else:
                 strategy = "LARGE_CODE_COMPONENT"  # Major architectural issue
             
-            cluster = CircularCluster(
+            clusters.append(CircularCluster(
                 members=scc,
                 break_edges=removed,
-                resolution_strategy=strategy
-            )
-            clusters.append(cluster)
+                resolution_strategy=strategy,
+                scc_id=scc_id
+            ))
             edges_to_remove.extend(removed)
         
         return clusters, edges_to_remove
     
     @staticmethod
-    def annotate_files_with_cycles(
+    def annotate_files_with_sccs(
         identities: Dict[str, FileIdentity],
-        cycles: List[List[str]]
+        analysis: SCCAnalysis
     ) -> None:
-        """Add cycle membership to file identities."""
-        for cycle in cycles:
-            for node in cycle:
+        """Record cyclic SCC membership on file identities (members via SCCAnalysis)."""
+        for scc_id in analysis.cyclic:
+            for node in analysis.members(scc_id):
                 if node in identities:
-                    identities[node].circular_with.append(cycle)
+                    identities[node].scc_id = scc_id
 
 # ═══════════════════════════════════════════════════════════════════════════
 #  INTELLIGENT FILE SYNTHESIZER
@@ -742,12 +1001,13 @@ class IntelligentSynthesizer:
     """ML-style synthesis of file purpose and role."""
     
     @staticmethod
-    def synthesize_identity(path: Path) -> FileIdentity:
+    def synthesize_identity(path: Path, content: Optional[str] = None) -> FileIdentity:
         """Generate rich file identity."""
-        try:
-            content = path.read_text(encoding='utf-8', errors='ignore')
-        except:
-            content = ""
+        if content is None:
+            try:
+                content = path.read_text(encoding='utf-8', errors='ignore')
+            except:
+                content = ""
         
         # Compute content hash
         content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
@@ -885,17 +1145,73 @@ class IntelligentSynthesizer:
 #  REPOSITORY SCANNER (Filesystem-aware)
 # ═══════════════════════════════════════════════════════════════════════════
 
+def set_module_index(index: ModuleIndex) -> None:
+    """
+    Install the module index used for import resolution in this process.
+    
+    Also the process pool initializer, so workers resolve against the
+    parent's walk instead of re-walking.
+    """
+    global MODULE_INDEX
+    MODULE_INDEX = index
+    TS_EXTRACTOR.use_index(index)
+
+def get_module_index() -> ModuleIndex:
+    """The installed module index, walking the repository if no scan has run yet."""
+    if MODULE_INDEX is None:
+        set_module_index(ModuleIndex.build(REPO_ROOT, EXCLUDE_DIRS, EXCLUDE_FILES))
+    return MODULE_INDEX
+
+def analyze_file(path: Path) -> Tuple[Optional[FileIdentity], List[str], Optional[str]]:
+    """
+    Read a file once and run identity synthesis + dependency extraction on it.
+    
+    Module-level so it can be shipped to a process pool worker.
+    
+    Returns:
+        (identity, resolved dependency rel_paths, error message or None)
+    """
+    try:
+        try:
+            content = path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            content = ""
+        # Analyze the file as it was before --inject (headers are derived data)
+        content = HeaderInjector.strip_header(content, path.suffix)
+        identity = IntelligentSynthesizer.synthesize_identity(path, content)
+        
+        dep_rels = set()
+        for dep_path in DependencyExtractor.extract_dependencies(path, content):
+            try:
+                dep_rels.add(str(dep_path.relative_to(REPO_ROOT)))
+            except ValueError:
+                pass  # Outside the repository
+        return identity, sorted(dep_rels), None
+    except Exception as e:
+        return None, [], str(e)
+
 class RepositoryScanner:
     """Scan repository with smart filtering and incremental change detection."""
     
     @staticmethod
-    def scan_repository(tracker: Optional[ProgressTracker] = None, use_cache: bool = True) -> Tuple[Dict[str, FileIdentity], Set[Path]]:
+    def scan_repository(
+        tracker: Optional[ProgressTracker] = None,
+        use_cache: bool = True,
+        state: Optional[ProcessingState] = None,
+        jobs: int = 1
+    ) -> Tuple[Dict[str, FileIdentity], Set[Path]]:
         """
         Scan all files in repository with incremental processing.
         
         Args:
             tracker: Progress tracker for real-time feedback
             use_cache: If True, skip unchanged files (faster re-runs)
+            state: Shared incremental state. When given, the caller saves it
+                   (after the graph builder has added cached edges); otherwise
+                   it is loaded and saved here.
+            jobs: Worker processes for new/changed files (1 = in-process).
+                  Results are merged in scan order and state is only
+                  updated here in the parent.
         
         Returns:
             - identities: Map of relative_path -> FileIdentity
@@ -903,94 +1219,128 @@ class RepositoryScanner:
         """
         identities = {}
         void_dirs = set()
+        pending = []  # (rel_path, path, mtime) needing full analysis
         
         # Load previous state for incremental processing
-        state_path = REPO_ROOT / ".dcrp_state.json"
-        state = ProcessingState.load(state_path) if use_cache else ProcessingState()
-        
-        # Single-pass filesystem traversal
-        all_paths = list(REPO_ROOT.rglob('*'))
+        owns_state = state is None
+        if owns_state:
+            state = ProcessingState.load(STATE_PATH) if use_cache else ProcessingState()
+        # Fresh edges are only valid for the scan that resolved them; a
+        # long-lived state (watch mode) would otherwise serve stale edges
+        state.fresh_edges = {}
+        
+        # Single-pass filesystem traversal: excluded dirs are pruned before
+        # descending and void dirs come from the same directory listings
+        void_list = []
+        entries = list(walk_files(REPO_ROOT, EXCLUDE_DIRS, EXCLUDE_FILES, void_dirs=void_list))
+        trackable = [entry for entry in entries if os.path.splitext(entry.name)[1] in SPECTRAL_MAP]
+        void_dirs.update(void_list)
+        
+        # Import resolution for this scan is answered from the same walk
+        set_module_index(ModuleIndex(REPO_ROOT, (entry.path for entry in entries)))
         
         if tracker:
-            # Count trackable files
-            trackable_count = sum(
-                1 for p in all_paths
-                if p.is_file()
-                and not any(excluded in p.parts for excluded in EXCLUDE_DIRS)
-                and p.name not in EXCLUDE_FILES
-                and (p.suffix in SPECTRAL_MAP or p.suffix == '')
-            )
-            tracker.total_files = trackable_count
-            print(f"  Discovered {trackable_count} trackable files")
+            tracker.total_files = len(trackable)
+            print(f"  Discovered {len(trackable)} trackable files")
             
             if use_cache and state.file_states:
                 print(f"  Loading state from previous run ({len(state.file_states)} files cached)")
         
-        for path in all_paths:
-            # Skip excluded directories
-            if any(excluded in path.parts for excluded in EXCLUDE_DIRS):
-                continue
-            
-            # Skip excluded files
-            if path.name in EXCLUDE_FILES:
-                continue
-            
-            if path.is_file():
-                # Process trackable files
-                if path.suffix in SPECTRAL_MAP or path.suffix == '':
-                    try:
-                        rel_path = str(path.relative_to(REPO_ROOT))
-                        
-                        # Check if file unchanged (incremental processing)
-                        if use_cache:
-                            mtime = path.stat().st_mtime
-                            # Quick mtime check first
-                            if rel_path in state.file_states and state.file_states[rel_path].get('mtime') == mtime:
-                                # File unchanged - reuse cached identity
-                                cached_data = state.file_states[rel_path]['identity'].copy()
-                                # Convert string path back to Path
-                                if isinstance(cached_data.get('path'), str):
-                                    cached_data['path'] = Path(cached_data['path'])
-                                # Convert lists back to sets
-                                if isinstance(cached_data.get('dependencies'), list):
-                                    cached_data['dependencies'] = set(cached_data['dependencies'])
-                                if isinstance(cached_data.get('dependents'), list):
-                                    cached_data['dependents'] = set(cached_data['dependents'])
-                                
-                                identity = FileIdentity(**cached_data)
-                                identities[rel_path] = identity
-                                if tracker:
-                                    tracker.update_file("cached")
-                                continue
+        for entry in trackable:
+            path = Path(entry.path)
+            try:
+                rel_path = str(path.relative_to(REPO_ROOT))
+                mtime = entry.stat().st_mtime  # Cached on the DirEntry
+                
+                # Check if file unchanged (incremental processing)
+                if use_cache:
+                    # Quick mtime check first
+                    if rel_path in state.file_states and state.file_states[rel_path].get('mtime') == mtime:
+                        # File unchanged - reuse cached identity
+                        cached_data = state.file_states[rel_path]['identity'].copy()
+                        # Convert string path back to Path
+                        if isinstance(cached_data.get('path'), str):
+                            cached_data['path'] = Path(cached_data['path'])
+                        # Convert lists back to sets
+                        if isinstance(cached_data.get('dependencies'), list):
+                            cached_data['dependencies'] = set(cached_data['dependencies'])
+                        if isinstance(cached_data.get('dependents'), list):
+                            cached_data['dependents'] = set(cached_data['dependents'])
+                        # Drop fields from older state formats (e.g. circular_with)
+                        cached_data = {k: v for k, v in cached_data.items() if k in FILE_IDENTITY_FIELDS}
                         
-                        # File new or changed - full processing
-                        identity = IntelligentSynthesizer.synthesize_identity(path)
+                        identity = FileIdentity(**cached_data)
                         identities[rel_path] = identity
-                        
-                        # Update state
-                        if use_cache:
-                            state.update_file(rel_path, path.stat().st_mtime, identity.content_hash, identity)
-                        
                         if tracker:
-                            tracker.update_file("processed")
-                            
-                    except Exception as e:
-                        if tracker:
-                            tracker.update_file("error")
-                        print(f"\n  ⚠️  Error processing {path.name}: {e}", flush=True)
-            
-            elif path.is_dir():
-                # Check for void directories
-                children = list(path.iterdir())
-                if not children or all(c.name.startswith('.') for c in children):
-                    void_dirs.add(path)
+                            tracker.update_file("cached")
+                        continue
+                
+                # File new or changed - analyze after the walk (keeps scan order)
+                identities[rel_path] = None
+                pending.append((rel_path, path, mtime))
+                    
+            except Exception as e:
+                if tracker:
+                    tracker.update_file("error")
+                print(f"\n  ⚠️  Error processing {path.name}: {e}", flush=True)
+        
+        RepositoryScanner._analyze_pending(pending, identities, state, use_cache, tracker, jobs)
         
         # Save updated state
-        if use_cache:
-            state.save(state_path)
+        if use_cache and owns_state:
+            state.save(STATE_PATH)
         
         return identities, void_dirs
 
+    @staticmethod
+    def _analyze_pending(
+        pending: List[Tuple[str, Path, float]],
+        identities: Dict[str, Optional[FileIdentity]],
+        state: ProcessingState,
+        use_cache: bool,
+        tracker: Optional[ProgressTracker],
+        jobs: int
+    ) -> None:
+        """Synthesize identities and extract edges for new/changed files, optionally in a process pool."""
+        paths = [path for _, path, _ in pending]
+        
+        if jobs > 1 and len(pending) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            chunksize = max(1, len(pending) // (jobs * 8))
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=set_module_index, initargs=(MODULE_INDEX,)
+            ) as pool:
+                RepositoryScanner._merge_results(
+                    pending, pool.map(analyze_file, paths, chunksize=chunksize),
+                    identities, state, use_cache, tracker
+                )
+        else:
+            RepositoryScanner._merge_results(
+                pending, map(analyze_file, paths), identities, state, use_cache, tracker
+            )
+    
+    @staticmethod
+    def _merge_results(pending, results, identities, state, use_cache, tracker) -> None:
+        """Fold analysis results into identities and state in scan order."""
+        for (rel_path, path, mtime), (identity, dep_rels, error) in zip(pending, results, strict=True):
+            if identity is None:
+                del identities[rel_path]
+                if tracker:
+                    tracker.update_file("error")
+                print(f"\n  ⚠️  Error processing {path.name}: {error}", flush=True)
+                continue
+            
+            identities[rel_path] = identity
+            
+            # Update state
+            if use_cache:
+                state.update_file(rel_path, mtime, identity.content_hash, identity)
+            state.update_edges(rel_path, dep_rels, fresh=True)
+            
+            if tracker:
+                tracker.update_file("processed")
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  DEPENDENCY GRAPH BUILDER
 # ═══════════════════════════════════════════════════════════════════════════
@@ -999,8 +1349,18 @@ class DependencyGraphBuilder:
     """Build and analyze dependency graph."""
     
     @staticmethod
-    def build_graph(identities: Dict[str, FileIdentity], tracker: Optional[ProgressTracker] = None) -> nx.DiGraph:
-        """Build directed graph from file identities."""
+    def build_graph(
+        identities: Dict[str, FileIdentity],
+        tracker: Optional[ProgressTracker] = None,
+        state: Optional[ProcessingState] = None
+    ) -> nx.DiGraph:
+        """
+        Build directed graph from file identities.
+        
+        With a ProcessingState, unchanged files reuse their resolved edges
+        from the last run (no read, no parse) as long as the directory
+        listing fingerprint still matches; fresh extractions are written back.
+        """
         G = nx.DiGraph()
         
         if tracker:
@@ -1016,32 +1376,55 @@ class DependencyGraphBuilder:
                 exports_count=len(identity.key_exports)
             )
         
-        # Extract dependencies for all files
-        path_to_relpath = {identity.path: rel_path for rel_path, identity in identities.items()}
+        # Cached edges are only trusted against the same directory listing
+        fingerprint = compute_listing_fingerprint(identities)
+        edges_reusable = state is not None and state.listing_fingerprint == fingerprint
         
         if tracker:
             print(f"  Extracting dependencies from {len(identities)} files...", flush=True)
             dep_count = 0
+        edge_cache_hits = 0
         
         for i, (rel_path, identity) in enumerate(identities.items()):
-            deps = DependencyExtractor.extract_dependencies(identity.path)
+            cached_edges = None
+            if state is not None and rel_path in state.fresh_edges:
+                cached_edges = state.fresh_edges[rel_path]  # Extracted during this scan
+            elif edges_reusable:
+                cached_edges = state.get_cached_edges(rel_path)
+                if cached_edges is not None:
+                    edge_cache_hits += 1
             
-            # Convert Path objects to relative paths
-            for dep_path in deps:
-                try:
-                    dep_rel = str(dep_path.relative_to(REPO_ROOT))
+            if cached_edges is not None:
+                dep_rels = [dep for dep in cached_edges if dep in identities]
+            else:
+                dep_rels = []
+                for dep_path in DependencyExtractor.extract_dependencies(identity.path):
+                    # Convert Path objects to relative paths
+                    try:
+                        dep_rel = str(dep_path.relative_to(REPO_ROOT))
+                    except ValueError:
+                        continue
                     if dep_rel in identities:
-                        G.add_edge(rel_path, dep_rel, method="AST")
-                        identity.dependencies.add(dep_rel)
-                        if tracker:
-                            dep_count += 1
-                except:
-                    pass
+                        dep_rels.append(dep_rel)
+                dep_rels.sort()
+                if state is not None:
+                    state.update_edges(rel_path, dep_rels)
+            
+            for dep_rel in dep_rels:
+                G.add_edge(rel_path, dep_rel, method="AST")
+                identity.dependencies.add(dep_rel)
+            if tracker:
+                dep_count += len(dep_rels)
             
             # Progress update every 100 files
             if tracker and (i + 1) % 100 == 0:
                 print(f"  Progress: {i+1}/{len(identities)} files, {dep_count} dependencies found", flush=True)
         
+        if state is not None:
+            state.listing_fingerprint = fingerprint
+        if tracker and edge_cache_hits:
+            print(f"  Reused cached edges for {edge_cache_hits}/{len(identities)} files", flush=True)
+        
         # Compute reverse dependencies (dependents)
         for rel_path, identity in identities.items():
             for dep in identity.dependencies:
@@ -1107,7 +1490,9 @@ class ReportGenerator:
         if cycles:
             lines.append("## III. Circular Dependencies")
             lines.append("")
-            lines.append(f"**{len(cycles)} circular dependency chains detected**")
+            lines.append(f"**{len(cycles)} circular dependency chains listed** "
+                         f"(bounded: at most {CircularDependencyResolver.MAX_CYCLES_PER_SCC} per component, "
+                         f"length ≤ {CircularDependencyResolver.MAX_CYCLE_LENGTH})")
             lines.append("")
             
             # Separate documentation meshes from code cycles
@@ -1217,6 +1602,459 @@ class ReportGenerator:
         
         return '\n'.join(lines)
 
+    @staticmethod
+    def build_graph_data(
+        identities: Dict[str, FileIdentity],
+        graph: nx.DiGraph,
+        cycles: List[List[str]],
+        clusters: List[CircularCluster],
+        void_dirs: Set[Path],
+        analysis: SCCAnalysis
+    ) -> dict:
+        """node_link export of the graph with validation metadata."""
+        condensation_nodes, condensation_edges = analysis.condensation_size(graph)
+        graph_data = nx.node_link_data(graph)
+        graph_data['metadata'] = {
+            'generated_at': datetime.now().isoformat(),
+            'total_files': len(identities),
+            'total_dependencies': graph.number_of_edges(),
+            'cycles_detected': len(cycles),
+            'cycles': cycles,  # Bounded sample - see cycle_enumeration
+            'cycle_enumeration': {
+                'max_cycles_per_scc': CircularDependencyResolver.MAX_CYCLES_PER_SCC,
+                'max_cycle_length': CircularDependencyResolver.MAX_CYCLE_LENGTH,
+            },
+            'cyclic_sccs': {
+                str(scc_id): sorted(analysis.members(scc_id)) for scc_id in analysis.cyclic
+            },
+            'condensation': {
+                'components': condensation_nodes,
+                'edges': condensation_edges,
+            },
+            'clusters': [
+                {
+                    'scc_id': c.scc_id,
+                    'members': list(c.members),
+                    'break_edges': c.break_edges,
+                    'strategy': c.resolution_strategy
+                }
+                for c in clusters
+            ],
+            'void_dirs': [str(p.relative_to(REPO_ROOT)) for p in void_dirs],
+            'validation': {
+                'graph_is_connected': nx.is_weakly_connected(graph) if graph else False,
+                'graph_is_dag': not analysis.cyclic,
+                'largest_component_size': len(max(nx.weakly_connected_components(graph), key=len, default=())),
+            }
+        }
+        return graph_data
+    
+    @staticmethod
+    def write_outputs(
+        report: str,
+        graph_data: dict,
+        graph: Optional[nx.DiGraph] = None,
+        analysis: Optional[SCCAnalysis] = None
+    ) -> None:
+        """Write the markdown report, graph JSON and (with graph + analysis) the compact .npz graph."""
+        REPORT_PATH.write_text(report, encoding='utf-8')
+        with open(GRAPH_PATH, 'w', encoding='utf-8') as f:
+            json.dump(graph_data, f, indent=2)
+        
+        if graph is not None and analysis is not None:
+            try:
+                from dcrp_compact_graph import write_compact_graph
+            except ImportError:  # numpy unavailable - JSON export only
+                return
+            write_compact_graph(graph, analysis.scc_of, analysis.cyclic, COMPACT_GRAPH_PATH)
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  CROSS-REFERENCE HEADER INJECTION
+# ═══════════════════════════════════════════════════════════════════════════
+
+class HeaderInjector:
+    """
+    Inject (or refresh) The Decorator's cross-reference header in code files.
+    
+    Cheap on re-runs:
+    - Only the head of each file is read to compare the existing header
+      region with the new header; identical headers are skipped, so unchanged
+      files keep their mtime and the incremental cache keeps hitting
+    - Otherwise the header region is spliced (after any shebang / coding
+      line) and the file replaced atomically via a temp file + os.replace
+    - The post-injection mtime and hash are written back to ProcessingState
+    
+    analyze_file() strips the header before synthesis, so identities (and
+    therefore headers) do not depend on a previously injected header.
+    """
+    
+    COMMENT_PREFIX = {'.py': '#', '.rs': '//', '.ts': '//', '.tsx': '//', '.js': '//', '.jsx': '//'}
+    MARKER = "THE DECORATOR'S BLESSING"
+    WIDTH = 74        # Text width inside the box
+    MAX_LISTED = 5    # Dependencies / dependents listed per direction
+    PROBE_BYTES = 16 * 1024
+    CODING_RE = re.compile(rb'^[ \t\f]*#.*?coding[:=]')
+    BOX_CHARS = ''.join(map(chr, range(0x2500, 0x2580))) + ' \t'  # Box drawing (incl. ║ borders)
+    UNDERLINE_CHARS = '=-~_*#'
+    
+    @staticmethod
+    def purpose_line(purpose: str) -> str:
+        """First line of a purpose text that is not box drawing or an underline, border glyphs trimmed."""
+        for line in purpose.splitlines():
+            text = line.strip(HeaderInjector.BOX_CHARS)
+            if text.strip(HeaderInjector.UNDERLINE_CHARS + ' '):
+                return ' '.join(text.split())
+        return ''
+    
+    @staticmethod
+    def generate_header(identity: FileIdentity, graph: nx.DiGraph, rel_path: str) -> str:
+        """Render the header for one file (deterministic for unchanged inputs)."""
+        prefix = HeaderInjector.COMMENT_PREFIX[identity.path.suffix]
+        width = HeaderInjector.WIDTH
+        bar = "═" * (width + 2)
+        
+        def row(text: str) -> str:
+            return f"{prefix} ║  {text[:width]:<{width}}║"
+        
+        # Graph edges point from a file to what it imports
+        dependencies = sorted(graph.successors(rel_path)) if rel_path in graph else []
+        dependents = sorted(graph.predecessors(rel_path)) if rel_path in graph else []
+        
+        lines = [
+            f"{prefix} ╔{bar}╗",
+            row(f"{HeaderInjector.MARKER}: {identity.path.name}"),
+            row(identity.theatrical_essence),
+            f"{prefix} ╠{bar}╣",
+            row(f"Spectral Frequency: {identity.spectral_freq}"),
+            row(f"Architectural Role: {identity.architectural_role}"),
+        ]
+        purpose = HeaderInjector.purpose_line(identity.primary_purpose)
+        if purpose:
+            lines.append(row(f"Purpose: {purpose}"))
+        if identity.key_exports:
+            lines.append(row(f"Exports: {', '.join(identity.key_exports[:HeaderInjector.MAX_LISTED])}"))
+        
+        lines.append(f"{prefix} ╠{bar}╣")
+        lines.append(row("Cross-References (Bidirectional):"))
+        if dependencies:
+            lines.append(row("Dependencies (I rely on):"))
+            lines.extend(row(f"  ├─► {dep}") for dep in dependencies[:HeaderInjector.MAX_LISTED])
+        if dependents:
+            lines.append(row("Dependents (Rely on me):"))
+            lines.extend(row(f"  └─◄ {dep}") for dep in dependents[:HeaderInjector.MAX_LISTED])
+        if not dependencies and not dependents:
+            lines.append(row("  (Standalone file - no detected dependencies)"))
+        lines.append(f"{prefix} ╚{bar}╝")
+        
+        return '\n'.join(lines) + '\n\n'
+    
+    @staticmethod
+    def locate_header(data: bytes, suffix: str) -> Tuple[int, int]:
+        """
+        Byte range of the header region: (start, end).
+        
+        start is after a shebang / Python coding line; end == start when the
+        file has no header yet. end is None if the header runs past data
+        (caller passed a truncated head).
+        """
+        start = 0
+        for _ in range(2):
+            line_end = data.find(b'\n', start)
+            line = data[start:line_end if line_end >= 0 else len(data)]
+            is_shebang = start == 0 and line.startswith(b'#!')
+            is_coding = suffix == '.py' and HeaderInjector.CODING_RE.match(line)
+            if line_end < 0 or not (is_shebang or is_coding):
+                break
+            start = line_end + 1
+        
+        prefix = HeaderInjector.COMMENT_PREFIX[suffix].encode()
+        if not data.startswith(prefix + ' ╔'.encode(), start):
+            return start, start
+        second_end = data.find(b'\n', data.find(b'\n', start) + 1)
+        if HeaderInjector.MARKER.encode() not in data[start:second_end]:
+            return start, start
+        
+        closing = data.find(b'\n' + prefix + ' ╚'.encode(), start)
+        if closing < 0:
+            return start, None
+        end = data.find(b'\n', closing + 1)
+        if end < 0:
+            return start, None
+        end += 1
+        if data.startswith(b'\n', end):
+            end += 1  # Blank separator line belongs to the header
+        return start, end
+    
+    @staticmethod
+    def strip_header(content: str, suffix: str) -> str:
+        """Content with an injected header removed (unchanged if there is none)."""
+        if suffix not in HeaderInjector.COMMENT_PREFIX or HeaderInjector.MARKER not in content[:4096]:
+            return content
+        data = content.encode('utf-8')
+        start, end = HeaderInjector.locate_header(data, suffix)
+        if not end or end == start:
+            return content
+        return (data[:start] + data[end:]).decode('utf-8')
+    
+    @staticmethod
+    def inject_file(identity: FileIdentity, graph: nx.DiGraph, rel_path: str, state: Optional[ProcessingState]) -> str:
+        """Inject into one file. Returns 'unchanged', 'injected' or 'updated'."""
+        path = identity.path
+        header = HeaderInjector.generate_header(identity, graph, rel_path).encode('utf-8')
+        
+        with open(path, 'rb') as f:
+            head = f.read(HeaderInjector.PROBE_BYTES)
+        start, end = HeaderInjector.locate_header(head, path.suffix)
+        if end is not None and head[start:end] == header:
+            return 'unchanged'
+        
+        # Splice and replace atomically (the temp file is in the same directory)
+        with open(path, 'rb') as f:
+            data = f.read()
+        start, end = HeaderInjector.locate_header(data, path.suffix)
+        if end is None:
+            end = start  # Unterminated header - leave it, prepend a fresh one
+        status = 'updated' if end > start else 'injected'
+        
+        tmp = path.with_name(f".{path.name}.dcrp-tmp")
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(data[:start] + header + data[end:])
+            os.chmod(tmp, os.stat(path).st_mode)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        
+        # Keep the next scan on the cache fast path: the hash is over
+        # header-stripped content (see analyze_file), the mtime is new
+        if state is not None and rel_path in state.file_states:
+            content = HeaderInjector.strip_header(path.read_text(encoding='utf-8', errors='ignore'), path.suffix)
+            content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+            entry = state.file_states[rel_path]
+            entry['mtime'] = path.stat().st_mtime
+            entry['hash'] = content_hash
+            entry['identity']['content_hash'] = content_hash
+        return status
+    
+    @staticmethod
+    def inject_all(
+        identities: Dict[str, FileIdentity],
+        graph: nx.DiGraph,
+        state: Optional[ProcessingState] = None
+    ) -> Dict[str, int]:
+        """Inject into every code file. Returns counts per outcome."""
+        counts = defaultdict(int)
+        for rel_path, identity in identities.items():
+            if identity.path.suffix not in HeaderInjector.COMMENT_PREFIX:
+                continue
+            try:
+                status = HeaderInjector.inject_file(identity, graph, rel_path, state)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"  ⚠️  Injection failed for {rel_path}: {e}")
+                status = 'error'
+            counts[status] += 1
+            if status in ('injected', 'updated') and counts['injected'] + counts['updated'] <= 10:
+                print(f"  ✓ {status.capitalize()}: {rel_path}")
+        return dict(counts)
+
+# ═══════════════════════════════════════════════════════════════════════════
+#  INCREMENTAL WATCH MODE
+# ═══════════════════════════════════════════════════════════════════════════
+
+class DependencyWatcher:
+    """
+    Keep the dependency graph in memory and maintain it incrementally (--watch).
+    
+    A modified file only has its outgoing edges, its targets' dependents and
+    the SCCs it touches recomputed. Files added or removed change import
+    resolution for other files, so they trigger a full (cache-backed)
+    rebuild. Reports are re-emitted once changes have settled for
+    `debounce` seconds.
+    """
+    
+    # Files DCRP writes itself - never treated as edits
+    OUTPUT_FILES = {
+        STATE_PATH, REPORT_PATH, GRAPH_PATH, COMPACT_GRAPH_PATH,
+        EvolutionTracker.HISTORY_FILE, EvolutionTracker.SUMMARY_FILE
+    }
+    
+    def __init__(
+        self,
+        identities: Dict[str, FileIdentity],
+        graph: nx.DiGraph,
+        state: ProcessingState,
+        analysis: SCCAnalysis,
+        void_dirs: Set[Path],
+        interval: float = 0.25,
+        debounce: float = 0.3,
+        save_state: bool = True
+    ):
+        self.identities = identities
+        self.graph = graph
+        self.state = state
+        self.analysis = analysis
+        self.void_dirs = void_dirs
+        self.interval = interval
+        self.debounce = debounce
+        self.save_state = save_state
+        self.ignored = {str(p.relative_to(REPO_ROOT)) for p in self.OUTPUT_FILES}
+        self.mtimes, _ = self._poll_listing()
+        self.cycles_by_scc: Dict[int, List[List[str]]] = {}
+        self.clusters_by_scc: Dict[int, CircularCluster] = {}
+        self._refresh_components(analysis.cyclic)
+    
+    def _poll_listing(self) -> Tuple[Dict[str, float], Set[Path]]:
+        """One pruned walk: tracked rel_path -> mtime, plus void dirs."""
+        void_list = []
+        mtimes = {}
+        for entry in walk_files(REPO_ROOT, EXCLUDE_DIRS, EXCLUDE_FILES, void_dirs=void_list):
+            if os.path.splitext(entry.name)[1] in SPECTRAL_MAP:
+                try:
+                    mtimes[os.path.relpath(entry.path, REPO_ROOT)] = entry.stat().st_mtime
+                except OSError:
+                    pass
+        return mtimes, set(void_list)
+    
+    def _refresh_components(self, scc_ids: List[int]) -> None:
+        """Recompute representative cycles and clusters for the given SCCs."""
+        resolver = CircularDependencyResolver
+        cyclic_ids = set(self.analysis.cyclic)
+        cyclic = [scc_id for scc_id in scc_ids if scc_id in cyclic_ids]
+        for scc_id in cyclic:
+            self.cycles_by_scc[scc_id] = resolver.detect_cycles(self.graph, self.analysis, scc_ids=[scc_id])
+        for cluster in resolver.break_cycles_intelligently(self.graph, self.analysis, scc_ids=cyclic)[0]:
+            self.clusters_by_scc[cluster.scc_id] = cluster
+        for scc_id in cyclic:
+            for node in self.analysis.members(scc_id):
+                if node in self.identities:
+                    self.identities[node].scc_id = scc_id
+    
+    def apply_change(self, rel_path: str, mtime: float) -> None:
+        """Re-analyze one modified file and patch the graph in place."""
+        identity, dep_rels, error = analyze_file(REPO_ROOT / rel_path)
+        if identity is None:
+            print(f"  ⚠️  Error processing {rel_path}: {error}", flush=True)
+            return
+        
+        new_deps = {dep for dep in dep_rels if dep in self.identities and dep != rel_path}
+        old_deps = set(self.graph.successors(rel_path)) - {rel_path}
+        if rel_path in dep_rels:
+            new_deps.add(rel_path)  # Self-import
+        if self.graph.has_edge(rel_path, rel_path):
+            old_deps.add(rel_path)
+        
+        for dep in old_deps - new_deps:
+            self.graph.remove_edge(rel_path, dep)
+            self.identities[dep].dependents.discard(rel_path)
+        for dep in new_deps - old_deps:
+            self.graph.add_edge(rel_path, dep, method="AST")
+            self.identities[dep].dependents.add(rel_path)
+        
+        previous = self.identities[rel_path]
+        identity.dependencies = set(new_deps)
+        identity.dependents = previous.dependents
+        identity.scc_id = previous.scc_id
+        self.identities[rel_path] = identity
+        self.graph.nodes[rel_path].update(
+            spectral_freq=identity.spectral_freq,
+            role=identity.architectural_role,
+            essence=identity.theatrical_essence,
+            exports_count=len(identity.key_exports)
+        )
+        
+        # Persist like a scan would: identity without graph-derived sets
+        self.state.update_file(
+            rel_path, mtime, identity.content_hash,
+            replace(identity, dependencies=set(), dependents=set(), scc_id=None)
+        )
+        self.state.update_edges(rel_path, sorted(new_deps))
+        
+        if new_deps != old_deps:
+            retired, created = CircularDependencyResolver.update_components(
+                self.graph, self.analysis, rel_path, new_deps - old_deps
+            )
+            for scc_id in retired:
+                self.cycles_by_scc.pop(scc_id, None)
+                self.clusters_by_scc.pop(scc_id, None)
+            for scc_id in created:
+                for node in self.analysis.members(scc_id):
+                    self.identities[node].scc_id = None
+            self._refresh_components(created)
+    
+    def rebuild(self) -> None:
+        """Full rebuild after files were added or removed (identity cache still applies)."""
+        self.identities, self.void_dirs = RepositoryScanner.scan_repository(state=self.state)
+        self.graph = DependencyGraphBuilder.build_graph(self.identities, state=self.state)
+        self.analysis = CircularDependencyResolver.analyze_components(self.graph)
+        self.cycles_by_scc.clear()
+        self.clusters_by_scc.clear()
+        self._refresh_components(self.analysis.cyclic)
+    
+    def emit(self) -> None:
+        """Write reports and state for the current in-memory graph."""
+        cycles = [cycle for scc_id in sorted(self.cycles_by_scc) for cycle in self.cycles_by_scc[scc_id]]
+        clusters = [self.clusters_by_scc[scc_id] for scc_id in sorted(self.clusters_by_scc)]
+        report = ReportGenerator.generate_summary(
+            self.identities, self.graph, cycles, clusters, self.void_dirs
+        )
+        graph_data = ReportGenerator.build_graph_data(
+            self.identities, self.graph, cycles, clusters, self.void_dirs, self.analysis
+        )
+        ReportGenerator.write_outputs(report, graph_data, self.graph, self.analysis)
+        if self.save_state:
+            self.state.save(STATE_PATH)
+        # Absorb our own writes only - a source edit made while emitting must
+        # still show up as changed on the next poll
+        for path in self.OUTPUT_FILES:
+            try:
+                self.mtimes[str(path.relative_to(REPO_ROOT))] = path.stat().st_mtime
+            except OSError:
+                pass
+    
+    def run(self) -> None:
+        """Poll for changes until interrupted."""
+        print(f"👁️  Watching {len(self.identities)} files "
+              f"(poll {self.interval:.2f}s, debounce {self.debounce:.2f}s) - Ctrl+C to stop")
+        dirty_since = None
+        try:
+            while True:
+                time.sleep(self.interval)
+                mtimes, void_dirs = self._poll_listing()
+                tracked = set(mtimes) - self.ignored
+                
+                if tracked != set(self.mtimes) - self.ignored:
+                    t0 = time.perf_counter()
+                    self.rebuild()
+                    print(f"  🔄 File set changed - graph rebuilt in {time.perf_counter() - t0:.2f}s", flush=True)
+                    dirty_since = time.time()
+                else:
+                    changed = sorted(
+                        rel for rel in tracked
+                        if mtimes[rel] != self.mtimes.get(rel)
+                    )
+                    for rel_path in changed:
+                        t0 = time.perf_counter()
+                        self.apply_change(rel_path, mtimes[rel_path])
+                        print(f"  ✏️  {rel_path}: {self.graph.out_degree(rel_path)} deps "
+                              f"({(time.perf_counter() - t0) * 1000:.0f}ms)", flush=True)
+                    if changed:
+                        dirty_since = time.time()
+                
+                self.mtimes = mtimes
+                self.void_dirs = void_dirs
+                
+                if dirty_since is not None and time.time() - dirty_since >= self.debounce:
+                    t0 = time.perf_counter()
+                    self.emit()
+                    dirty_since = None
+                    print(f"  📝 Reports updated ({len(self.analysis.cyclic)} cyclic components, "
+                          f"{(time.perf_counter() - t0) * 1000:.0f}ms)", flush=True)
+        except KeyboardInterrupt:
+            if dirty_since is not None:
+                self.emit()
+            print("\n👋 Watch stopped")
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  MAIN ORCHESTRATOR
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1226,7 +2064,16 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Analysis only, no file modification')
     parser.add_argument('--inject', action='store_true', help='Inject cross-reference headers into files')
     parser.add_argument('--force-full-scan', action='store_true', help='Bypass cache, scan all files')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='Worker processes for identity synthesis + dependency extraction (0 = all cores)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running: maintain the graph incrementally and re-emit reports on change')
+    parser.add_argument('--watch-interval', type=float, default=0.25, metavar='SECONDS',
+                        help='Filesystem poll interval for --watch')
+    parser.add_argument('--debounce', type=float, default=0.3, metavar='SECONDS',
+                        help='Quiet period before --watch re-emits reports')
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     
     # Set UTF-8 encoding for Windows console
     if sys.platform == 'win32':
@@ -1244,7 +2091,8 @@ def main():
     # STEP 1: Scan repository
     tracker.set_phase("STEP 1: Repository Scanning")
     use_cache = not args.force_full_scan  # Use cache unless forced
-    identities, void_dirs = RepositoryScanner.scan_repository(tracker, use_cache=use_cache)
+    state = ProcessingState.load(STATE_PATH) if use_cache else ProcessingState()
+    identities, void_dirs = RepositoryScanner.scan_repository(tracker, use_cache=use_cache, state=state, jobs=jobs)
     tracker.total_files = len(identities)
     print(f"\n  ✓ Discovered {len(identities)} files, {len(void_dirs)} void directories")
     if tracker.cached_files > 0:
@@ -1254,20 +2102,24 @@ def main():
     
     # STEP 2: Build dependency graph
     tracker.set_phase("STEP 2: Dependency Graph Construction")
-    graph = DependencyGraphBuilder.build_graph(identities, tracker)
+    graph = DependencyGraphBuilder.build_graph(identities, tracker, state=state)
     tracker.add_dependencies(graph.number_of_edges())
+    if use_cache:
+        state.save(STATE_PATH)
     print(f"\n  ✓ Graph built: {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
     print()
     
     # STEP 3: Detect circular dependencies
     tracker.set_phase("STEP 3: Circular Dependency Detection")
     resolver = CircularDependencyResolver()
-    cycles = resolver.detect_cycles(graph)
+    scc_analysis = resolver.analyze_components(graph)
+    cycles = resolver.detect_cycles(graph, scc_analysis)
     
-    if cycles:
+    if scc_analysis.cyclic:
         tracker.add_circular_deps(len(cycles))
-        print(f"\n  ⚠️  FOUND {len(cycles)} circular dependency chains")
-        clusters, edges_to_break = resolver.break_cycles_intelligently(graph, cycles)
+        print(f"\n  ⚠️  FOUND {len(scc_analysis.cyclic)} cyclic components "
+              f"({len(cycles)} representative cycles, max {resolver.MAX_CYCLES_PER_SCC} per component)")
+        clusters, edges_to_break = resolver.break_cycles_intelligently(graph, scc_analysis)
         print(f"  ✓ Identified {len(clusters)} circular clusters")
         print(f"  ✓ Proposed {len(edges_to_break)} edges to break")
         
@@ -1277,7 +2129,7 @@ def main():
             print(f"    Cluster {i+1}/{len(clusters)}: {len(cluster.members)} files, "
                   f"breaking {len(cluster.break_edges)} edges via {cluster.resolution_strategy}")
         
-        resolver.annotate_files_with_cycles(identities, cycles)
+        resolver.annotate_files_with_sccs(identities, scc_analysis)
     else:
         print(f"\n  ✅ No circular dependencies detected - graph is acyclic")
         clusters = []
@@ -1295,44 +2147,19 @@ def main():
     report = ReportGenerator.generate_summary(identities, graph, cycles, clusters, void_dirs)
     
     # Append evolution report
-    history = EvolutionTracker.load_history()
+    history = EvolutionTracker.load_summary()
     if len(history) >= 2:
-        evolution_report = EvolutionTracker.generate_evolution_report(history)
+        total_snapshots = EvolutionTracker.snapshot_count()
+        evolution_report = EvolutionTracker.generate_evolution_report(history, total_snapshots)
         report = report + "\n" + evolution_report
-        print(f"  ✓ Evolution tracking: {len(history)} historical snapshots")
-    
-    report_path = REPO_ROOT / "DCRP_PRODUCTION_ANALYSIS.md"
-    report_path.write_text(report, encoding='utf-8')
-    print(f"  ✓ Markdown Report: {report_path}")
-    
-    # Export graph with validation metadata
-    graph_data = nx.node_link_data(graph)
-    graph_data['metadata'] = {
-        'generated_at': datetime.now().isoformat(),
-        'total_files': len(identities),
-        'total_dependencies': graph.number_of_edges(),
-        'cycles_detected': len(cycles),
-        'cycles': cycles,
-        'clusters': [
-            {
-                'members': list(c.members),
-                'break_edges': c.break_edges,
-                'strategy': c.resolution_strategy
-            }
-            for c in clusters
-        ],
-        'void_dirs': [str(p.relative_to(REPO_ROOT)) for p in void_dirs],
-        'validation': {
-            'graph_is_connected': nx.is_weakly_connected(graph),
-            'graph_is_dag': nx.is_directed_acyclic_graph(graph) if not cycles else False,
-            'largest_component_size': len(max(nx.weakly_connected_components(graph), key=len)),
-        }
-    }
+        print(f"  ✓ Evolution tracking: {total_snapshots} historical snapshots")
     
-    graph_path = REPO_ROOT / "dependency_graph_production.json"
-    with open(graph_path, 'w', encoding='utf-8') as f:
-        json.dump(graph_data, f, indent=2)
-    print(f"  ✓ Graph JSON: {graph_path}")
+    graph_data = ReportGenerator.build_graph_data(identities, graph, cycles, clusters, void_dirs, scc_analysis)
+    ReportGenerator.write_outputs(report, graph_data, graph, scc_analysis)
+    print(f"  ✓ Markdown Report: {REPORT_PATH}")
+    print(f"  ✓ Graph JSON: {GRAPH_PATH}")
+    if COMPACT_GRAPH_PATH.exists():
+        print(f"  ✓ Compact Graph: {COMPACT_GRAPH_PATH}")
     
     # Print validation results
     print(f"\n  🔍 Graph Validation:")
@@ -1344,8 +2171,11 @@ def main():
     # STEP 5: File injection (if requested)
     if args.inject and not args.dry_run:
         tracker.set_phase("STEP 5: Cross-Reference Header Injection")
-        print("  ⚠️  FILE INJECTION NOT YET IMPLEMENTED")
-        print("  ⚠️  (Requires header generation logic)")
+        counts = HeaderInjector.inject_all(identities, graph, state if use_cache else None)
+        if use_cache:
+            state.save(STATE_PATH)
+        print(f"\n  ✓ Injected: {counts.get('injected', 0)}, updated: {counts.get('updated', 0)}, "
+              f"unchanged (skipped): {counts.get('unchanged', 0)}, errors: {counts.get('error', 0)}")
         print()
     
     # Print final summary
@@ -1355,12 +2185,18 @@ def main():
     print(" PRODUCTION DCRP COMPLETE")
     print("=" * 80)
     print()
-    print(f"Execution Mode: {'DRY RUN (no modifications)' if args.dry_run else 'ANALYSIS ONLY'}")
+    print(f"Execution Mode: {'DRY RUN (no modifications)' if args.dry_run else 'INJECTION' if args.inject else 'ANALYSIS ONLY'}")
     print(f"Next Steps:")
-    print(f"  1. Review {report_path}")
+    print(f"  1. Review {REPORT_PATH}")
     print(f"  2. Validate circular dependency resolutions")
-    print(f"  3. Run with --inject to apply cross-reference headers (when implemented)")
+    print(f"  3. Run with --inject to apply cross-reference headers")
     print()
+    
+    if args.watch:
+        DependencyWatcher(
+            identities, graph, state, scc_analysis, void_dirs,
+            interval=args.watch_interval, debounce=args.debounce, save_state=use_cache
+        ).run()
 
 if __name__ == "__main__":
     main()
@@ -17,6 +17,8 @@ Author: ASC Engine (T³-MΨ assisted)
 Date: December 8, 2025
 """
 
+from .engine import AbbreviationEngine
+from .incremental import SectionCache
 from .models import (
     AbbreviationEntry,
     AuditReport,
@@ -27,6 +29,8 @@ from .models import (
 from .parser import SSOTParser
 from .registry import AbbreviationRegistry
 from .reporter import AuditReporter
+from .term_index import TermIndex
+from .usage import UsageIndex
 from .validator import ConsistencyValidator
 
 __version__ = "0.1.0"
@@ -38,6 +42,10 @@ __all__ = [
     "AuditReport",
     "SSOTParser",
     "AbbreviationRegistry",
+    "TermIndex",
     "ConsistencyValidator",
+    "UsageIndex",
+    "SectionCache",
     "AuditReporter",
+    "AbbreviationEngine",
 ]
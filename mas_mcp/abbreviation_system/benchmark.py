@@ -0,0 +1,221 @@
+"""
+Abbreviation Engine Benchmark
+=============================
+
+Times the engine's stages on synthetic SSOTs of 1x, 10x and 100x the size
+of the real one, so a regression in parsing, validation, reporting or
+lookup shows up as a number instead of as a slow CLI.
+
+Synthetic SSOTs are generated deterministically from a seed: numbered
+sections with P1 definitions of fresh abbreviations, prose that uses
+earlier ones (bare, backtick and parenthesized), tier notation, slash
+composites, notation guides and thematic breaks - the shapes the parser
+and validator spend their time on.
+
+Stages (seconds, best of --repeat runs):
+    parse     SSOTParser.parse_text over the whole document
+    validate  ConsistencyValidator.validate_all (full usage scan + checks)
+    report    AbbreviationEngine.report() with an empty section cache
+    reedit    AbbreviationEngine.report() again after a one-section edit
+    lookup    AbbreviationEngine.lookup() for LOOKUP_QUERIES exact and term queries
+
+Usage:
+    uv run python -m abbreviation_system.benchmark
+    uv run python -m abbreviation_system.benchmark --scales 1 10 --save bench.json
+    uv run python -m abbreviation_system.benchmark --baseline bench.json --tolerance 1.5
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .engine import DEFAULT_SSOT_PATH, AbbreviationEngine
+from .parser import SSOTParser
+from .registry import AbbreviationRegistry
+from .validator import ConsistencyValidator
+
+BENCH_FORMAT = "asc-abbreviation-bench"
+STAGES = ("parse", "validate", "report", "reedit", "lookup")
+LOOKUP_QUERIES = 200
+DEFAULT_BASE_CHARS = 320_000  # Size of the SSOT when it is not on disk
+
+WORDS = (
+    "Apex Synthesis Core Primal Substrate Triumvirate Matriarch Resonance Protocol "
+    "Lattice Sovereign Abyssal Crucible Dialectic Forge Vortex Observatory Threshold "
+    "Labyrinth Codex Axiom Tensor Lineage Covenant Eschaton Gnosis Ordeal Salt Sigil "
+    "Chthonic Archive Decorator Faction Ascendant Genesis Engine Mandate Cascade"
+).split()
+ROMAN = ("I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X", "XI", "XII", "XIII", "XIV", "XV")
+
+
+def _code(number: int) -> str:
+    """Distinct uppercase abbreviation for a definition number (SA, SB, ..., SAA, ...)."""
+    letters = ""
+    number += 1
+    while number:
+        number, digit = divmod(number - 1, 26)
+        letters = chr(ord("A") + digit) + letters
+    return f"S{letters}"
+
+
+def synthetic_ssot(target_chars: int, seed: int = 0) -> str:
+    """
+    SSOT-shaped markdown of at least target_chars characters.
+
+    Every section defines two new abbreviations and uses ones defined
+    before it; the same seed always gives the same text.
+    """
+    rng = random.Random(seed)
+    defined: list[str] = []
+    chunks = ["# Synthetic Codex\n\nPreamble mentions `ASC`, Tier 1 and CRC-AS before any section.\n\n"]
+    size = len(chunks[0])
+    section = 0
+
+    while size < target_chars:
+        section += 1
+        lines = [f"## **{ROMAN[section % len(ROMAN)]}.{section}. Synthetic Section {section}**", ""]
+        if section % 4 == 1:
+            lines += [f"NOTATION GUIDE for section {section}.", ""]
+        for _ in range(2):
+            abbrev = _code(len(defined))
+            term = " ".join(rng.sample(WORDS, 3))
+            lines.append(f"**(`{term}`):→(`{abbrev}`)** anchors {rng.choice(WORDS).lower()} doctrine.")
+            defined.append(abbrev)
+        lines.append("")
+        for _ in range(rng.randint(12, 20)):
+            a, b, c = (rng.choice(defined) for _ in range(3))
+            tier = rng.choice(("Tier 1", "T-2", "Tier-3", "Tier 0.5"))
+            words = " ".join(rng.choice(WORDS).lower() for _ in range(rng.randint(6, 14)))
+            lines.append(f"The {words} binds (`{a}`) with `{b}` under {tier}; {c} resonates.")
+        lines.append(f"Use (`{rng.choice(defined)}`/`{rng.choice(defined)}`) for alternatives.")
+        lines += ["", "---", ""]
+        chunk = "\n".join(lines) + "\n"
+        chunks.append(chunk)
+        size += len(chunk)
+
+    return "".join(chunks)
+
+
+def _best(repeat: int, run) -> float:
+    """Fastest of repeat timed calls of run()."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def bench_scale(content: str, workdir: Path, repeat: int = 3) -> dict[str, float]:
+    """Time every stage on one synthetic SSOT (files go under workdir)."""
+    results = {}
+    results["parse"] = _best(repeat, lambda: SSOTParser().parse_text(content))
+
+    registry = AbbreviationRegistry()
+    registry.add_entries(SSOTParser().parse_text(content))
+    results["validate"] = _best(repeat, lambda: ConsistencyValidator(registry).validate_all(content))
+
+    ssot_path = workdir / "ssot.md"
+    edited = content.replace("Synthetic Section 1**", "Synthetic Section 1 (edited)**", 1)
+    report_times, reedit_times = [], []
+    for run in range(repeat):
+        ssot_path.write_text(content, encoding="utf-8")
+        engine = AbbreviationEngine(
+            ssot_path, sections_path=workdir / f"sections-{run}.json", snapshot_path=workdir / f"registry-{run}.json"
+        )
+        report_times.append(_best(1, engine.report))
+        ssot_path.write_text(edited, encoding="utf-8")
+        reedit_times.append(_best(1, engine.report))
+    results["report"] = min(report_times)
+    results["reedit"] = min(reedit_times)
+
+    rng = random.Random(1)
+    abbrevs = engine.registry.all_abbreviations()
+    queries = [rng.choice(abbrevs) for _ in range(LOOKUP_QUERIES // 2)]
+    queries += [" ".join(rng.sample(WORDS, 2)) for _ in range(LOOKUP_QUERIES - len(queries))]
+    lookup_engine = AbbreviationEngine(ssot_path, sections_path=None, snapshot_path=workdir / "registry-lookup.json")
+    _ = lookup_engine.registry  # Snapshot written outside the timed runs
+    results["lookup"] = _best(repeat, lambda: [lookup_engine.lookup(query) for query in queries])
+    return results
+
+
+def run_benchmark(
+    scales: list[int],
+    base_chars: int,
+    repeat: int = 3,
+    seed: int = 0,
+) -> dict[str, dict[str, float]]:
+    """scale -> stage -> seconds, for synthetic SSOTs of scale * base_chars."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="abbrev-bench-") as tmp:
+        for scale in scales:
+            workdir = Path(tmp) / f"x{scale}"
+            workdir.mkdir()
+            results[str(scale)] = bench_scale(synthetic_ssot(scale * base_chars, seed), workdir, repeat)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Stages slower than tolerance x their baseline time, as messages."""
+    regressions = []
+    for scale, stages in results.items():
+        for stage, seconds in stages.items():
+            before = baseline.get(scale, {}).get(stage)
+            if before and seconds > before * tolerance:
+                regressions.append(f"{scale}x {stage}: {seconds:.3f}s vs {before:.3f}s baseline ({seconds / before:.2f}x)")
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmark, print a table and optionally save or check against a baseline."""
+    parser = argparse.ArgumentParser(
+        prog="abbreviation_system.benchmark",
+        description="Time parse/validate/report/lookup on synthetic SSOTs",
+    )
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="Size multiples of the SSOT")
+    parser.add_argument("--base-chars", type=int, help="Size of 1x (default: the current SSOT's size)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage (best is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic SSOT seed")
+    parser.add_argument("--save", type=str, help="Write results as a baseline JSON file")
+    parser.add_argument("--baseline", type=str, help="Baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed slowdown vs baseline")
+    args = parser.parse_args()
+
+    base_chars = args.base_chars
+    if base_chars is None:
+        base_chars = len(DEFAULT_SSOT_PATH.read_text(encoding="utf-8")) if DEFAULT_SSOT_PATH.exists() else DEFAULT_BASE_CHARS
+
+    results = run_benchmark(args.scales, base_chars, repeat=args.repeat, seed=args.seed)
+
+    print(f"⏱️  Abbreviation engine benchmark (1x = {base_chars:,} chars, best of {args.repeat})")
+    print(f"   {'scale':>6} " + " ".join(f"{stage:>9}" for stage in STAGES))
+    for scale, stages in results.items():
+        print(f"   {scale + 'x':>6} " + " ".join(f"{stages[stage]:>8.3f}s" for stage in STAGES))
+
+    if args.save:
+        Path(args.save).write_text(json.dumps({
+            "format": BENCH_FORMAT,
+            "base_chars": base_chars,
+            "results": results,
+        }, indent=2), encoding="utf-8")
+        print(f"✅ Baseline saved to: {args.save}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline.get("results", {}), args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regressions (>{args.tolerance}x baseline):")
+            for message in regressions:
+                print(f"   - {message}")
+            return 1
+        print(f"✅ No stage slower than {args.tolerance}x baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
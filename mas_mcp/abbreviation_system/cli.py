@@ -11,15 +11,8 @@ import argparse
 import sys
 from pathlib import Path
 
-from .generator import AbbreviationGenerator
-from .models import NotationPattern
+from .engine import DEFAULT_SSOT_PATH, AbbreviationEngine
 from .parser import SSOTParser
-from .registry import AbbreviationRegistry
-from .reporter import AuditReporter
-from .validator import ConsistencyValidator
-
-# Default SSOT path relative to mas_mcp
-DEFAULT_SSOT_PATH = Path(__file__).parent.parent.parent / ".github" / "copilot-instructions.md"
 
 
 def cmd_parse(args: argparse.Namespace) -> int:
@@ -31,8 +24,8 @@ def cmd_parse(args: argparse.Namespace) -> int:
         return 1
 
     print(f"📖 Parsing SSOT: {ssot_path}")
-    parser = SSOTParser(str(ssot_path))
-    abbreviations = parser.parse()
+    parser = SSOTParser()
+    abbreviations = parser.parse_file(ssot_path)
 
     print(f"✅ Found {len(abbreviations)} abbreviations")
     print()
@@ -40,7 +33,7 @@ def cmd_parse(args: argparse.Namespace) -> int:
     # Pattern breakdown
     patterns: dict[str, int] = {}
     for abbrev in abbreviations:
-        pattern_name = abbrev.pattern.value
+        pattern_name = abbrev.pattern_type.name
         patterns[pattern_name] = patterns.get(pattern_name, 0) + 1
 
     print("📊 Pattern Distribution:")
@@ -60,18 +53,13 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
     print(f"🔍 Validating SSOT: {ssot_path}")
 
-    parser = SSOTParser(str(ssot_path))
-    abbreviations = parser.parse()
-    registry = AbbreviationRegistry(abbreviations)
-    validator = ConsistencyValidator(registry)
-
-    issues = validator.validate()
+    issues = AbbreviationEngine(ssot_path).validate()
 
     if not issues:
         print("✅ No issues found! SSOT abbreviation system is healthy.")
         return 0
 
-    errors = [i for i in issues if i.severity.value == "error"]
+    errors = [i for i in issues if i.severity.value == "critical"]
     warnings = [i for i in issues if i.severity.value == "warning"]
     info = [i for i in issues if i.severity.value == "info"]
 
@@ -84,7 +72,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
     if errors and args.verbose:
         print("🔴 Errors:")
         for issue in errors[:10]:
-            print(f"   - {issue.issue_type.value}: {issue.description}")
+            print(f"   - {issue.category.value}: {issue.description}")
         if len(errors) > 10:
             print(f"   ... and {len(errors) - 10} more")
 
@@ -101,7 +89,7 @@ def cmd_report(args: argparse.Namespace) -> int:
 
     print(f"📝 Generating report for: {ssot_path}")
 
-    reporter = AuditReporter.from_ssot(str(ssot_path))
+    reporter = AbbreviationEngine(ssot_path).reporter
     report = reporter.generate_full_report()
 
     if args.output:
@@ -127,8 +115,7 @@ def cmd_glossary(args: argparse.Namespace) -> int:
 
     print(f"📚 Generating glossary for: {ssot_path}")
 
-    reporter = AuditReporter.from_ssot(str(ssot_path))
-    glossary = reporter.generate_glossary()
+    glossary = AbbreviationEngine(ssot_path).reporter.generate_glossary()
 
     if args.output:
         output_path = Path(args.output)
@@ -149,28 +136,18 @@ def cmd_lookup(args: argparse.Namespace) -> int:
         print(f"❌ SSOT file not found: {ssot_path}", file=sys.stderr)
         return 1
 
-    registry = AbbreviationRegistry.from_ssot(str(ssot_path))
     query = args.query
 
-    # Try exact match first
-    expanded = registry.expand(query)
-    if expanded:
-        print(f"✅ `{query}` = {expanded}")
+    # Exact match first, then reverse lookup (substring, then fuzzy - ranked)
+    results = AbbreviationEngine(ssot_path).lookup(query, limit=args.limit)
+    if len(results) == 1 and results[0].abbreviation == query:
+        print(f"✅ `{query}` = {results[0].full_term}")
         return 0
 
-    # Try reverse lookup
-    abbreviated = registry.abbreviate(query)
-    if abbreviated:
-        print(f"✅ {query} → `{abbreviated}`")
-        return 0
-
-    # Try fuzzy search
-    results = registry.search(query)
     if results:
-        print(f"🔍 Search results for '{query}':")
-        for abbrev in results[:10]:
-            term = registry.expand(abbrev.abbrev)
-            print(f"   `{abbrev.abbrev}` = {term}")
+        print(f"🔍 Abbreviations for '{query}':")
+        for match in results:
+            print(f"   `{match.abbreviation}` = {match.full_term}")
         return 0
 
     print(f"❌ No matches found for: {query}")
@@ -179,6 +156,10 @@ def cmd_lookup(args: argparse.Namespace) -> int:
 
 def cmd_suggest(args: argparse.Namespace) -> int:
     """Suggest abbreviations for a term."""
+    # Imported here so the audit commands do not depend on the generator
+    from .generator import AbbreviationGenerator
+    from .models import NotationPatternType
+
     term = args.term
     tier = args.tier or "default"
 
@@ -194,7 +175,7 @@ def cmd_suggest(args: argparse.Namespace) -> int:
         notation = generator.generate_notation(
             suggestion,
             term,
-            NotationPattern.PARENTHETICAL
+            NotationPatternType.PARENTHETICAL_INLINE
         )
         print(f"   {i}. `{suggestion}` → {notation}")
 
@@ -209,12 +190,12 @@ def cmd_export(args: argparse.Namespace) -> int:
         print(f"❌ SSOT file not found: {ssot_path}", file=sys.stderr)
         return 1
 
-    registry = AbbreviationRegistry.from_ssot(str(ssot_path))
+    registry = AbbreviationEngine(ssot_path).registry
 
     output_path = Path(args.output)
-    registry.export_json(str(output_path))
+    registry.export_json(output_path)
 
-    print(f"✅ Exported {len(registry._abbreviations)} abbreviations to: {output_path}")
+    print(f"✅ Exported {len(registry.all_abbreviations())} abbreviations to: {output_path}")
     return 0
 
 
@@ -294,6 +275,7 @@ Examples:
     # lookup command
     lookup_parser = subparsers.add_parser("lookup", help="Look up abbreviation or term")
     lookup_parser.add_argument("query", type=str, help="Abbreviation or term to look up")
+    lookup_parser.add_argument("--limit", type=int, default=10, help="Maximum reverse-lookup results")
 
     # suggest command
     suggest_parser = subparsers.add_parser("suggest", help="Suggest abbreviations for a term")
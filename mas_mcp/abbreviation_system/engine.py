@@ -0,0 +1,113 @@
+"""
+Abbreviation Engine — One Entry Point for Every SSOT Abbreviation Tool
+=====================================================================
+
+Bundles the package's fast paths behind one object per SSOT file, so the
+package CLI, the scripts/ CLIs and the ASC toolchain's abbr-* commands all
+read the SSOT the same way:
+
+- single-pass parsing (SSOTParser's combined pattern)
+- the registry snapshot (mas_cache/abbreviation_registry.json) for lookups
+- the section cache (mas_cache/abbreviation_sections.json) for the usage
+  index, validation and reports, re-scanning only edited sections
+
+Accessors rebuild only when the SSOT file changed, so a long-lived engine
+(e.g. in the MCP server) stays current without re-reading work it has done.
+
+Usage:
+    engine = AbbreviationEngine(ssot_path)
+    engine.lookup("TRM-VRT")        # [AbbreviationEntry]: exact match, else ranked reverse lookup
+    engine.usage.parenthesized      # (`X`) span text -> offsets
+    engine.validate()               # list[ConsistencyIssue]
+    engine.report()                 # AuditReport
+"""
+
+from pathlib import Path
+
+from .incremental import SECTIONS_PATH
+from .models import AbbreviationEntry, AuditReport, ConsistencyIssue
+from .registry import SNAPSHOT_PATH, AbbreviationRegistry
+from .reporter import AuditReporter
+from .usage import UsageIndex
+
+DEFAULT_SSOT_PATH = Path(__file__).resolve().parent.parent.parent / ".github" / "copilot-instructions.md"
+
+
+class AbbreviationEngine:
+    """Registry, usage index and audit of one SSOT file, kept current across calls."""
+
+    def __init__(
+        self,
+        ssot_path: str | Path = DEFAULT_SSOT_PATH,
+        sections_path: str | Path | None = SECTIONS_PATH,
+        snapshot_path: str | Path | None = SNAPSHOT_PATH,
+    ):
+        """
+        Args:
+            ssot_path: Path to the SSOT markdown file
+            sections_path: Section cache file (None keeps the cache in memory)
+            snapshot_path: Registry snapshot file (None disables the snapshot)
+        """
+        self.ssot_path = Path(ssot_path)
+        self.sections_path = sections_path
+        self.snapshot_path = snapshot_path
+        self._reporter: AuditReporter | None = None
+        self._snapshot: AbbreviationRegistry | None = None
+        self._snapshot_stamp: tuple[int, int] | None = None  # (mtime_ns, size) it was loaded at
+
+    @property
+    def reporter(self) -> AuditReporter:
+        """Section-cached reporter, refreshed to the current SSOT content."""
+        if self._reporter is None:
+            self._reporter = AuditReporter.from_ssot(str(self.ssot_path), sections_path=self.sections_path)
+        else:
+            self._reporter.refresh()
+        return self._reporter
+
+    @property
+    def registry(self) -> AbbreviationRegistry:
+        """
+        Registry of the current SSOT.
+
+        Once the usage index has been built the reporter's registry is
+        used; until then it comes from the snapshot, so lookups never pay
+        for a usage scan.
+        """
+        if self._reporter is not None:
+            return self.reporter.registry
+        stat = self.ssot_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._snapshot is None or stamp != self._snapshot_stamp:
+            self._snapshot = AbbreviationRegistry.from_ssot(self.ssot_path, self.snapshot_path)
+            self._snapshot_stamp = stamp
+        return self._snapshot
+
+    @property
+    def usage(self) -> UsageIndex:
+        """Usage index of the current SSOT, merged from the section cache."""
+        return self.reporter.usage
+
+    def validate(self) -> list[ConsistencyIssue]:
+        """Run all consistency checks against the current SSOT."""
+        reporter = self.reporter
+        return reporter.validator.validate_index(reporter.usage)
+
+    def report(self) -> AuditReport:
+        """Full audit report of the current SSOT."""
+        return self.reporter.generate_full_report()
+
+    def lookup(self, query: str, limit: int | None = 10) -> list[AbbreviationEntry]:
+        """
+        Entries for query: its own entry if it is a defined abbreviation,
+        otherwise the entries whose full terms match (ranked reverse lookup).
+
+        Args:
+            query: Abbreviation or (partial) full term
+            limit: Maximum reverse-lookup results (None for all)
+        """
+        registry = self.registry
+        entry = registry.lookup(query)
+        if entry is not None and entry.full_term:
+            return [entry]
+        matches = (registry.lookup(abbrev) for abbrev in registry.reverse_lookup(query, limit=limit))
+        return [match for match in matches if match is not None]
@@ -9,7 +9,7 @@ Part of the ASC Abbreviation System for Codex Brahmanica Perfectus governance.
 
 import re
 
-from .models import Abbreviation, AbbreviationStatus, NotationPattern
+from .models import AbbreviationEntry, NotationPatternType
 
 
 class AbbreviationGenerator:
@@ -220,7 +220,7 @@ class AbbreviationGenerator:
         self,
         abbrev: str,
         full_term: str,
-        pattern: NotationPattern = NotationPattern.PARENTHETICAL
+        pattern: NotationPatternType = NotationPatternType.PARENTHETICAL_INLINE
     ) -> str:
         """
         Generate the full notation string for an abbreviation.
@@ -233,26 +233,26 @@ class AbbreviationGenerator:
         Returns:
             Formatted notation string following SSOT conventions
         """
-        if pattern == NotationPattern.PARENTHETICAL:
+        if pattern == NotationPatternType.PARENTHETICAL_INLINE:
             return f"(`{full_term}`): → (`{abbrev}`):"
 
-        elif pattern == NotationPattern.BACKTICK:
+        elif pattern == NotationPatternType.BACKTICK_INLINE:
             return f"**(`{abbrev}`)** = {full_term}"
 
-        elif pattern == NotationPattern.ARROW_CHAIN:
+        elif pattern == NotationPatternType.TRIPLE_ARROW_CHAIN:
             # Split full term and abbreviation into parts
             parts = full_term.split()
             abbrev.split('-') if '-' in abbrev else list(abbrev)
             chain = ' → '.join(f"(`{p}`)" for p in parts[:3])
             return f"{chain}: → (`{abbrev}`):"
 
-        elif pattern == NotationPattern.HYPHENATED:
+        elif pattern == NotationPatternType.HYPHENATED_COMPOUND:
             return f"**(`{abbrev}`)** — ({full_term})"
 
-        elif pattern == NotationPattern.SLASH_COMPOSITE:
+        elif pattern == NotationPatternType.SLASH_COMPOSITE:
             return f"(`{abbrev}`/`{full_term}`)"
 
-        elif pattern == NotationPattern.TIER_DESIGNATOR:
+        elif pattern == NotationPatternType.TIER_DESIGNATOR:
             return f"**(`{abbrev}`)** = (Tier designation for {full_term})"
 
         else:
@@ -297,12 +297,12 @@ class AbbreviationGenerator:
 def create_abbreviation_entry(
     abbrev: str,
     full_term: str,
-    pattern: NotationPattern,
+    pattern: NotationPatternType,
     section: str,
     line_number: int = 0
-) -> Abbreviation:
+) -> AbbreviationEntry:
     """
-    Factory function to create a new Abbreviation entry.
+    Factory function to create a new (proposed) abbreviation entry.
 
     Args:
         abbrev: The abbreviation string
@@ -312,13 +312,13 @@ def create_abbreviation_entry(
         line_number: Line number in SSOT (optional)
 
     Returns:
-        Abbreviation model instance
+        AbbreviationEntry model instance
     """
-    return Abbreviation(
-        abbrev=abbrev,
+    return AbbreviationEntry(
+        abbreviation=abbrev,
         full_term=full_term,
-        pattern=pattern,
+        pattern_type=pattern,
         section=section,
         line_number=line_number,
-        status=AbbreviationStatus.PROPOSED
+        status="proposed"
     )
@@ -0,0 +1,189 @@
+"""
+Section Cache — Incremental Re-Audit of the SSOT
+================================================
+
+Cuts the SSOT into sections at markdown headings and thematic breaks
+(`---`) and keeps, per section content hash, everything an audit derives
+from scanning that section's text:
+
+- parsed abbreviation entries (line numbers relative to the section)
+- a UsageIndex of the section (words, backticks, tier styles, guides)
+
+Cuts fall on line starts, and every pattern the parser and usage index
+match stays within a line, so the pieces give the same results as the
+whole text. Entries before a section's first SSOT section header take the
+section name in effect from the sections before it.
+
+A re-scan only parses and tokenizes sections whose hash changed. The
+document-wide registry and usage index are merged from the per-section
+results, and the global checks (duplicates, orphans, fuzzy variants, ...)
+run on those, so re-auditing after a small edit costs the edited sections
+plus the checks - not a full parse and tokenization.
+
+Scans persist to mas_cache/abbreviation_sections.json between runs.
+
+Usage:
+    cache = SectionCache.load()
+    entries, index = cache.scan(ssot_content)
+    registry = AbbreviationRegistry()
+    registry.add_entries(entries)
+    issues = ConsistencyValidator(registry).validate_index(index)
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+from .models import AbbreviationEntry, NotationPatternType
+from .parser import SSOTParser
+from .registry import _write_json_atomic
+from .usage import UsageIndex
+from .validator import ConsistencyValidator
+
+CACHE_FORMAT = "asc-abbreviation-sections"
+CACHE_VERSION = 2
+
+# Lines that start a new cache section: headings and thematic breaks
+SECTION_BREAK = re.compile(r"^(?:#{1,6}[^\S\n]|(?:-{3,}|\*{3,}|_{3,})[^\S\n]*$)", re.MULTILINE)
+
+SECTIONS_PATH = Path(__file__).resolve().parent.parent / "mas_cache" / "abbreviation_sections.json"
+
+
+@dataclass
+class SectionScan:
+    """Parse and usage results for one section's text."""
+    entries: list[AbbreviationEntry]  # Line numbers relative to the section
+    usage: UsageIndex
+    line_count: int
+    last_section: str | None  # Last SSOT section header in the text, if any
+
+    def to_dict(self) -> dict:
+        entries = []
+        for entry in self.entries:
+            data = asdict(entry)
+            data["pattern_type"] = entry.pattern_type.name
+            entries.append(data)
+        return {"entries": entries, "usage": self.usage.to_dict(), "last_section": self.last_section}
+
+    @classmethod
+    def from_dict(cls, data: dict, text: str) -> "SectionScan":
+        entries = [
+            AbbreviationEntry(**dict(item, pattern_type=NotationPatternType[item["pattern_type"]]))
+            for item in data["entries"]
+        ]
+        return cls(entries, UsageIndex.from_dict(data["usage"], text), text.count("\n"), data["last_section"])
+
+
+class SectionCache:
+    """Section content hash -> SectionScan, re-scanning only changed sections."""
+
+    def __init__(self, parser: SSOTParser | None = None, path: str | Path | None = None):
+        """
+        Args:
+            parser: Parser for section text (a default SSOTParser if None)
+            path: File the scans are saved to after a scan (None keeps them in memory)
+        """
+        self.parser = parser or SSOTParser()
+        self.path = Path(path) if path is not None else None
+        self._scans: dict[str, SectionScan] = {}
+        self._stored: dict[str, dict] = {}  # Serialized scans (loaded or saved), restored on first use
+        self.scanned = 0  # Sections parsed by the last scan()
+        self.reused = 0   # Sections taken from the cache by the last scan()
+
+    @staticmethod
+    def engine() -> str:
+        """Cache layout and parser patterns the stored scans were made with."""
+        return f"{CACHE_VERSION}:{SSOTParser.fingerprint()}"
+
+    @classmethod
+    def load(cls, path: str | Path = SECTIONS_PATH, parser: SSOTParser | None = None) -> "SectionCache":
+        """Cache backed by path, with its scans if they were made by the same engine."""
+        cache = cls(parser, path)
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            if data.get("format") == CACHE_FORMAT and data.get("engine") == cls.engine():
+                cache._stored = data["sections"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing or unreadable cache: start empty
+        return cache
+
+    def split(self, content: str) -> list[str]:
+        """Content cut before each SECTION_BREAK line (the pieces join back to content)."""
+        starts = sorted({0} | {match.start() for match in SECTION_BREAK.finditer(content)})
+        return [content[start:end] for start, end in zip(starts, starts[1:] + [len(content)], strict=True)]
+
+    def scan(self, content: str) -> tuple[list[AbbreviationEntry], UsageIndex]:
+        """
+        Entries and usage index of content, as parse_text() and UsageIndex would give.
+
+        Sections seen before (same text) are taken from the cache; only new
+        or edited sections are parsed and tokenized. Sections no longer in
+        content are dropped from the cache.
+        """
+        scans: dict[str, SectionScan] = {}
+        entries: list[AbbreviationEntry] = []
+        parts: list[UsageIndex] = []
+        line_offset = 0
+        section_name = self.parser.PREAMBLE_SECTION
+        self.scanned = self.reused = 0
+
+        for text in self.split(content):
+            key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            section = scans.get(key) or self._restore(key, text)
+            if section is None:
+                section = self._scan(text)
+                self.scanned += 1
+            else:
+                self.reused += 1
+            scans[key] = section
+
+            for entry in section.entries:
+                changes = {"line_number": entry.line_number + line_offset}
+                if entry.section == self.parser.PREAMBLE_SECTION:
+                    changes["section"] = section_name  # Before the text's first section header
+                entries.append(replace(entry, **changes))
+            parts.append(section.usage)
+            line_offset += section.line_count
+            section_name = section.last_section or section_name
+
+        stale = (self._scans.keys() | self._stored.keys()) - scans.keys()
+        self._scans = scans
+        self._stored = {key: data for key, data in self._stored.items() if key in scans}
+        if self.path is not None and (self.scanned or stale):
+            self.save()
+        return entries, UsageIndex.join(parts)
+
+    def _scan(self, text: str) -> SectionScan:
+        _, names = self.parser._section_table(text)
+        return SectionScan(
+            self.parser.parse_text(text),
+            UsageIndex(text, ConsistencyValidator.TIER_PATTERNS),
+            text.count("\n"),
+            names[-1] if len(names) > 1 else None,
+        )
+
+    def _restore(self, key: str, text: str) -> SectionScan | None:
+        if key in self._scans:
+            return self._scans[key]
+        if key in self._stored:
+            try:
+                return SectionScan.from_dict(self._stored[key], text)
+            except (KeyError, TypeError, ValueError):
+                return None  # Malformed entry: re-scan
+        return None
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Write the scans of the last scan() to path (default: self.path)."""
+        target = Path(path) if path is not None else self.path
+        if target is None:
+            return
+        _write_json_atomic(target, {
+            "format": CACHE_FORMAT,
+            "engine": self.engine(),
+            "sections": {
+                key: self._stored.get(key) or self._stored.setdefault(key, section.to_dict())
+                for key, section in self._scans.items()
+            },
+        })
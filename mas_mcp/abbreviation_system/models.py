@@ -75,6 +75,7 @@ class NotationPattern:
     examples: list[str] = field(default_factory=list)
     is_consistent: bool = True
     notes: str = ""
+    lead_chars: str = ""  # Every character a match can start with ("" = unknown)
 
 
 @dataclass
@@ -12,13 +12,17 @@ Pattern Regex Reference:
 - P9: `(CRC-[A-Z]+)` (entity designators)
 - etc.
 
+All patterns are compiled into one scanner and the document is scanned once;
+section headers are located up front and looked up by offset.
+
 Usage:
     parser = SSOTParser()
     entries = parser.parse_file("copilot-instructions.md")
 """
 
+import hashlib
 import re
-from collections.abc import Iterator
+from bisect import bisect_right
 from pathlib import Path
 
 from .models import (
@@ -27,6 +31,52 @@ from .models import (
     NotationPatternType,
 )
 
+AXIOM_NAMES = {
+    'FA¹': 'Axiom of Alchemical Actualization',
+    'FA²': 'Axiom of Panoptic Re-contextualization',
+    'FA³': 'Axiom of Qualitative Transcendence',
+    'FA⁴': 'Axiom of Architectonic Integrity',
+    'FA⁵': 'Axiom of Visual Integrity',
+}
+
+def _line_bounded(regex: str) -> str:
+    r"""
+    Rewrite a per-line regex so it cannot match across a newline.
+
+    The patterns were written for single lines; scanning the whole document
+    needs `\s` and negated classes to stop at line ends, so that every match
+    is exactly one the line-by-line scan would have found.
+    """
+    out = []
+    i = 0
+    while i < len(regex):
+        char = regex[i]
+        if char == "\\":
+            token = regex[i:i + 2]
+            out.append(r"[^\S\n]" if token == r"\s" else token)
+            i += 2
+        elif char == "[":
+            end = i + 1
+            if regex[end] == "^":
+                end += 1
+            if regex[end] == "]":
+                end += 1
+            while regex[end] != "]":
+                end += 2 if regex[end] == "\\" else 1
+            body = regex[i + 1:end]
+            if body.startswith("^"):
+                out.append(f"[^\\n{body[1:]}]")
+            elif r"\s" in body:
+                rest = body.replace(r"\s", "")
+                out.append(f"(?:[{rest}]|[^\\S\\n])")
+            else:
+                out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(char)
+            i += 1
+    return "".join(out)
+
 
 class SSOTParser:
     """
@@ -35,16 +85,28 @@ class SSOTParser:
     Supports all 15 notation patterns identified in the audit report.
     """
 
+    PREAMBLE_SECTION = "Preamble"  # Section name before the first section header
+
     def __init__(self):
         self.patterns = self._build_patterns()
-        self._current_section = "Preamble"
+        # Combined scanner, compiled on first parse (costly; cached parses may never need it)
+        self._combined: re.Pattern | None = None
+        self._dispatch: dict[str, list[tuple[int, int, int]]] = {}
         self._section_pattern = re.compile(
             r'^###?\s+(?:\*\*)?(?:\(`)?([IVXLC]+(?:\.[0-9.]+)?)\.'
             r'|^###?\s+\*\*(\d+(?:\.\d+)?)\.'
         )
+        self._section_scan = re.compile(_line_bounded(self._section_pattern.pattern), re.MULTILINE)
         self.ssot_path: str | None = None  # Set when parse_file is called
 
-    def _build_patterns(self) -> list[NotationPattern]:
+    @classmethod
+    def fingerprint(cls) -> str:
+        """Hash of the notation patterns, for invalidating parse results cached elsewhere."""
+        regexes = "\n".join(pattern.regex for pattern in cls._build_patterns())
+        return hashlib.sha256(regexes.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _build_patterns() -> list[NotationPattern]:
         """Build regex patterns for all 15 notation types."""
         return [
             # P1: Parenthetical Inline Definition
@@ -54,6 +116,7 @@ class SSOTParser:
                 regex=r'\*\*\(\`([^`]+)\`\):\s*→\s*\(\`([^`]+)\`\):?\*\*',
                 description="Parenthetical inline definition with arrow",
                 examples=["**(`Framework Components`): → (`FRW-COMP`):**"],
+                lead_chars="*",
             ),
 
             # P1 variant: (`Term`) - (`ABBREV`)
@@ -62,6 +125,7 @@ class SSOTParser:
                 regex=r'\(\`([^`]+)\`\)\s*-\s*\(\`([^`]+)\`\)',
                 description="Parenthetical with dash separator",
                 examples=["(`Eternal Sadhana`) - (`ET-S`)"],
+                lead_chars="(",
             ),
 
             # P1 variant: Just arrow without bold
@@ -70,6 +134,7 @@ class SSOTParser:
                 regex=r'\(\`([^`]+)\`\)\s*→\s*\(\`([^`]+)\`\)',
                 description="Parenthetical arrow without bold",
                 examples=["(`Term`): → (`ABBR`)"],
+                lead_chars="(",
             ),
 
             # P6: Superscript Axioms (FA¹, FA², etc.)
@@ -78,6 +143,7 @@ class SSOTParser:
                 regex=r'\*\*\(\`(FA[¹²³⁴⁵])\`\)',
                 description="Foundational Axiom superscript",
                 examples=["**(`FA¹`)", "**(`FA⁵`)"],
+                lead_chars="*",
             ),
 
             # P6 variant: FA¹⁻⁵ range notation
@@ -86,6 +152,7 @@ class SSOTParser:
                 regex=r'(FA[¹²³⁴⁵](?:[⁻-][¹²³⁴⁵])?)',
                 description="Axiom range notation",
                 examples=["FA¹⁻⁵", "FA¹-5"],
+                lead_chars="F",
             ),
 
             # P9: CRC Entity Designators
@@ -94,6 +161,7 @@ class SSOTParser:
                 regex=r'\b(CRC-[A-Z]{2,6})\b',
                 description="Conceptual Resonance Core designator",
                 examples=["CRC-AS", "CRC-GAR", "CRC-MEDAT"],
+                lead_chars="C",
             ),
 
             # P10: Tier Designators
@@ -102,6 +170,7 @@ class SSOTParser:
                 regex=r'\b(Tier\s+[\d.]+|T-[\d.]+)\b',
                 description="Hierarchy tier designator",
                 examples=["Tier 0.5", "T-1", "Tier 2"],
+                lead_chars="T",
             ),
 
             # P8: Greek Letter Operators
@@ -110,6 +179,7 @@ class SSOTParser:
                 regex=r'\b([ΦΩΨ](?:-Set|-Protocol)?|ΦΩΨ)\b',
                 description="Greek letter tensor operators",
                 examples=["Ω-Set", "Φ-Set", "Ψ-Protocol", "ΦΩΨ"],
+                lead_chars="ΦΩΨ",
             ),
 
             # P7: Dollar-Sign Invocation Syntax
@@ -118,6 +188,7 @@ class SSOTParser:
                 regex=r'\$([a-z]+)\$\{([^}]+)\}',
                 description="DSL invocation syntax",
                 examples=["$matriarch${Orackla}+$type${Crypto}"],
+                lead_chars="$",
             ),
 
             # P11: Linguistic Mandates (specific known patterns)
@@ -126,6 +197,7 @@ class SSOTParser:
                 regex=r'\b(EULP-AA|LIPAA|LUPLR|DULSS|TLM)\b',
                 description="Linguistic mandate abbreviations",
                 examples=["EULP-AA", "LIPAA", "LUPLR"],
+                lead_chars="ELDT",
             ),
 
             # P12: Faction Abbreviations (Prime)
@@ -134,6 +206,7 @@ class SSOTParser:
                 regex=r'\b(TMO|TTG|TDPC|TP-FNS|TL-FNS)\b',
                 description="Prime faction abbreviations",
                 examples=["TMO", "TTG", "TDPC"],
+                lead_chars="T",
             ),
 
             # P12: Faction Abbreviations (Lesser - longer patterns)
@@ -142,6 +215,7 @@ class SSOTParser:
                 regex=r'\b(OMCA|TNKW-RIAT|SDBH|TWOUMC|SBSGYB|BOS|TDAPCFLN|POAFPSG|AAA)\b',
                 description="Lesser faction abbreviations",
                 examples=["OMCA", "BOS", "AAA"],
+                lead_chars="OTSBPA",
             ),
 
             # P4: Hyphenated Compounds (general catch)
@@ -150,6 +224,7 @@ class SSOTParser:
                 regex=r'\(\`([A-Z][A-Z0-9]*(?:-[A-Z][A-Z0-9]*){2,})\`\)',
                 description="Multi-hyphenated compound abbreviation",
                 examples=["(`MSP-RSG`)", "(`TTS-FFOM`)"],
+                lead_chars="(",
             ),
 
             # P2: Backtick abbreviations (uppercase, 2-8 chars)
@@ -158,6 +233,7 @@ class SSOTParser:
                 regex=r'`([A-Z][A-Z0-9]{1,7}(?:-[A-Z0-9]+)?)`',
                 description="Standalone backtick abbreviation",
                 examples=["`ASC`", "`MURI`", "`PS`"],
+                lead_chars="`",
             ),
 
             # P13: SAI designators
@@ -166,6 +242,7 @@ class SSOTParser:
                 regex=r'\bSAI:\s*([A-Za-z\s]+)\s*\(([A-Z]{2,})\)',
                 description="Special Archetype Injection",
                 examples=["SAI: Sister Ferrum Scoriae (SFS)"],
+                lead_chars="S",
             ),
 
             # P5: Slash composites (alternatives)
@@ -174,6 +251,7 @@ class SSOTParser:
                 regex=r'\(\`([A-Z][A-Z0-9-]*)\`/\`([A-Z][A-Z0-9-]*)\`(?:/\`([A-Z][A-Z0-9-]*)\`)?\)',
                 description="Slash-separated alternatives",
                 examples=["(`TRM-VRT`/`TR-VRT`)", "(`A`/`B`/`C`)"],
+                lead_chars="(",
             ),
 
             # P15: Emoji semantic markers
@@ -182,6 +260,7 @@ class SSOTParser:
                 regex=r'(👑|💀|⚜️|🔥|⛓️|🏛️)\s*=\s*([^,\n]+)',
                 description="Emoji semantic definition",
                 examples=["👑 = Supreme authority"],
+                lead_chars="👑💀⚜🔥⛓🏛",
             ),
         ]
 
@@ -200,122 +279,196 @@ class SSOTParser:
             raise FileNotFoundError(f"SSOT file not found: {filepath}")
 
         self.ssot_path = str(filepath)  # Store for reporting
-        content = filepath.read_text(encoding="utf-8")
-        lines = content.split("\n")
+        return self.parse_text(filepath.read_text(encoding="utf-8"))
 
-        entries: list[AbbreviationEntry] = []
-        self._current_section = "Preamble"
+    def parse_text(self, content: str) -> list[AbbreviationEntry]:
+        """
+        Extract all abbreviation entries from SSOT markdown content.
 
-        for line_num, line in enumerate(lines, start=1):
-            # Update current section tracking
-            self._update_section(line)
+        One scan of the combined pattern finds every notation match in the
+        document. Entries come out in the same order as a line-by-line,
+        pattern-by-pattern scan: by line, then pattern, then position.
+        """
+        if self._combined is None:
+            self._combined, self._dispatch = self._compile_combined()
+        line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+        section_starts, section_names = self._section_table(content)
+
+        hits: list[tuple[int, int, int, tuple]] = []
+        resume = [0] * len(self.patterns)  # Per-pattern finditer resume offset
+        fallback = self._dispatch.get("")
+        for match in self._combined.finditer(content):
+            start = match.start()
+            for index, group, width in fallback or self._dispatch[content[start]]:
+                if match.start(group) < 0 or start < resume[index]:
+                    continue
+                resume[index] = match.end(group)
+                line_num = bisect_right(line_starts, start)
+                hits.append((line_num, index, start, match.groups()[group:group + width]))
+        hits.sort()
 
-            # Extract entries from this line
-            for entry in self._extract_from_line(line, line_num):
+        entries: list[AbbreviationEntry] = []
+        for line_num, index, start, groups in hits:
+            line_end = line_starts[line_num] - 1 if line_num < len(line_starts) else len(content)
+            entry = self._make_entry(
+                self.patterns[index],
+                groups,
+                section_names[bisect_right(section_starts, start) - 1],
+                line_num,
+                content[line_starts[line_num - 1]:line_end],
+            )
+            if entry is not None:
                 entries.append(entry)
 
         return entries
 
-    def _update_section(self, line: str) -> None:
-        """Track which section we're currently in."""
-        # Look for section headers like "### **I." or "### **10.3."
-        match = self._section_pattern.search(line)
-        if match:
+    def _section_table(self, content: str) -> tuple[list[int], list[str]]:
+        """Offsets of section headers and the section name in effect from each."""
+        starts, names = [0], [self.PREAMBLE_SECTION]
+        for match in self._section_scan.finditer(content):
             section_num = match.group(1) or match.group(2)
             if section_num:
-                self._current_section = f"Section {section_num}"
-
-    def _extract_from_line(self, line: str, line_num: int) -> Iterator[AbbreviationEntry]:
-        """Extract all abbreviations from a single line."""
-        for pattern in self.patterns:
-            for match in re.finditer(pattern.regex, line):
-                groups = match.groups()
-
-                # Handle different pattern structures
-                if pattern.pattern_type == NotationPatternType.PARENTHETICAL_INLINE:
-                    # Groups: (full_term, abbreviation)
-                    if len(groups) >= 2:
-                        full_term, abbrev = groups[0], groups[1]
-                        yield AbbreviationEntry(
-                            abbreviation=abbrev,
-                            full_term=full_term,
-                            pattern_type=pattern.pattern_type,
-                            section=self._current_section,
-                            line_number=line_num,
-                            context=line.strip()[:100],
-                        )
-
-                elif pattern.pattern_type == NotationPatternType.NUMERIC_SUPERSCRIPT:
-                    # FA¹, FA², etc.
-                    abbrev = groups[0]
-                    axiom_names = {
-                        'FA¹': 'Axiom of Alchemical Actualization',
-                        'FA²': 'Axiom of Panoptic Re-contextualization',
-                        'FA³': 'Axiom of Qualitative Transcendence',
-                        'FA⁴': 'Axiom of Architectonic Integrity',
-                        'FA⁵': 'Axiom of Visual Integrity',
-                    }
-                    if abbrev in axiom_names:
-                        yield AbbreviationEntry(
-                            abbreviation=abbrev,
-                            full_term=axiom_names[abbrev],
-                            pattern_type=pattern.pattern_type,
-                            section=self._current_section,
-                            line_number=line_num,
-                        )
-
-                elif pattern.pattern_type in (
-                    NotationPatternType.CRC_DESIGNATOR,
-                    NotationPatternType.TIER_DESIGNATOR,
-                    NotationPatternType.GREEK_LETTER_OPERATOR,
-                    NotationPatternType.LINGUISTIC_MANDATE,
-                    NotationPatternType.FACTION_ABBREVIATION,
-                ):
-                    # Single-group patterns - abbreviation only
-                    abbrev = groups[0]
-                    yield AbbreviationEntry(
-                        abbreviation=abbrev,
-                        full_term="",  # Will be resolved by registry lookup
-                        pattern_type=pattern.pattern_type,
-                        section=self._current_section,
-                        line_number=line_num,
-                        context=line.strip()[:100],
-                    )
-
-                elif pattern.pattern_type == NotationPatternType.SAI_DESIGNATOR:
-                    # Groups: (entity_name, abbreviation)
-                    if len(groups) >= 2:
-                        yield AbbreviationEntry(
-                            abbreviation=groups[1],
-                            full_term=groups[0].strip(),
-                            pattern_type=pattern.pattern_type,
-                            section=self._current_section,
-                            line_number=line_num,
-                        )
-
-                elif pattern.pattern_type == NotationPatternType.EMOJI_SEMANTIC:
-                    # Groups: (emoji, meaning)
-                    if len(groups) >= 2:
-                        yield AbbreviationEntry(
-                            abbreviation=groups[0],
-                            full_term=groups[1].strip(),
-                            pattern_type=pattern.pattern_type,
-                            section=self._current_section,
-                            line_number=line_num,
-                        )
-
-                elif pattern.pattern_type == NotationPatternType.SLASH_COMPOSITE:
-                    # Record the composite relationship
-                    parts = [g for g in groups if g]
-                    if len(parts) >= 2:
-                        yield AbbreviationEntry(
-                            abbreviation="/".join(parts),
-                            full_term="[COMPOSITE]",
-                            pattern_type=pattern.pattern_type,
-                            section=self._current_section,
-                            line_number=line_num,
-                            aliases=list(parts),
-                        )
+                starts.append(match.start())
+                names.append(f"Section {section_num}")
+        return starts, names
+
+    def _compile_combined(self) -> tuple[re.Pattern, dict[str, list[tuple[int, int, int]]]]:
+        """
+        Compile all notation patterns into one document-wide scanner.
+
+        Each pattern becomes an optional capturing lookahead, so every pattern
+        that matches at a position is reported by the same match (patterns
+        overlap, e.g. P1 and P6 both start at `**`). The lookaheads are grouped
+        into one branch per lead character and sit inside a one-character
+        lookbehind, so the regex engine skips straight to candidate characters
+        and only tries the patterns that can start there.
+
+        If any pattern has no lead_chars, a single branch on any character
+        tries every pattern (correct, but without the skip).
+
+        Returns:
+            (compiled regex, {lead char: [(pattern index, outer group, inner group count)]})
+        """
+        by_lead: dict[str, list[int]] = {}
+        if all(pattern.lead_chars for pattern in self.patterns):
+            for index, pattern in enumerate(self.patterns):
+                for char in pattern.lead_chars:
+                    by_lead.setdefault(char, []).append(index)
+        else:
+            by_lead[""] = list(range(len(self.patterns)))
+
+        regexes = [_line_bounded(pattern.regex) for pattern in self.patterns]
+        widths = [re.compile(regex).groups for regex in regexes]
+
+        branches = []
+        dispatch: dict[str, list[tuple[int, int, int]]] = {}
+        group = 0
+        for char, indexes in by_lead.items():
+            lookaheads = []
+            for index in indexes:
+                group += 1
+                dispatch.setdefault(char, []).append((index, group, widths[index]))
+                lookaheads.append(f"(?:(?=({regexes[index]})))?")
+                group += widths[index]
+
+            # Fail unless at least one of this branch's lookaheads captured
+            matched = "(?!)"
+            for _, outer, _ in reversed(dispatch[char]):
+                matched = f"(?({outer})|{matched})"
+
+            lead = re.escape(char) if char else "(?s:.)"
+            branches.append(f"{lead}(?<={''.join(lookaheads)}{lead}){matched}")
+
+        return re.compile("|".join(branches)), dispatch
+
+    @staticmethod
+    def _make_entry(
+        pattern: NotationPattern,
+        groups: tuple,
+        section: str,
+        line_num: int,
+        line: str,
+    ) -> AbbreviationEntry | None:
+        """Build the entry for one pattern match (None if the match is not an entry)."""
+        # Handle different pattern structures
+        if pattern.pattern_type == NotationPatternType.PARENTHETICAL_INLINE:
+            # Groups: (full_term, abbreviation)
+            if len(groups) >= 2:
+                full_term, abbrev = groups[0], groups[1]
+                return AbbreviationEntry(
+                    abbreviation=abbrev,
+                    full_term=full_term,
+                    pattern_type=pattern.pattern_type,
+                    section=section,
+                    line_number=line_num,
+                    context=line.strip()[:100],
+                )
+
+        elif pattern.pattern_type == NotationPatternType.NUMERIC_SUPERSCRIPT:
+            # FA¹, FA², etc.
+            abbrev = groups[0]
+            if abbrev in AXIOM_NAMES:
+                return AbbreviationEntry(
+                    abbreviation=abbrev,
+                    full_term=AXIOM_NAMES[abbrev],
+                    pattern_type=pattern.pattern_type,
+                    section=section,
+                    line_number=line_num,
+                )
+
+        elif pattern.pattern_type in (
+            NotationPatternType.CRC_DESIGNATOR,
+            NotationPatternType.TIER_DESIGNATOR,
+            NotationPatternType.GREEK_LETTER_OPERATOR,
+            NotationPatternType.LINGUISTIC_MANDATE,
+            NotationPatternType.FACTION_ABBREVIATION,
+        ):
+            # Single-group patterns - abbreviation only
+            return AbbreviationEntry(
+                abbreviation=groups[0],
+                full_term="",  # Will be resolved by registry lookup
+                pattern_type=pattern.pattern_type,
+                section=section,
+                line_number=line_num,
+                context=line.strip()[:100],
+            )
+
+        elif pattern.pattern_type == NotationPatternType.SAI_DESIGNATOR:
+            # Groups: (entity_name, abbreviation)
+            if len(groups) >= 2:
+                return AbbreviationEntry(
+                    abbreviation=groups[1],
+                    full_term=groups[0].strip(),
+                    pattern_type=pattern.pattern_type,
+                    section=section,
+                    line_number=line_num,
+                )
+
+        elif pattern.pattern_type == NotationPatternType.EMOJI_SEMANTIC:
+            # Groups: (emoji, meaning)
+            if len(groups) >= 2:
+                return AbbreviationEntry(
+                    abbreviation=groups[0],
+                    full_term=groups[1].strip(),
+                    pattern_type=pattern.pattern_type,
+                    section=section,
+                    line_number=line_num,
+                )
+
+        elif pattern.pattern_type == NotationPatternType.SLASH_COMPOSITE:
+            # Record the composite relationship
+            parts = [g for g in groups if g]
+            if len(parts) >= 2:
+                return AbbreviationEntry(
+                    abbreviation="/".join(parts),
+                    full_term="[COMPOSITE]",
+                    pattern_type=pattern.pattern_type,
+                    section=section,
+                    line_number=line_num,
+                    aliases=list(parts),
+                )
+
+        return None
 
     def get_pattern_stats(self, entries: list[AbbreviationEntry]) -> dict[str, int]:
         """Get count of entries by pattern type."""
@@ -18,15 +18,51 @@ Usage:
     registry.add_entries(parsed_entries)  # Add parsed entries
 
     result = registry.lookup("ASC")  # Returns AbbreviationEntry
-    result = registry.reverse_lookup("Apex Synthesis Core")  # Returns "ASC"
+    result = registry.reverse_lookup("Apex Synthesis Core")  # Returns ["ASC"]
+    result = registry.reverse_lookup("synthesis", limit=5)  # Ranked matches
+
+    registry.export_json("registry.json")  # Includes the term index
+    registry = AbbreviationRegistry.load_json("registry.json")
+
+    # Parsed registry for an SSOT, from the snapshot while the SSOT is unchanged
+    registry = AbbreviationRegistry.from_ssot(".github/copilot-instructions.md")
 """
 
+import hashlib
+import json
+import os
+import tempfile
 from collections import defaultdict
+from dataclasses import asdict
+from pathlib import Path
 
 from .models import (
     AbbreviationEntry,
     NotationPatternType,
 )
+from .parser import SSOTParser
+from .term_index import TermIndex
+
+EXPORT_FORMAT = "asc-abbreviation-registry"
+EXPORT_VERSION = 1
+
+# Snapshot of the parsed SSOT registry, keyed by SSOT hash (see from_ssot)
+SNAPSHOT_PATH = Path(__file__).resolve().parent.parent / "mas_cache" / "abbreviation_registry.json"
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """Replace path with data via a temp file; OSErrors (e.g. read-only cache) are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(data, ensure_ascii=False))  # C encoder; dump() streams in Python
+        os.replace(tmp, path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
 
 
 class AbbreviationRegistry:
@@ -56,6 +92,9 @@ class AbbreviationRegistry:
         # Usage tracking: abbrev -> list of line numbers where used
         self._usage: dict[str, list[int]] = defaultdict(list)
 
+        # N-gram index over _reverse_index keys, built on first reverse_lookup
+        self._term_index: TermIndex | None = None
+
     def add(self, entry: AbbreviationEntry) -> None:
         """Add an entry to the registry."""
         abbrev = entry.abbreviation
@@ -69,6 +108,8 @@ class AbbreviationRegistry:
         # Update reverse index
         if entry.full_term:
             normalized = self._normalize(entry.full_term)
+            if normalized not in self._reverse_index:
+                self._term_index = None
             if abbrev not in self._reverse_index[normalized]:
                 self._reverse_index[normalized].append(abbrev)
 
@@ -103,25 +144,48 @@ class AbbreviationRegistry:
 
         return self._entries.get(abbrev)
 
-    def reverse_lookup(self, full_term: str) -> list[str]:
+    def reverse_lookup(self, full_term: str, limit: int | None = None) -> list[str]:
         """
         Find abbreviations for a full term.
 
-        Uses fuzzy matching on normalized terms.
+        An exact normalized match wins. Otherwise terms containing, or
+        contained in, the query are returned best match first; if there are
+        none, fuzzy (trigram) matches. Answered from the term index.
+
+        Args:
+            full_term: Term to look up
+            limit: Maximum number of abbreviations to return
         """
         normalized = self._normalize(full_term)
 
         # Exact match
         if normalized in self._reverse_index:
-            return self._reverse_index[normalized]
+            return self._reverse_index[normalized][:limit]
+
+        matches: list[str] = []
+        for term in self.term_index().search(normalized):
+            for abbrev in self._reverse_index[term]:
+                if abbrev not in matches:
+                    matches.append(abbrev)
+            if limit is not None and len(matches) >= limit:
+                break
+
+        return matches[:limit]
+
+    def term_index(self) -> TermIndex:
+        """The n-gram index over normalized full terms (built on demand)."""
+        if self._term_index is None:
+            self._term_index = TermIndex(list(self._reverse_index))
+        return self._term_index
 
-        # Fuzzy match (substring)
-        matches = []
-        for term, abbrevs in self._reverse_index.items():
-            if normalized in term or term in normalized:
-                matches.extend(abbrevs)
+    def record_usage(self, usage: dict[str, list[int]]) -> None:
+        """
+        Merge document-wide usage line numbers (e.g. from UsageIndex.usage()).
 
-        return list(set(matches))
+        Lines already tracked from parsed entries are kept.
+        """
+        for abbrev, lines in usage.items():
+            self._usage[abbrev] = sorted(set(self._usage.get(abbrev, [])).union(lines))
 
     def get_usage(self, abbrev: str) -> list[int]:
         """Get all line numbers where an abbreviation is used."""
@@ -312,6 +376,92 @@ class AbbreviationRegistry:
             ("Ψ-Protocol", "Cross-Examination Synthesis", NotationPatternType.GREEK_LETTER_OPERATOR),
         ]
 
+    def to_dict(self) -> dict:
+        """Serializable registry state, including the term index."""
+        entries = []
+        for entry in self._entries.values():
+            data = asdict(entry)
+            data["pattern_type"] = entry.pattern_type.name
+            entries.append(data)
+        return {
+            "format": EXPORT_FORMAT,
+            "version": EXPORT_VERSION,
+            "entries": entries,
+            "reverse_index": dict(self._reverse_index),
+            "aliases": self._aliases,
+            "deprecations": self._deprecations,
+            "usage": dict(self._usage),
+            "term_index": self.term_index().to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AbbreviationRegistry":
+        """Restore a registry from to_dict() output without re-indexing."""
+        if data.get("format") != EXPORT_FORMAT:
+            raise ValueError("Not an abbreviation registry export")
+        registry = cls()
+        for item in data["entries"]:
+            item = dict(item, pattern_type=NotationPatternType[item["pattern_type"]])
+            entry = AbbreviationEntry(**item)
+            registry._entries[entry.abbreviation] = entry
+        registry._reverse_index.update(data["reverse_index"])
+        registry._aliases.update(data["aliases"])
+        registry._deprecations.update(data["deprecations"])
+        registry._usage.update(data["usage"])
+        if "term_index" in data:
+            registry._term_index = TermIndex.from_dict(data["term_index"])
+        return registry
+
+    @classmethod
+    def from_ssot(
+        cls,
+        ssot_path: str | Path,
+        snapshot_path: str | Path | None = SNAPSHOT_PATH,
+    ) -> "AbbreviationRegistry":
+        """
+        Registry of the entries parsed from an SSOT file.
+
+        Loaded from the snapshot when it was written for the same SSOT
+        content (SHA-256) and the same parser patterns; otherwise the SSOT is
+        parsed and the snapshot rewritten.
+
+        Args:
+            ssot_path: Path to the SSOT markdown file
+            snapshot_path: Snapshot file (None disables the snapshot)
+        """
+        ssot_hash = hashlib.sha256(Path(ssot_path).read_bytes()).hexdigest()
+        key = {"ssot_hash": ssot_hash, "engine": f"{EXPORT_VERSION}:{SSOTParser.fingerprint()}"}
+
+        if snapshot_path is not None:
+            try:
+                data = json.loads(Path(snapshot_path).read_text(encoding="utf-8"))
+                if data.get("snapshot") == key:
+                    return cls.from_dict(data)
+            except (OSError, ValueError, KeyError, TypeError):
+                pass  # Missing or unreadable snapshot: re-parse
+
+        registry = cls()
+        registry.add_entries(SSOTParser().parse_file(ssot_path))
+
+        if snapshot_path is not None:
+            registry._write_snapshot(Path(snapshot_path), key)
+        return registry
+
+    def _write_snapshot(self, path: Path, key: dict) -> None:
+        """Atomically replace the snapshot; a read-only location just skips caching."""
+        _write_json_atomic(path, {**self.to_dict(), "snapshot": key})
+
+    def export_json(self, path: str | Path) -> Path:
+        """Write the registry (with its term index) to a JSON file."""
+        path = Path(path)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load_json(cls, path: str | Path) -> "AbbreviationRegistry":
+        """Load a registry written by export_json()."""
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
     def stats(self) -> dict:
         """Get registry statistics."""
         return {
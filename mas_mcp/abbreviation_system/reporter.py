@@ -7,9 +7,12 @@ Implements FA⁵ (Visual Integrity) - clear, structured presentation of findings
 Part of the ASC Abbreviation System for Codex Brahmanica Perfectus governance.
 """
 
+import json
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
+from .incremental import SECTIONS_PATH, SectionCache
 from .models import (
     AbbreviationEntry,
     AuditReport,
@@ -20,6 +23,7 @@ from .models import (
 )
 from .parser import SSOTParser
 from .registry import AbbreviationRegistry
+from .usage import UsageIndex
 from .validator import ConsistencyValidator
 
 
@@ -39,30 +43,68 @@ class AuditReporter:
         self,
         parser: SSOTParser,
         registry: AbbreviationRegistry,
-        validator: ConsistencyValidator
+        validator: ConsistencyValidator,
+        sections: SectionCache | None = None,
     ):
         self.parser = parser
         self.registry = registry
         self.validator = validator
+        # With a section cache, registry and validator are rebuilt from the SSOT by refresh()
+        self.sections = sections
+        self._content: str | None = None
+        self._usage: UsageIndex | None = None
 
     @classmethod
-    def from_ssot(cls, ssot_path: str) -> "AuditReporter":
+    def from_ssot(
+        cls,
+        ssot_path: str,
+        sections_path: str | Path | None = SECTIONS_PATH,
+    ) -> "AuditReporter":
         """
         Create an AuditReporter from an SSOT file path.
 
         Args:
             ssot_path: Path to the SSOT markdown file
+            sections_path: Section cache file (None keeps the cache in memory)
 
         Returns:
             Configured AuditReporter instance
         """
         parser = SSOTParser()
-        entries = parser.parse_file(ssot_path)  # This also sets parser.ssot_path
+        parser.ssot_path = str(Path(ssot_path))
+        if sections_path is None:
+            sections = SectionCache(parser)
+        else:
+            sections = SectionCache.load(sections_path, parser)
         registry = AbbreviationRegistry()
-        registry.add_entries(entries)
-        validator = ConsistencyValidator(registry)
 
-        return cls(parser, registry, validator)
+        reporter = cls(parser, registry, ConsistencyValidator(registry), sections)
+        reporter.refresh()
+        return reporter
+
+    def refresh(self) -> str:
+        """
+        Re-read the SSOT and rebuild the registry if it changed.
+
+        Only sections edited since the last scan are re-parsed; the rest come
+        from the section cache.
+
+        Returns:
+            Current SSOT content
+        """
+        content = Path(self.parser.ssot_path).read_text(encoding="utf-8")
+        if content != self._content:
+            entries, self._usage = self.sections.scan(content)
+            self.registry = AbbreviationRegistry()
+            self.registry.add_entries(entries)
+            self.validator = ConsistencyValidator(self.registry)
+            self._content = content
+        return content
+
+    @property
+    def usage(self) -> UsageIndex | None:
+        """Usage index of the SSOT as of the last refresh() (None without a section cache)."""
+        return self._usage
 
     def generate_full_report(self) -> AuditReport:
         """
@@ -71,19 +113,24 @@ class AuditReporter:
         Returns:
             AuditReport model with all findings
         """
-        abbreviations = self.registry.all_abbreviations()
-
         # Read SSOT content for validation
         ssot_content = ""
         ssot_hash = ""
         total_lines = 0
         if self.parser.ssot_path:
-            ssot_content = Path(self.parser.ssot_path).read_text(encoding="utf-8")
+            if self.sections is not None:
+                ssot_content = self.refresh()
+            else:
+                ssot_content = Path(self.parser.ssot_path).read_text(encoding="utf-8")
             total_lines = len(ssot_content.splitlines())
             import hashlib
             ssot_hash = hashlib.sha256(ssot_content.encode()).hexdigest()[:16]
 
-        issues = self.validator.validate_all(ssot_content)
+        abbreviations = self.registry.all_abbreviations()
+        if self.sections is not None and self._usage is not None:
+            issues = self.validator.validate_index(self._usage)  # Merged from cached sections
+        else:
+            issues = self.validator.validate_all(ssot_content)
 
         # Calculate pattern distribution
         pattern_counts = self._count_patterns()
@@ -332,7 +379,23 @@ class AuditReporter:
         if report is None:
             report = self.generate_full_report()
 
-        return report.model_dump_json(indent=2)
+        data = {
+            "timestamp": report.timestamp.isoformat(),
+            "ssot_path": report.ssot_path,
+            "ssot_hash": report.ssot_hash,
+            "total_lines": report.total_lines,
+            "total_abbreviations": report.total_abbreviations,
+            "unique_abbreviations": report.unique_abbreviations,
+            "pattern_counts": report.pattern_counts,
+            "section_stats": [
+                dict(asdict(stats), patterns_used=[p.name for p in stats.patterns_used])
+                for stats in report.section_stats
+            ],
+            "issues": [issue.to_dict() for issue in report.issues],
+            "health_metrics": report.health_metrics,
+            "recommendations": report.recommendations,
+        }
+        return json.dumps(data, indent=2, ensure_ascii=False)
 
     def save_report(
         self,
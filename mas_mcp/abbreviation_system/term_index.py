@@ -0,0 +1,132 @@
+"""
+Term Index — N-gram Postings over Normalized Full Terms
+=======================================================
+
+Answers reverse lookups (full term → abbreviations) without scanning every
+registered term:
+
+- substring: terms containing the query, from the intersection of the
+  query's trigram postings (1- and 2-grams for very short queries)
+- containment: terms contained in the query, by counting each term's key
+  grams among the query's grams
+- fuzzy: terms sharing enough trigrams with the query (Dice coefficient)
+
+Results are ranked by trigram Dice similarity to the query. The index is a
+plain dict of lists, so it serializes to JSON with the registry export.
+
+Usage:
+    index = TermIndex(["apex synthesis core", "primal substrate"])
+    index.search("synthesis")           # ["apex synthesis core"]
+    index.search("apx synthesis core")  # fuzzy -> ["apex synthesis core"]
+"""
+
+from collections import Counter
+
+GRAM_SIZE = 3
+FUZZY_THRESHOLD = 0.5
+
+
+def _grams(text: str, size: int) -> set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _key_grams(text: str) -> set[str]:
+    """Grams that must all occur in any string containing text."""
+    return _grams(text, GRAM_SIZE) if len(text) >= GRAM_SIZE else {text}
+
+
+class TermIndex:
+    """Gram -> term-id postings for substring, containment and fuzzy lookups."""
+
+    def __init__(self, terms: list[str], postings: dict[str, list[int]] | None = None):
+        """
+        Args:
+            terms: Normalized full terms (ids are list positions)
+            postings: Previously built postings (from to_dict()); built if None
+        """
+        self.terms = list(terms)
+        if postings is None:
+            postings = {}
+            for term_id, term in enumerate(self.terms):
+                for size in range(1, GRAM_SIZE + 1):
+                    for gram in _grams(term, size):
+                        postings.setdefault(gram, []).append(term_id)
+        self.postings = postings
+        self._key_sizes = [len(_key_grams(term)) for term in self.terms]
+        self._short = {term: i for i, term in enumerate(self.terms) if len(term) < GRAM_SIZE}
+
+    def _substring_ids(self, query: str) -> set[int]:
+        """Terms containing query."""
+        grams = sorted(_key_grams(query), key=lambda g: len(self.postings.get(g, ())))
+        if not grams or grams[0] not in self.postings:
+            return set()
+        ids = set(self.postings[grams[0]])
+        for gram in grams[1:]:
+            ids.intersection_update(self.postings.get(gram, ()))
+            if not ids:
+                break
+        return {i for i in ids if query in self.terms[i]}
+
+    def _shared_trigrams(self, query: str) -> Counter:
+        """Term id -> number of the query's trigrams it contains."""
+        shared: Counter = Counter()
+        for gram in _grams(query, GRAM_SIZE):
+            shared.update(self.postings.get(gram, ()))
+        return shared
+
+    def _contained_ids(self, query: str, shared: Counter) -> set[int]:
+        """Terms contained in query: every key gram of the term occurs in query."""
+        ids = {
+            term_id for term_id, count in shared.items()
+            if count == self._key_sizes[term_id] and self.terms[term_id] in query
+        }
+        if self._short:
+            for size in range(1, GRAM_SIZE):
+                ids.update(self._short[g] for g in _grams(query, size) if g in self._short)
+        return ids
+
+    def similarity(self, query: str, term_id: int) -> float:
+        """Trigram Dice coefficient between query and a term."""
+        shared = len(_grams(query, GRAM_SIZE) & _grams(self.terms[term_id], GRAM_SIZE))
+        return self._dice(query, len(_grams(query, GRAM_SIZE)), term_id, shared)
+
+    def _dice(self, query: str, query_size: int, term_id: int, shared: int) -> float:
+        term = self.terms[term_id]
+        if not query_size or len(term) < GRAM_SIZE:
+            return 1.0 if query == term else 0.0
+        return 2 * shared / (query_size + self._key_sizes[term_id])
+
+    def search(self, query: str, limit: int | None = None, fuzzy: bool = True) -> list[str]:
+        """
+        Terms matching query, best first.
+
+        Substring and containment matches are returned when there are any;
+        otherwise (with fuzzy=True) terms whose trigram similarity reaches
+        FUZZY_THRESHOLD.
+        """
+        if not query:
+            return []
+        query_size = len(_grams(query, GRAM_SIZE))
+        shared = self._shared_trigrams(query)
+        ids = self._substring_ids(query) | self._contained_ids(query, shared)
+        if ids:
+            scored = [(self._dice(query, query_size, i, shared.get(i, 0)), i) for i in ids]
+        elif fuzzy:
+            scored = [
+                (score, i)
+                for i, count in shared.items()
+                if (score := self._dice(query, query_size, i, count)) >= FUZZY_THRESHOLD
+            ]
+        else:
+            scored = []
+        scored.sort(key=lambda item: (-item[0], self.terms[item[1]]))
+        return [self.terms[term_id] for _, term_id in scored[:limit]]
+
+    def to_dict(self) -> dict:
+        return {"gram_size": GRAM_SIZE, "terms": self.terms, "postings": self.postings}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TermIndex":
+        if data.get("gram_size") != GRAM_SIZE:
+            return cls(data["terms"])  # Stale layout: rebuild
+        return cls(data["terms"], data["postings"])
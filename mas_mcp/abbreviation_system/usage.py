@@ -0,0 +1,253 @@
+"""
+Usage Index — Where Abbreviations Occur in the SSOT
+===================================================
+
+Built from one tokenization pass over the SSOT text, then queried per
+abbreviation without rescanning the document:
+
+- words: every `\\w+` token -> start offsets (the bare-word index)
+- backticks: every `` `ABBREV` `` span -> start offsets
+- parenthesized: every ``(`X`)`` span -> start offsets (any text, not just ABBREV shapes)
+- tier styles: Tier X / T-X / Tier-X notation -> line numbers
+- slash composites, notation-section headers and NOTATION GUIDE lines
+
+An abbreviation occurs wherever its text appears and is not glued to a
+longer word (the `\\b...\\b` rule). Its candidate offsets come from the word
+index entry for its first word, so a lookup costs as much as that word's
+occurrences - not a pass over the document. Backtick and parenthesized forms
+(`` `ASC` ``, ``(`ASC`)``) are occurrences of the same text and are told
+apart by the surrounding characters.
+
+Usage:
+    index = UsageIndex(ssot_content)
+    index.count("ASC")          # Number of occurrences
+    index.lines("ASC")          # Line numbers, ascending, unique
+    index.forms("ASC")          # {"bare": n, "backtick": n, "parenthesized": n}
+
+    # Indexes of consecutive pieces of a text combine without re-tokenizing
+    index = UsageIndex.join([UsageIndex(piece) for piece in pieces])
+"""
+
+import re
+from bisect import bisect_right
+from collections import defaultdict
+
+from .parser import _line_bounded
+
+WORD_PATTERN = re.compile(r"\w+")
+BACKTICK_PATTERN = re.compile(r"`([A-Z][A-Z0-9-]{1,10})`")
+PARENTHESIZED_PATTERN = re.compile(r"\(`([^`)\n]+)`\)")
+SLASH_COMPOSITE_PATTERN = re.compile(_line_bounded(r'\(\`([^`]+)\`/\`([^`]+)\`(?:/\`([^`]+)\`)?\)'))
+NOTATION_SECTION_PATTERN = re.compile(r'^###?[^\S\n]+\*\*([IVXLC]+(?:\.[0-9.]+)?)\.', re.MULTILINE)
+GUIDE_MARKER = "NOTATION GUIDE"
+
+
+class UsageIndex:
+    """Token offsets for one SSOT text, answering per-abbreviation usage queries."""
+
+    def __init__(self, content: str, tier_patterns: list[tuple[str, str]] | None = None):
+        """
+        Args:
+            content: Full text of the SSOT markdown file
+            tier_patterns: (regex, style name) pairs for tier notation styles
+        """
+        self.content = content
+        self._line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+        self._parts: list[tuple[int, UsageIndex]] = []  # (offset, index) of joined pieces
+        self._parts_by_word: dict[str, list[int]] | None = None
+
+        self._words: dict[str, list[int]] = defaultdict(list)
+        for match in WORD_PATTERN.finditer(content):
+            self._words[match.group()].append(match.start())
+
+        self.backticks: dict[str, list[int]] = defaultdict(list)
+        for match in BACKTICK_PATTERN.finditer(content):
+            self.backticks[match.group(1)].append(match.start())
+
+        self.parenthesized: dict[str, list[int]] = defaultdict(list)
+        for match in PARENTHESIZED_PATTERN.finditer(content):
+            self.parenthesized[match.group(1)].append(match.start())
+
+        styles = {}
+        for regex, style in tier_patterns or []:
+            lines = [self.line_of(m.start()) for m in re.finditer(_line_bounded(regex), content)]
+            styles[style] = sorted(set(lines))
+        self.tier_styles = self._by_first_use(styles)
+
+        self.slash_composites = sum(1 for _ in SLASH_COMPOSITE_PATTERN.finditer(content))
+        # Notation section headers (line, section number) and lines mentioning a notation guide
+        self.notation_sections: list[tuple[int, str]] = [
+            (self.line_of(m.start()), m.group(1)) for m in NOTATION_SECTION_PATTERN.finditer(content)
+        ]
+        upper = content.upper()  # Same lines as content; offsets may differ
+        guide_lines, line, scanned = set(), 1, 0
+        for match in re.finditer(GUIDE_MARKER, upper):
+            line += upper.count("\n", scanned, match.start())
+            scanned = match.start()
+            guide_lines.add(line)
+        self.guide_lines: list[int] = sorted(guide_lines)
+
+        self._occurrences: dict[str, list[int]] = {}
+
+    @classmethod
+    def join(cls, parts: list["UsageIndex"]) -> "UsageIndex":
+        """
+        Index of the concatenated texts of parts, built from their indexes.
+
+        Every part but the last must end with a newline (pieces cut at line
+        starts), so no token or occurrence spans two parts. Occurrence
+        lookups are answered by the parts that contain the abbreviation's
+        first word (and cached there); everything else is merged here.
+        """
+        index = cls("")
+        offset = 0
+        styles: dict[str, list[int]] = {}
+        for part in parts:
+            line_shift = len(index._line_starts) - 1
+            index._parts.append((offset, part))
+            index._line_starts.extend(start + offset for start in part._line_starts[1:])
+            for abbrev, offsets in part.backticks.items():
+                index.backticks[abbrev].extend(start + offset for start in offsets)
+            for text, offsets in part.parenthesized.items():
+                index.parenthesized[text].extend(start + offset for start in offsets)
+            for style, lines in part.tier_styles.items():
+                styles.setdefault(style, []).extend(line + line_shift for line in lines)
+            index.slash_composites += part.slash_composites
+            index.notation_sections.extend((line + line_shift, number) for line, number in part.notation_sections)
+            index.guide_lines.extend(line + line_shift for line in part.guide_lines)
+            offset += len(part.content)
+        index.content = "".join(part.content for part in parts)
+        index.tier_styles = index._by_first_use(styles)
+        return index
+
+    def to_dict(self) -> dict:
+        """Serializable index state, without the text itself (see from_dict())."""
+        return {
+            "words": self.words,
+            "backticks": self.backticks,
+            "parenthesized": self.parenthesized,
+            "tier_styles": self.tier_styles,
+            "slash_composites": self.slash_composites,
+            "notation_sections": self.notation_sections,
+            "guide_lines": self.guide_lines,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, content: str) -> "UsageIndex":
+        """Restore an index from to_dict() output and the text it was built from."""
+        index = cls("")
+        index.content = content
+        index._line_starts = [0] + [m.end() for m in re.finditer("\n", content)]
+        index._words.update(data["words"])
+        index.backticks.update(data["backticks"])
+        index.parenthesized.update(data["parenthesized"])
+        index.tier_styles = data["tier_styles"]
+        index.slash_composites = data["slash_composites"]
+        index.notation_sections = [(line, number) for line, number in data["notation_sections"]]
+        index.guide_lines = data["guide_lines"]
+        return index
+
+    def _by_first_use(self, styles: dict[str, list[int]]) -> dict[str, list[int]]:
+        """Styles in order of first use, as a line-by-line scan would discover them."""
+        never = len(self._line_starts) + 1
+        return dict(sorted(styles.items(), key=lambda item: item[1][0] if item[1] else never))
+
+    @property
+    def words(self) -> dict[str, list[int]]:
+        """Every `\\w+` token -> start offsets (merged from the parts on first use if joined)."""
+        if self._parts and not self._words:
+            for offset, part in self._parts:
+                for word, offsets in part.words.items():
+                    self._words[word].extend(start + offset for start in offsets)
+        return self._words
+
+    def _parts_with(self, word: str) -> list[tuple[int, "UsageIndex"]]:
+        """Joined parts whose text contains word (word -> part map built on first use)."""
+        if self._parts_by_word is None:
+            self._parts_by_word = defaultdict(list)
+            for position, (_, part) in enumerate(self._parts):
+                for token in part.words:
+                    self._parts_by_word[token].append(position)
+        return [self._parts[position] for position in self._parts_by_word.get(word, ())]
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number of a character offset."""
+        return bisect_right(self._line_starts, offset)
+
+    def occurrences(self, abbrev: str) -> list[int]:
+        """
+        Start offsets of non-overlapping occurrences of abbrev.
+
+        Same occurrences as `re.finditer(rf"\\b{re.escape(abbrev)}\\b", content)`
+        for abbreviations that start and end with a word character; for other
+        edges, only the word-character edges are boundary-checked.
+        """
+        if abbrev not in self._occurrences:
+            self._occurrences[abbrev] = self._find(abbrev)
+        return self._occurrences[abbrev]
+
+    def _find(self, abbrev: str) -> list[int]:
+        first_word = WORD_PATTERN.search(abbrev)
+        if self._parts and "\n" not in abbrev:
+            # Occurrences never cross a part boundary (a newline): reuse the parts' own
+            parts = self._parts_with(first_word.group()) if first_word else self._parts
+            return [start + offset for offset, part in parts for start in part.occurrences(abbrev)]
+
+        content = self.content
+        if first_word:
+            shift = first_word.start()
+            candidates = [offset - shift for offset in self.words.get(first_word.group(), ())]
+        else:
+            # No word characters (e.g. an emoji): plain substring search
+            candidates = []
+            offset = content.find(abbrev)
+            while offset >= 0:
+                candidates.append(offset)
+                offset = content.find(abbrev, offset + 1)
+
+        check_before = bool(abbrev) and WORD_PATTERN.match(abbrev[0]) is not None
+        check_after = bool(abbrev) and WORD_PATTERN.match(abbrev[-1]) is not None
+
+        found = []
+        resume = 0
+        for start in candidates:
+            end = start + len(abbrev)
+            if start < resume or not content.startswith(abbrev, start):
+                continue
+            if check_before and start > 0 and WORD_PATTERN.match(content[start - 1]):
+                continue
+            if check_after and end < len(content) and WORD_PATTERN.match(content[end]):
+                continue
+            found.append(start)
+            resume = end
+        return found
+
+    def count(self, abbrev: str) -> int:
+        """Number of occurrences of abbrev (any form)."""
+        return len(self.occurrences(abbrev))
+
+    def lines(self, abbrev: str) -> list[int]:
+        """Line numbers where abbrev occurs, ascending and unique."""
+        return sorted({self.line_of(offset) for offset in self.occurrences(abbrev)})
+
+    def forms(self, abbrev: str) -> dict[str, int]:
+        """Occurrence counts split into bare, backtick and parenthesized forms."""
+        content = self.content
+        counts = {"bare": 0, "backtick": 0, "parenthesized": 0}
+        for start in self.occurrences(abbrev):
+            end = start + len(abbrev)
+            if start >= 2 and content.startswith("(`", start - 2) and content.startswith("`)", end):
+                counts["parenthesized"] += 1
+            elif start >= 1 and content.startswith("`", start - 1) and content.startswith("`", end):
+                counts["backtick"] += 1
+            else:
+                counts["bare"] += 1
+        return counts
+
+    def backtick_lines(self, abbrev: str) -> list[int]:
+        """Line numbers of `` `abbrev` `` spans found by the backtick scan."""
+        return sorted({self.line_of(offset) for offset in self.backticks.get(abbrev, ())})
+
+    def usage(self, abbrevs: list[str]) -> dict[str, list[int]]:
+        """abbrev -> usage line numbers, for feeding AbbreviationRegistry.record_usage()."""
+        return {abbrev: self.lines(abbrev) for abbrev in abbrevs}
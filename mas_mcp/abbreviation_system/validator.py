@@ -12,14 +12,18 @@ Analyzes the abbreviation registry and SSOT content to detect:
 - Pattern mismatches
 
 Produces ConsistencyIssue objects that can be reported or auto-fixed.
+Checks that read the SSOT text (orphans, undefined usages, slash overload,
+tier notation, notation guides) are answered from one UsageIndex built per
+validation run, so their cost does not grow with the number of registered
+abbreviations.
 
 Usage:
     validator = ConsistencyValidator(registry)
     issues = validator.validate_all(ssot_content)
+    issues = validator.validate_index(usage_index)  # Prebuilt (e.g. joined) index
 """
 
-import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from difflib import SequenceMatcher
 
 from .models import (
@@ -29,6 +33,91 @@ from .models import (
     IssueSeverity,
 )
 from .registry import AbbreviationRegistry
+from .usage import UsageIndex
+
+
+def _min_matches(total: int) -> int:
+    """Fewest matching characters for SequenceMatcher.ratio() > 0.8 at len(a) + len(b) == total."""
+    return 2 * total // 5 + 1
+
+
+def _within_indel_distance(a: str, b: str, limit: int) -> bool:
+    """True if a becomes b with at most `limit` single-character insertions/deletions."""
+    if limit < 0 or abs(len(a) - len(b)) > limit:
+        return False
+    over = limit + 1
+    prev = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        cur = [over] * (len(b) + 1)
+        if i <= limit:
+            cur[0] = i
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            if a[i - 1] == b[j - 1]:
+                cur[j] = prev[j - 1]
+            else:
+                cur[j] = min(prev[j], cur[j - 1], limit) + 1
+        if min(cur) > limit:
+            return False
+        prev = cur
+    return prev[-1] <= limit
+
+
+def _fuzzy_candidates(abbrevs: list[str]) -> list[tuple[str, str]]:
+    """
+    Pairs (a1, a2), a1 < a2, that can reach SequenceMatcher ratio > 0.8 (lowercased).
+
+    Lossless: every filter is an upper bound on the ratio 2*M/T, where M is
+    the number of matched characters and T the combined length.
+
+    1. Blocking by prefix filtering on character-occurrence tokens ("s#0",
+       "s#1", ...): M needs at least _min_matches(T) shared tokens, so any
+       qualifying pair shares one of the rarest few tokens of each string.
+    2. Length: M <= min(len(a), len(b)); postings are kept per string
+       length, so partners of a failing length are never looked up.
+    3. Character multiset overlap: M <= |a & b|.
+    4. Bounded indel distance: matched blocks form a common subsequence, so
+       len(a) + len(b) - 2*M bounds the insert/delete distance from above.
+
+    Pairs come back in the order a nested loop over abbrevs would visit them.
+    """
+    lowered = [abbrev.lower() for abbrev in abbrevs]
+    counts = [Counter(text) for text in lowered]
+    tokens = [[(char, n) for char, total in count.items() for n in range(total)] for count in counts]
+    token_sets = [frozenset(string_tokens) for string_tokens in tokens]  # |a & b| of the multisets
+    frequency = Counter(token for string_tokens in tokens for token in string_tokens)
+
+    # (token, string length) -> strings with the token in their prefix
+    postings: dict[tuple[tuple[str, int], int], list[int]] = defaultdict(list)
+    pairs = []
+    for i, string_tokens in enumerate(tokens):
+        size = len(string_tokens)
+        ordered = sorted(string_tokens, key=lambda t: (frequency[t], t))
+
+        # Only partner lengths that pass the length bound, each with its own prefix
+        blocked: set[int] = set()
+        for length in range(1, 2 * size + 1):
+            need = _min_matches(size + length)
+            if min(size, length) < need:
+                continue
+            for token in ordered[:size - need + 1]:
+                blocked.update(postings.get((token, length), ()))
+
+        # Shortest partner that passes the length bound -> fewest shared tokens needed
+        shortest_partner = 2 * size // 3 + 1
+        for token in ordered[:max(size - _min_matches(size + shortest_partner) + 1, 0)]:
+            postings[(token, size)].append(i)
+
+        # Filter this string's candidates now, so only passing pairs are ever held
+        for j in blocked:
+            total = size + len(lowered[j])
+            need = _min_matches(total)
+            if len(token_sets[i] & token_sets[j]) < need:
+                continue
+            if not _within_indel_distance(lowered[i], lowered[j], total - 2 * need):
+                continue
+            pairs.append((i, j) if abbrevs[i] < abbrevs[j] else (j, i))
+
+    return [(abbrevs[i], abbrevs[j]) for i, j in sorted(pairs)]
 
 
 class ConsistencyValidator:
@@ -74,6 +163,18 @@ class ConsistencyValidator:
         Args:
             content: Full text of the SSOT markdown file
 
+        Returns:
+            List of detected ConsistencyIssue objects
+        """
+        return self.validate_index(UsageIndex(content, self.TIER_PATTERNS))
+
+    def validate_index(self, index: UsageIndex) -> list[ConsistencyIssue]:
+        """
+        Run all validation checks against a usage index of the SSOT content.
+
+        Args:
+            index: UsageIndex built with TIER_PATTERNS (or joined from such indexes)
+
         Returns:
             List of detected ConsistencyIssue objects
         """
@@ -84,11 +185,11 @@ class ConsistencyValidator:
         self._check_duplicates()
         self._check_spelling_variants()
         self._check_excessive_length()
-        self._check_orphans(content)
-        self._check_undefined_usages(content)
-        self._check_semantic_overloading(content)
-        self._check_tier_notation(content)
-        self._check_notation_guides(content)
+        self._check_orphans(index)
+        self._check_undefined_usages(index)
+        self._check_semantic_overloading(index)
+        self._check_tier_notation(index)
+        self._check_notation_guides(index)
         self._check_redundant_compounds()
 
         return self._issues
@@ -154,43 +255,45 @@ class ConsistencyValidator:
         # Also check for similar abbreviations that might be variants
         self._check_fuzzy_variants(all_abbrevs)
 
-    def _check_fuzzy_variants(self, abbrevs: list[str]) -> None:
-        """Find potentially related abbreviations via fuzzy matching."""
-        checked = set()
-
-        for a1 in abbrevs:
-            for a2 in abbrevs:
-                if a1 >= a2:  # Avoid duplicate comparisons
-                    continue
-                pair = (a1, a2)
-                if pair in checked:
-                    continue
-                checked.add(pair)
-
-                # Calculate similarity
-                similarity = SequenceMatcher(None, a1.lower(), a2.lower()).ratio()
-
-                # Flag if very similar (>80%) but not identical
-                if 0.8 < similarity < 1.0:
-                    entry1 = self.registry.lookup(a1)
-                    entry2 = self.registry.lookup(a2)
-
-                    # Check if they might mean the same thing
-                    if entry1 and entry2 and entry1.full_term and entry2.full_term:
-                        term_similarity = SequenceMatcher(
-                            None,
-                            entry1.full_term.lower(),
-                            entry2.full_term.lower()
-                        ).ratio()
-
-                        if term_similarity > 0.7:
-                            self._add_issue(
-                                severity=IssueSeverity.INFO,
-                                category=IssueCategory.SPELLING_VARIANT,
-                                description=f"Potentially related abbreviations: '{a1}' and '{a2}'",
-                                affected=[e for e in [entry1, entry2] if e],
-                                recommendation="Review if these should be unified",
-                            )
+    def _check_fuzzy_variants(self, abbrevs: list[str], blocked: bool = True) -> None:
+        """
+        Find potentially related abbreviations via fuzzy matching.
+
+        Args:
+            abbrevs: Abbreviations to compare pairwise
+            blocked: Only score candidate pairs from _fuzzy_candidates() (same
+                result as comparing every pair, which blocked=False does)
+        """
+        if blocked:
+            pairs = _fuzzy_candidates(abbrevs)
+        else:
+            pairs = [(a1, a2) for a1 in abbrevs for a2 in abbrevs if a1 < a2]
+
+        for a1, a2 in pairs:
+            # Calculate similarity
+            similarity = SequenceMatcher(None, a1.lower(), a2.lower()).ratio()
+
+            # Flag if very similar (>80%) but not identical
+            if 0.8 < similarity < 1.0:
+                entry1 = self.registry.lookup(a1)
+                entry2 = self.registry.lookup(a2)
+
+                # Check if they might mean the same thing
+                if entry1 and entry2 and entry1.full_term and entry2.full_term:
+                    term_similarity = SequenceMatcher(
+                        None,
+                        entry1.full_term.lower(),
+                        entry2.full_term.lower()
+                    ).ratio()
+
+                    if term_similarity > 0.7:
+                        self._add_issue(
+                            severity=IssueSeverity.INFO,
+                            category=IssueCategory.SPELLING_VARIANT,
+                            description=f"Potentially related abbreviations: '{a1}' and '{a2}'",
+                            affected=[e for e in [entry1, entry2] if e],
+                            recommendation="Review if these should be unified",
+                        )
 
     def _check_excessive_length(self) -> None:
         """Flag abbreviations that are too long."""
@@ -209,21 +312,14 @@ class ConsistencyValidator:
                     recommendation=f"Shorten to ≤{self.MAX_ABBREV_LENGTH} chars or create alias",
                 )
 
-    def _check_orphans(self, content: str) -> None:
+    def _check_orphans(self, index: UsageIndex) -> None:
         """Find abbreviations that are defined but rarely/never used."""
-        # Count all occurrences of each abbreviation
-        usage_counts: dict[str, int] = defaultdict(int)
-
-        for abbrev in self.registry.all_abbreviations():
-            # Escape for regex
-            escaped = re.escape(abbrev)
-            # Count occurrences (whole word only)
-            pattern = rf'\b{escaped}\b|`{escaped}`|\(\`{escaped}\`\)'
-            matches = re.findall(pattern, content)
-            usage_counts[abbrev] = len(matches)
+        abbrevs = self.registry.all_abbreviations()
+        self.registry.record_usage(index.usage(abbrevs))
 
         # Flag those with very low usage
-        for abbrev, count in usage_counts.items():
+        for abbrev in abbrevs:
+            count = index.count(abbrev)
             if count <= 1:
                 entry = self.registry.lookup(abbrev)
                 self._add_issue(
@@ -234,65 +330,42 @@ class ConsistencyValidator:
                     recommendation="Consider removing if truly unused, or add more references",
                 )
 
-    def _check_undefined_usages(self, content: str) -> None:
+    def _check_undefined_usages(self, index: UsageIndex) -> None:
         """Find abbreviations used but not formally defined."""
-        # Look for backtick abbreviations in content
-        pattern = r'`([A-Z][A-Z0-9-]{1,10})`'
-        matches = re.findall(pattern, content)
-
-        undefined = set()
-        for match in matches:
-            if not self.registry.lookup(match):
-                undefined.add(match)
+        # Backtick abbreviations in content, in order of first use
+        undefined = [abbrev for abbrev in index.backticks if not self.registry.lookup(abbrev)]
 
         for abbrev in undefined:
-            # Find line numbers where it appears
-            lines = []
-            for i, line in enumerate(content.split("\n"), 1):
-                if f"`{abbrev}`" in line:
-                    lines.append(i)
-                    if len(lines) >= 3:  # Cap at 3 examples
-                        break
-
             self._add_issue(
                 severity=IssueSeverity.WARNING,
                 category=IssueCategory.MISSING_DEFINITION,
                 description=f"Abbreviation '{abbrev}' is used but not defined in registry",
-                lines=lines,
+                lines=index.backtick_lines(abbrev)[:3],  # Cap at 3 examples
                 recommendation="Add formal definition or register in known definitions",
             )
 
-    def _check_semantic_overloading(self, content: str) -> None:
+    def _check_semantic_overloading(self, index: UsageIndex) -> None:
         """
         Check for slash (/) being used for both OR and AND semantics.
 
         OR usage: (`A`/`B`) meaning "A or B, they're alternatives"
         AND usage: (`A`/`B`) meaning "A combined with B"
         """
-        # Find all slash-separated patterns
-        pattern = r'\(\`([^`]+)\`/\`([^`]+)\`(?:/\`([^`]+)\`)?\)'
-        matches = list(re.finditer(pattern, content))
+        # Slash-separated patterns: (`A`/`B`) or (`A`/`B`/`C`)
+        count = index.slash_composites
 
-        if len(matches) > 5:  # Arbitrary threshold for "overuse"
+        if count > 5:  # Arbitrary threshold for "overuse"
             self._add_issue(
                 severity=IssueSeverity.WARNING,
                 category=IssueCategory.SEMANTIC_OVERLOAD,
-                description=f"Slash (/) operator used {len(matches)} times with potentially mixed semantics",
+                description=f"Slash (/) operator used {count} times with potentially mixed semantics",
                 recommendation="Use / for alternatives only; use + or × for compounds",
             )
 
-    def _check_tier_notation(self, content: str) -> None:
+    def _check_tier_notation(self, index: UsageIndex) -> None:
         """Check for inconsistent tier notation (Tier X vs T-X vs Tier-X)."""
-        tier_usages: dict[str, list[int]] = defaultdict(list)
-
-        lines = content.split("\n")
-        for i, line in enumerate(lines, 1):
-            for pattern, pattern_name in self.TIER_PATTERNS:
-                if re.search(pattern, line):
-                    tier_usages[pattern_name].append(i)
-
         # If multiple patterns used, flag inconsistency
-        used_patterns = [p for p, lines in tier_usages.items() if lines]
+        used_patterns = [p for p, lines in index.tier_styles.items() if lines]
         if len(used_patterns) > 1:
             self._add_issue(
                 severity=IssueSeverity.WARNING,
@@ -301,26 +374,22 @@ class ConsistencyValidator:
                 recommendation="Standardize on 'Tier X' (readable) or 'T-X' (compact), not both",
             )
 
-    def _check_notation_guides(self, content: str) -> None:
+    def _check_notation_guides(self, index: UsageIndex) -> None:
         """Check which sections have notation guides."""
-        # Find section headers
-        section_pattern = r'^###?\s+\*\*([IVXLC]+(?:\.[0-9.]+)?)\.'
-        guide_pattern = r'NOTATION GUIDE'
-
-        lines = content.split("\n")
         sections_found = []
         sections_with_guides = []
 
+        # Walk headers and guide mentions in line order; a header line counts first
+        events = sorted(
+            [(line, 0, number) for line, number in index.notation_sections]
+            + [(line, 1, "") for line in index.guide_lines]
+        )
         current_section = None
-        for _i, line in enumerate(lines, 1):
-            # Check for section header
-            match = re.search(section_pattern, line)
-            if match:
-                current_section = match.group(1)
+        for _line, is_guide, number in events:
+            if not is_guide:
+                current_section = number
                 sections_found.append(current_section)
-
-            # Check for notation guide
-            if guide_pattern in line.upper() and current_section:
+            elif current_section:
                 sections_with_guides.append(current_section)
 
         # Find sections missing guides
@@ -0,0 +1,251 @@
+"""
+🗄️ Memory-Mapped Feature Store for Batch Scoring
+
+On-disk format for large scoring jobs, so vectors never pass through JSON or
+per-entity Python dicts:
+
+    <store>/
+      vectors.npy   float32 (N, D), C-contiguous - memory-mapped read-only
+      ids.npy       unicode (N,) fixed-width entity ids - memory-mapped
+      meta.json     {"format", "version", "count", "dim", "source", "created"}
+
+A bare ``vectors.npy`` file is also accepted; ids then default to ``e{i}``.
+mas_gpu_batch_score(feature_store=...) streams tiles straight from the
+mapped buffer.
+
+Writers:
+    write_feature_store()        - from in-memory arrays
+    entities_to_feature_store()  - from entity dicts (name/whr/tier/cup/...)
+    genesis_to_feature_store()   - from genesis_artifacts/*/*/entity.json
+    MILFGenesisEngineV2.write_feature_store() - from a live genesis session
+
+Usage:
+    python feature_store.py genesis --out genesis_features
+    python feature_store.py info genesis_features
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger("mas.feature_store")
+
+FEATURE_STORE_FORMAT = "mas-feature-store"
+FEATURE_STORE_VERSION = "1.0"
+
+VECTORS_FILE = "vectors.npy"
+IDS_FILE = "ids.npy"
+META_FILE = "meta.json"
+
+DEFAULT_GENESIS_DIR = Path(__file__).parent / "genesis_artifacts"
+
+
+class SyntheticIds:
+    """Lazy ``e{i}`` id column for stores written without ids."""
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, window: slice) -> list:
+        return [f"e{i}" for i in range(*window.indices(self.count))]
+
+
+@dataclass
+class FeatureStore:
+    """An opened (memory-mapped) feature store."""
+    path: Path
+    vectors: np.ndarray                  # (N, D) float32 memmap
+    ids: Optional[np.ndarray] = None     # (N,) unicode memmap, None = synthetic ids
+    meta: dict = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    @property
+    def id_column(self) -> Union[np.ndarray, SyntheticIds]:
+        """Sliceable id column; slicing materializes only the requested window."""
+        return self.ids if self.ids is not None else SyntheticIds(len(self))
+
+
+def open_feature_store(path: Union[str, Path]) -> FeatureStore:
+    """
+    Memory-map a feature store directory (or a bare vectors .npy file).
+
+    Raises:
+        FileNotFoundError: if the store or its vectors file is missing
+        ValueError: if the vectors are not a 2-D float32 array or ids mismatch
+    """
+    path = Path(path)
+    if path.is_dir():
+        vectors_path = path / VECTORS_FILE
+        ids_path = path / IDS_FILE
+        meta_path = path / META_FILE
+    else:
+        vectors_path, ids_path, meta_path = path, None, None
+
+    if not vectors_path.exists():
+        raise FileNotFoundError(f"Feature store vectors not found: {vectors_path}")
+
+    vectors = np.load(vectors_path, mmap_mode="r")
+    if vectors.ndim != 2 or vectors.dtype != np.float32:
+        raise ValueError(
+            f"Feature store vectors must be 2-D float32, got {vectors.ndim}-D {vectors.dtype}"
+        )
+
+    ids = None
+    if ids_path is not None and ids_path.exists():
+        ids = np.load(ids_path, mmap_mode="r")
+        if ids.shape != (vectors.shape[0],):
+            raise ValueError(f"ids shape {ids.shape} does not match {vectors.shape[0]} vectors")
+
+    meta = {}
+    if meta_path is not None and meta_path.exists():
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+
+    return FeatureStore(path=path, vectors=vectors, ids=ids, meta=meta)
+
+
+def write_feature_store(
+    path: Union[str, Path],
+    vectors: np.ndarray,
+    ids: Optional[Iterable[str]] = None,
+    source: str = "",
+    extra_meta: Optional[dict] = None
+) -> Path:
+    """
+    Write vectors (and optional ids) as a feature store directory.
+
+    Files are written to temporaries and moved into place, so readers never
+    map a half-written array.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    if vectors.ndim != 2:
+        raise ValueError(f"vectors must be 2-D, got shape {vectors.shape}")
+
+    def save_atomic(name: str, arr: np.ndarray) -> None:
+        tmp = path / (name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, arr)
+        os.replace(tmp, path / name)
+
+    save_atomic(VECTORS_FILE, vectors)
+    if ids is not None:
+        id_arr = np.asarray(list(ids), dtype=np.str_)
+        if id_arr.shape != (vectors.shape[0],):
+            raise ValueError(f"{id_arr.shape[0]} ids for {vectors.shape[0]} vectors")
+        save_atomic(IDS_FILE, id_arr)
+
+    meta = {
+        "format": FEATURE_STORE_FORMAT,
+        "version": FEATURE_STORE_VERSION,
+        "count": int(vectors.shape[0]),
+        "dim": int(vectors.shape[1]),
+        "source": source,
+        "created": datetime.now().isoformat(),
+        **(extra_meta or {}),
+    }
+    tmp = path / (META_FILE + ".tmp")
+    tmp.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    os.replace(tmp, path / META_FILE)
+
+    logger.info(f"Feature store written: {path} ({meta['count']} x {meta['dim']})")
+    return path
+
+
+def entities_to_feature_store(
+    path: Union[str, Path],
+    entities: list[dict],
+    source: str = "entities"
+) -> Path:
+    """
+    Convert entity attribute dicts (name, whr, tier, cup, measurements) with
+    the same feature mapping as mas_gpu_batch_score and write a store.
+    """
+    from gpu_orchestrator import _entity_to_vector
+
+    vectors = np.empty((len(entities), 6), dtype=np.float32)
+    for i, e in enumerate(entities):
+        vectors[i] = _entity_to_vector(
+            e.get("name", ""),
+            e.get("whr"),
+            e.get("tier"),
+            e.get("cup"),
+            e.get("measurements"),
+        )
+    ids = [e.get("name") or f"e{i}" for i, e in enumerate(entities)]
+    return write_feature_store(path, vectors, ids, source=source)
+
+
+def genesis_entity_record(entity: dict) -> dict:
+    """Map a genesis entity.json onto the scoring attribute schema."""
+    physique = entity.get("physique", {})
+    bust, waist, hips = (physique.get(k) for k in ("bust_cm", "waist_cm", "hip_cm"))
+    return {
+        "name": entity.get("genesis_hash") or entity.get("name", ""),
+        "whr": entity.get("whr"),
+        "tier": entity.get("tier"),
+        "cup": physique.get("cup_size"),
+        "measurements": f"B{bust}/W{waist}/H{hips}" if bust and waist and hips else None,
+    }
+
+
+def genesis_to_feature_store(
+    path: Union[str, Path],
+    artifacts_dir: Path = DEFAULT_GENESIS_DIR
+) -> Path:
+    """Collect every genesis artifact's entity.json into one feature store."""
+    records = []
+    for entity_path in sorted(artifacts_dir.glob("*/*/entity.json")):
+        try:
+            records.append(genesis_entity_record(json.loads(entity_path.read_text(encoding="utf-8"))))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Skipping unreadable genesis artifact {entity_path}: {e}")
+
+    return entities_to_feature_store(path, records, source=f"genesis:{artifacts_dir}")
+
+
+def main() -> int:
+    """CLI entry point for building and inspecting feature stores."""
+    parser = argparse.ArgumentParser(description="MAS-MCP feature store tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    genesis = sub.add_parser("genesis", help="Build a store from genesis artifacts")
+    genesis.add_argument("--artifacts", type=Path, default=DEFAULT_GENESIS_DIR,
+                         help="Genesis artifact directory")
+    genesis.add_argument("--out", type=Path, required=True, help="Output store directory")
+
+    info = sub.add_parser("info", help="Show store metadata")
+    info.add_argument("store", type=Path)
+
+    args = parser.parse_args()
+
+    if args.command == "genesis":
+        path = genesis_to_feature_store(args.out, args.artifacts)
+        store = open_feature_store(path)
+        print(f"💾 {len(store)} genesis entities → {path}")
+    else:
+        store = open_feature_store(args.store)
+        print(json.dumps({**store.meta, "count": len(store), "dim": store.dim}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -28,6 +28,13 @@ class GPUBackend(Enum):
     VULKAN = auto()     # PyVulkan (cross-vendor)
 
 
+class CPUBackend(Enum):
+    """CPU scoring backends, used when no GPU backend is active."""
+    NUMPY = auto()      # Single-threaded NumPy reference (authoritative)
+    THREADS = auto()    # Thread pool over row blocks (BLAS releases the GIL)
+    NUMBA = auto()      # Numba prange kernels (gpu-fallback extra)
+
+
 @dataclass
 class GPUCapabilities:
     """Detected GPU capabilities and limits."""
@@ -83,6 +90,10 @@ class GPUConfig:
     auto_fallback: bool = True  # Fall back to CPU on GPU errors
     max_gpu_errors_before_disable: int = 3
     
+    # Multi-core CPU scoring when no GPU is available
+    cpu_parallel: bool = True
+    cpu_workers: int = 0  # 0 = os.cpu_count()
+    
     # Paths
     cache_dir: Path = field(default_factory=lambda: Path("mas_cache"))
     
@@ -174,6 +185,39 @@ def detect_gpu_capabilities() -> GPUCapabilities:
     return caps
 
 
+_cpu_backend: Optional[CPUBackend] = None
+
+
+def detect_cpu_backend() -> CPUBackend:
+    """Detect the fastest available CPU scoring backend."""
+    global _cpu_backend
+    
+    if _cpu_backend is not None:
+        return _cpu_backend
+    
+    try:
+        import numba  # noqa: F401
+        _cpu_backend = CPUBackend.NUMBA
+        logger.info(f"Numba {numba.__version__} available for parallel CPU scoring")
+    except ImportError:
+        logger.debug("Numba not available, using threaded CPU scoring")
+        _cpu_backend = CPUBackend.THREADS if (os.cpu_count() or 1) > 1 else CPUBackend.NUMPY
+    
+    return _cpu_backend
+
+
+def get_cpu_backend() -> CPUBackend:
+    """CPU scoring backend honoring the cpu_parallel toggle."""
+    if not get_config().cpu_parallel:
+        return CPUBackend.NUMPY
+    return detect_cpu_backend()
+
+
+def cpu_worker_count() -> int:
+    """Number of CPU workers for parallel scoring."""
+    return get_config().cpu_workers or os.cpu_count() or 1
+
+
 def get_config() -> GPUConfig:
     """Get or create the global GPU configuration."""
     global _config
@@ -313,6 +313,9 @@ def apply_preset(name: str) -> GPUConfig:
 # Windows TDR kills GPU kernels running >2 seconds. Tile workloads to stay safe.
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import hashlib
+import json
+import platform
 import time
 import numpy as np
 from typing import Iterator, TypeVar, Generic
@@ -340,6 +343,109 @@ class TileMetrics:
         return (self.total_items / self.total_ms * 1000) if self.total_ms > 0 else 0.0
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# TILE PROFILES - Autotuned tile sizes persisted per host (see scripts/autotune_tiles.py)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+TILE_PROFILE_PATH = Path(
+    os.environ.get("MAS_TILE_PROFILES", Path(__file__).parent / "artifacts" / "tile_profiles.json")
+)
+
+_tile_profile_cache: Optional[dict] = None
+
+
+def hardware_fingerprint(caps: Optional[GPUCapabilities] = None) -> tuple[str, dict]:
+    """
+    Stable (key, descriptor) pair identifying this host's compute hardware.
+    
+    Built from the detected GPU capabilities plus CPU identity, so the same
+    machine maps to the same profile across processes and restarts.
+    """
+    caps = caps or get_capabilities()
+    descriptor = {
+        "backend": caps.backend.name,
+        "device_name": caps.device_name,
+        "compute_capability": list(caps.compute_capability),
+        "total_memory_gb": round(caps.total_memory_gb, 1),
+        "cpu": platform.processor() or platform.machine(),
+        "cpu_threads": os.cpu_count() or 1,
+        "os": platform.system(),
+    }
+    digest = hashlib.sha256(json.dumps(descriptor, sort_keys=True).encode()).hexdigest()
+    return digest[:16], descriptor
+
+
+def _read_tile_profiles(path: Path) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable tile profile {path}: {e}")
+        return {}
+
+
+def load_tile_profile(path: Optional[Path] = None, refresh: bool = False) -> dict[str, int]:
+    """
+    Tuned tile sizes ({mode: size}) for this host, or {} if never autotuned.
+    
+    The default profile file is read once per process.
+    """
+    global _tile_profile_cache
+    if path is None and _tile_profile_cache is not None and not refresh:
+        return _tile_profile_cache
+    
+    key, _ = hardware_fingerprint()
+    host = _read_tile_profiles(path or TILE_PROFILE_PATH).get("hosts", {}).get(key, {})
+    sizes = {
+        mode: int(size)
+        for mode, size in host.get("tile_sizes", {}).items()
+        if isinstance(size, (int, float)) and size > 0
+    }
+    if path is None:
+        _tile_profile_cache = sizes
+        if sizes:
+            logger.info(f"Loaded tuned tile sizes for host {key}: {sizes}")
+    return sizes
+
+
+def save_tile_profile(
+    tile_sizes: dict[str, int],
+    sweeps: Optional[dict] = None,
+    path: Optional[Path] = None,
+    extra_hardware: Optional[dict] = None
+) -> Path:
+    """Merge this host's tuned tile sizes into the profile file."""
+    from datetime import datetime
+    
+    global _tile_profile_cache
+    path = path or TILE_PROFILE_PATH
+    key, descriptor = hardware_fingerprint()
+    if extra_hardware:
+        descriptor = {**descriptor, "probe": extra_hardware}
+    
+    profiles = _read_tile_profiles(path)
+    profiles.setdefault("profiles_version", "1.0.0")
+    host = profiles.setdefault("hosts", {}).setdefault(key, {})
+    host["hardware"] = descriptor
+    host["tuned_at"] = datetime.now().isoformat()
+    host["max_tile_ms"] = TiledBatchProcessor.MAX_TILE_MS
+    host.setdefault("tile_sizes", {}).update(tile_sizes)
+    if sweeps:
+        host.setdefault("sweeps", {}).update(sweeps)
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(profiles, f, indent=2)
+    os.replace(tmp, path)
+    
+    if path == TILE_PROFILE_PATH:
+        _tile_profile_cache = None
+    return path
+
+
 class TiledBatchProcessor:
     """
     Automatic tiling for GPU workloads to prevent TDR timeouts.
@@ -363,6 +469,13 @@ class TiledBatchProcessor:
     # Minimum tile size (below this, just run CPU)
     MIN_TILE_SIZE = 100
     
+    # AIMD growth: tiles finishing under this fraction of MAX_TILE_MS grow
+    # additively by GROWTH_STEP (fraction of the starting size), capped at
+    # MAX_GROWTH x the starting size
+    GROW_BELOW = 0.5
+    GROWTH_STEP = 0.1
+    MAX_GROWTH = 8
+    
     def __init__(
         self,
         tile_size: Optional[int] = None,
@@ -373,11 +486,16 @@ class TiledBatchProcessor:
         Args:
             tile_size: Items per tile (auto if None)
             mode: 'score', 'hierarchy', or 'edges' - affects defaults
-            adaptive: If True, shrink tile size when tiles run slow
+            adaptive: If True, resize tiles (AIMD) toward MAX_TILE_MS
         """
         self.mode = mode
         self.adaptive = adaptive
-        self._tile_size = tile_size or self.DEFAULT_TILE_SIZES.get(mode, 5000)
+        self._tile_size = (
+            tile_size
+            or load_tile_profile().get(mode)
+            or self.DEFAULT_TILE_SIZES.get(mode, 5000)
+        )
+        self._base_tile_size = self._tile_size
         self._last_metrics: Optional[TileMetrics] = None
         
     @property
@@ -404,7 +522,12 @@ class TiledBatchProcessor:
             yield i // size, arr[i:i + size]
     
     def adapt_tile_size(self, tile_ms: float):
-        """Shrink tile size if a tile ran too slow."""
+        """
+        AIMD tile sizing toward MAX_TILE_MS.
+        
+        Slow tiles shrink multiplicatively (by the overage ratio); fast tiles
+        grow additively so a transient stall does not pin the size low forever.
+        """
         if not self.adaptive:
             return
         
@@ -417,18 +540,26 @@ class TiledBatchProcessor:
                 f"Tile took {tile_ms:.0f}ms (>{self.MAX_TILE_MS}ms), "
                 f"shrinking tile size to {self._tile_size}"
             )
+        elif tile_ms < self.MAX_TILE_MS * self.GROW_BELOW:
+            step = max(self.MIN_TILE_SIZE, int(self._base_tile_size * self.GROWTH_STEP))
+            ceiling = self._base_tile_size * self.MAX_GROWTH
+            new_size = min(ceiling, self._tile_size + step)
+            if new_size != self._tile_size:
+                self._tile_size = new_size
+                logger.debug(f"Tile took {tile_ms:.0f}ms, growing tile size to {new_size}")
     
     def record_metrics(
         self,
         total_items: int,
         tile_times: list[float],
-        backend: str
+        backend: str,
+        tile_size: Optional[int] = None
     ) -> TileMetrics:
-        """Record metrics from a tiled operation."""
+        """Record metrics from a tiled operation (tile_size: size used, default current)."""
         self._last_metrics = TileMetrics(
             total_items=total_items,
             tile_count=len(tile_times),
-            tile_size=self.tile_size,
+            tile_size=tile_size if tile_size is not None else self.tile_size,
             total_ms=sum(tile_times),
             tile_times_ms=tile_times,
             max_tile_ms=max(tile_times) if tile_times else 0.0,
@@ -441,18 +572,152 @@ class TiledBatchProcessor:
         return self._last_metrics
 
 
-# Global tiler instances for reuse
-_score_tiler = TiledBatchProcessor(mode='score')
-_hierarchy_tiler = TiledBatchProcessor(mode='hierarchy')
+class PipelinedTileExecutor:
+    """
+    Double-buffered tile pipeline on top of TiledBatchProcessor.
+    
+    While tile i computes on the calling thread, tile i+1 is staged on a
+    worker thread (host slice copied into an owned buffer, which faults in
+    memory-mapped pages off the compute thread, or host -> device copy on
+    a dedicated CUDA stream when CuPy is active) and the host copy-back of
+    tile i-1 is drained. Tile size adapts after every tile via the tiler's
+    AIMD rule; because tile i+1 is already staged, a resize lands on tile i+2.
+    
+    Usage:
+        executor = PipelinedTileExecutor(get_score_tiler())
+        for tile_idx, start, stop, result in executor.run(vectors, compute):
+            out[start:stop] = result
+    """
+    
+    def __init__(
+        self,
+        tiler: TiledBatchProcessor,
+        use_gpu: Optional[bool] = None,
+        adapt_in_flight: bool = True
+    ):
+        """
+        Args:
+            tiler: Supplies tile size and AIMD adaptation
+            use_gpu: Stage tiles on the device via CuPy streams (auto if None)
+            adapt_in_flight: Re-read the tile size for every tile. Disable to
+                keep the partition (and per-tile seeds) fixed within a run;
+                the tiler still learns for the next run.
+        """
+        self.tiler = tiler
+        self.adapt_in_flight = adapt_in_flight
+        self._cp = None
+        if use_gpu is None:
+            use_gpu = gpu_available() and get_capabilities().backend == GPUBackend.CUPY
+        if use_gpu:
+            try:
+                import cupy as cp
+                self._cp = cp
+                self._copy_stream = cp.cuda.Stream(non_blocking=True)
+            except ImportError:
+                logger.debug("CuPy not importable, pipelining on CPU threads")
+    
+    @property
+    def backend(self) -> str:
+        return "cupy_streams" if self._cp is not None else "cpu_threads"
+    
+    def _stage(self, tile: np.ndarray) -> Any:
+        """Prepare a tile for compute (runs on the worker thread)."""
+        if self._cp is None:
+            # A real copy: ascontiguousarray would return the (memmap) view
+            # unchanged and leave page faults to the compute thread
+            return np.array(tile, order="C", copy=True)
+        cp = self._cp
+        with self._copy_stream:
+            staged = cp.asarray(tile)
+        self._copy_stream.synchronize()
+        return staged
+    
+    def _fetch(self, result: Any) -> Any:
+        """Bring a compute result back to host memory (runs on the worker thread)."""
+        if self._cp is not None and isinstance(result, self._cp.ndarray):
+            return self._cp.asnumpy(result)
+        return result
+    
+    def run(
+        self,
+        arr: np.ndarray,
+        compute: Callable[[Any, int], Any]
+    ) -> Iterator[tuple[int, int, int, Any]]:
+        """
+        Yield (tile_index, start, stop, host_result) in tile order.
+        
+        Args:
+            arr: Array (or memmap) to tile along axis 0
+            compute: compute(staged_tile, tile_index) -> result
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        n = len(arr)
+        if n == 0:
+            return
+        
+        tile_times = []
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="mas-tile") as pool:
+            size = partition_size = self.tiler.tile_size
+            start, stop = 0, min(size, n)
+            staged_next = pool.submit(self._stage, arr[start:stop])
+            pending = None
+            tile_idx = 0
+            
+            while start < n:
+                staged = staged_next.result()
+                
+                # Prefetch tile i+1 while tile i computes
+                if stop < n:
+                    if self.adapt_in_flight:
+                        size = self.tiler.tile_size
+                        partition_size = max(partition_size, size)
+                    next_stop = min(stop + size, n)
+                    staged_next = pool.submit(self._stage, arr[stop:next_stop])
+                else:
+                    next_stop = n
+                
+                tile_t0 = time.perf_counter()
+                result = compute(staged, tile_idx)
+                tile_ms = (time.perf_counter() - tile_t0) * 1000
+                tile_times.append(tile_ms)
+                self.tiler.adapt_tile_size(tile_ms)
+                
+                fetched = pool.submit(self._fetch, result)
+                if pending is not None:
+                    p_idx, p_start, p_stop, p_future = pending
+                    yield p_idx, p_start, p_stop, p_future.result()
+                pending = (tile_idx, start, stop, fetched)
+                
+                tile_idx += 1
+                start, stop = stop, next_stop
+            
+            p_idx, p_start, p_stop, p_future = pending
+            yield p_idx, p_start, p_stop, p_future.result()
+        
+        # The tiler may have grown during the run; report the size tiles were cut at
+        self.tiler.record_metrics(n, tile_times, self.backend, tile_size=partition_size)
+
+
+# Global tiler instances for reuse (created on first use so the host's
+# tuned tile profile is applied)
+_score_tiler: Optional[TiledBatchProcessor] = None
+_hierarchy_tiler: Optional[TiledBatchProcessor] = None
 
 
 def get_score_tiler() -> TiledBatchProcessor:
     """Get the global score tiling processor."""
+    global _score_tiler
+    if _score_tiler is None:
+        _score_tiler = TiledBatchProcessor(mode='score')
     return _score_tiler
 
 
 def get_hierarchy_tiler() -> TiledBatchProcessor:
     """Get the global hierarchy tiling processor."""
+    global _hierarchy_tiler
+    if _hierarchy_tiler is None:
+        _hierarchy_tiler = TiledBatchProcessor(mode='hierarchy')
     return _hierarchy_tiler
 
 
@@ -583,35 +848,100 @@ def mas_gpu_score(
         }
 
 
+def _score_rows(
+    entity_ids: list,
+    novelty: np.ndarray,
+    redundancy: np.ndarray,
+    safety: np.ndarray,
+    overall: np.ndarray,
+    mask: np.ndarray,
+    start: int = 0,
+    stop: Optional[int] = None
+) -> list:
+    """Build per-entity score dicts for the ``[start, stop)`` slice only."""
+    window = slice(start, stop)
+    ids = entity_ids[window]
+    if isinstance(ids, np.ndarray):  # Memory-mapped feature store id column
+        ids = ids.tolist()
+    return [
+        {
+            "id": eid,
+            "novelty": nov,
+            "redundancy": red,
+            "safety": saf,
+            "overall": ovr,
+            "meets_thresholds": ok,
+        }
+        for eid, nov, red, saf, ovr, ok in zip(
+            ids,
+            novelty[window].tolist(),
+            redundancy[window].tolist(),
+            safety[window].tolist(),
+            overall[window].tolist(),
+            mask[window].tolist(),
+            strict=True,
+        )
+    ]
+
+
 def mas_gpu_batch_score(
-    entities: list,
+    entities: Optional[list] = None,
     seed: Optional[int] = None,
-    tile_size: Optional[int] = None
+    tile_size: Optional[int] = None,
+    layout: str = 'rows',
+    page: int = 0,
+    page_size: Optional[int] = None,
+    feature_store: Optional[str] = None,
+    output_path: Optional[str] = None
 ) -> dict:
     """
     🚀 Batch score multiple entities using GPU acceleration with automatic tiling.
     
     Tiling prevents GPU stalls by processing in safe chunks (<500ms per tile).
+    Tile results are written straight into preallocated float32 output arrays,
+    so no per-tile Python lists are built.
     
     Args:
         entities: List of dicts with keys: name, whr, tier, cup, measurements
                   OR list of dicts with keys: id, vec (raw vectors)
         seed: Optional random seed for reproducibility
         tile_size: Override tile size (default: 5000 vectors)
+        layout: 'rows' (per-entity dicts under "scores") or 'columnar'
+                (parallel arrays under "columns"; rows only when paged)
+        page: Zero-based page index for the row view
+        page_size: Rows per page. None returns every row in 'rows' layout
+                   and no rows in 'columnar' layout.
+        feature_store: Path to a feature store (see feature_store.py) used
+                       instead of entities. Vectors are memory-mapped and
+                       tiles stream straight from the mapped buffer.
+        output_path: Write the ids and score columns to this .npz file (suffix
+                     added if missing) instead of returning them inline (rows
+                     are still returned when paged).
     
     Returns:
         Batch results with individual scores and aggregate statistics.
     """
+    if layout not in ('rows', 'columnar'):
+        return {"error": f"Unknown layout: {layout}. Use 'rows' or 'columnar'", "count": 0}
+    
     config = get_config()
     seed = seed or config.seed
     
     t0 = time.perf_counter()
     
-    if not entities:
+    if feature_store:
+        from feature_store import open_feature_store
+        try:
+            store = open_feature_store(feature_store)
+        except (OSError, ValueError) as e:
+            return {"error": f"Cannot open feature store: {e}", "count": 0}
+        if len(store) == 0:
+            return {"error": "Feature store is empty", "count": 0}
+        vectors = store.vectors
+        entity_ids = store.id_column
+    elif not entities:
         return {"error": "No entities provided", "count": 0}
-    
-    # Check if raw vectors or entity dicts
-    if 'vec' in entities[0]:
+    elif 'vec' in entities[0]:
         # Raw vector mode (benchmark format)
         vectors = np.array([e['vec'] for e in entities], dtype=np.float32)
         entity_ids = [e.get('id', f'e{i}') for i, e in enumerate(entities)]
@@ -631,7 +961,7 @@ def mas_gpu_batch_score(
     
     # Generate reference set
     rng = np.random.default_rng(seed)
-    reference = rng.random((min(500, len(entities)), vectors.shape[1])).astype(np.float32)
+    reference = rng.random((min(500, len(vectors)), vectors.shape[1])).astype(np.float32)
     
     try:
         from gpu_scores import batch_score
@@ -643,68 +973,50 @@ def mas_gpu_batch_score(
             adaptive=True
         )
         
-        # Accumulate results across tiles
-        all_novelty = []
-        all_redundancy = []
-        all_safety = []
-        all_overall = []
-        tile_times = []
+        # Preallocated outputs, filled by tile slice
+        n = vectors.shape[0]
+        novelty_arr = np.empty(n, dtype=np.float32)
+        redundancy_arr = np.empty(n, dtype=np.float32)
+        safety_arr = np.empty(n, dtype=np.float32)
+        overall_arr = np.empty(n, dtype=np.float32)
         backend_used = "unknown"
         
-        for tile_idx, tile_vectors in tiler.tiles_array(vectors):
-            tile_t0 = time.perf_counter()
-            
-            result = batch_score(
+        def score_tile(tile_vectors, tile_idx: int):
+            return batch_score(
                 vectors=tile_vectors,
                 reference=reference,
                 features=tile_vectors if tile_vectors.shape[1] <= 10 else None,
                 seed=seed + tile_idx  # Different seed per tile for diversity
             )
-            
-            tile_ms = (time.perf_counter() - tile_t0) * 1000
-            tile_times.append(tile_ms)
-            tiler.adapt_tile_size(tile_ms)
-            
-            all_novelty.extend(result.novelty.tolist())
-            all_redundancy.extend(result.redundancy.tolist())
-            all_safety.extend(result.safety.tolist())
-            all_overall.extend(result.overall.tolist())
+        
+        # Fixed partition keeps per-tile seeds (and results) reproducible;
+        # batch_score does its own device transfer, so stage on host threads
+        # (copying each memory-mapped tile in while the previous one scores)
+        executor = PipelinedTileExecutor(tiler, use_gpu=False, adapt_in_flight=False)
+        for _, start, end, result in executor.run(vectors, score_tile):
+            novelty_arr[start:end] = result.novelty
+            redundancy_arr[start:end] = result.redundancy
+            safety_arr[start:end] = result.safety
+            overall_arr[start:end] = result.overall
             backend_used = result.backend_used
         
         elapsed = (time.perf_counter() - t0) * 1000
         
-        # Record metrics
-        metrics = tiler.record_metrics(len(entities), tile_times, backend_used)
-        
-        # Convert to numpy for threshold checks
-        novelty_arr = np.array(all_novelty)
-        redundancy_arr = np.array(all_redundancy)
-        safety_arr = np.array(all_safety)
-        overall_arr = np.array(all_overall)
+        # Executor recorded per-tile timings; tag them with the scoring backend
+        metrics = tiler.last_metrics
+        metrics.backend = backend_used
         
         # Threshold checks
         meets_threshold = (novelty_arr >= 0.7) & (redundancy_arr <= 0.3) & (safety_arr >= 0.8)
         in_grace = (novelty_arr >= 0.5) & (redundancy_arr <= 0.5) & (safety_arr >= 0.6)
         
-        # Build individual scores
-        scores = []
-        for i, eid in enumerate(entity_ids):
-            scores.append({
-                "id": eid,
-                "novelty": float(all_novelty[i]),
-                "redundancy": float(all_redundancy[i]),
-                "safety": float(all_safety[i]),
-                "overall": float(all_overall[i]),
-                "meets_thresholds": bool(meets_threshold[i]),
-            })
-        
         # Aggregate stats
         meets_count = int(np.sum(meets_threshold))
         grace_count = int(np.sum(in_grace))
         
-        return {
-            "count": len(entities),
-            "scores": scores,
+        response = {
+            "count": n,
+            "layout": layout,
             "aggregate": {
                 "mean_novelty": float(np.mean(novelty_arr)),
                 "mean_redundancy": float(np.mean(redundancy_arr)),
@@ -712,7 +1024,7 @@ def mas_gpu_batch_score(
                 "mean_overall": float(np.mean(overall_arr)),
                 "meets_threshold_count": meets_count,
                 "in_grace_window_count": grace_count,
-                "pass_rate": meets_count / len(entities) if entities else 0,
+                "pass_rate": meets_count / n if n else 0,
             },
             "backend": backend_used,
             "elapsed_ms": round(elapsed, 2),
@@ -726,6 +1038,58 @@ def mas_gpu_batch_score(
             }
         }
         
+        if feature_store:
+            response["feature_store"] = str(feature_store)
+        
+        if output_path:
+            # Columns stay as arrays on disk; only paged rows are returned inline.
+            # np.savez appends .npz to other suffixes, so name the real file up front
+            out = Path(output_path)
+            if out.suffix != '.npz':
+                out = out.with_name(out.name + '.npz')
+            out.parent.mkdir(parents=True, exist_ok=True)
+            ids = entity_ids[:]
+            np.savez(
+                out,
+                ids=np.asarray(ids, dtype=np.str_),
+                novelty=novelty_arr,
+                redundancy=redundancy_arr,
+                safety=safety_arr,
+                overall=overall_arr,
+                meets_thresholds=meets_threshold,
+            )
+            response["output_path"] = str(out)
+        elif layout == 'columnar':
+            # One bulk conversion per column instead of one dict per entity
+            ids = entity_ids[:]
+            response["columns"] = {
+                "ids": ids.tolist() if isinstance(ids, np.ndarray) else ids,
+                "novelty": novelty_arr.tolist(),
+                "redundancy": redundancy_arr.tolist(),
+                "safety": safety_arr.tolist(),
+                "overall": overall_arr.tolist(),
+                "meets_thresholds": meets_threshold.tolist(),
+            }
+        
+        if page_size:
+            start = max(0, page) * page_size
+            response["scores"] = _score_rows(
+                entity_ids, novelty_arr, redundancy_arr, safety_arr, overall_arr,
+                meets_threshold, start, start + page_size
+            )
+            response["page"] = {
+                "page": max(0, page),
+                "page_size": page_size,
+                "total_pages": -(-n // page_size),
+            }
+        elif layout == 'rows' and not output_path:
+            response["scores"] = _score_rows(
+                entity_ids, novelty_arr, redundancy_arr, safety_arr, overall_arr,
+                meets_threshold
+            )
+        
+        return response
+        
     except ImportError as e:
         logger.warning(f"GPU batch scoring unavailable: {e}")
         elapsed = (time.perf_counter() - t0) * 1000
@@ -733,7 +1097,7 @@ def mas_gpu_batch_score(
         # CPU fallback with synthetic scores
         rng = np.random.default_rng(seed)
         scores = []
-        for eid in entity_ids:
+        for eid in entity_ids[:]:
             scores.append({
                 "id": eid,
                 "novelty": float(rng.uniform(0.5, 1.0)),
@@ -744,7 +1108,7 @@ def mas_gpu_batch_score(
             })
         
         return {
-            "count": len(entities),
+            "count": len(entity_ids),
             "scores": scores,
             "backend": "cpu_fallback",
             "elapsed_ms": round(elapsed, 2),
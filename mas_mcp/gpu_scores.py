@@ -16,7 +16,8 @@ import logging
 
 from gpu_config import (
     get_config, get_capabilities, gpu_available, 
-    with_gpu_fallback, GPUBackend
+    with_gpu_fallback, GPUBackend, CPUBackend,
+    get_cpu_backend, cpu_worker_count
 )
 
 logger = logging.getLogger("mas.gpu.scores")
@@ -232,6 +233,180 @@ def cpu_batch_score(
     )
 
 
+# ============================================================================
+# Parallel CPU Implementations (Numba prange / thread pool over row blocks)
+# ============================================================================
+
+# Below this many rows the single-threaded reference is faster than
+# spinning up workers (and skips the one-time Numba JIT for tiny calls)
+PARALLEL_MIN_ROWS = 2048
+
+_DANGER_WEIGHTS = np.array([1.0, 0.9, 0.7, 0.6, 0.5, 0.3], dtype=np.float32)
+
+_cpu_pool = None
+_numba_kernel = None
+
+
+def _get_cpu_pool(workers: int):
+    """Shared thread pool for row-block scoring."""
+    global _cpu_pool
+    from concurrent.futures import ThreadPoolExecutor
+    
+    if _cpu_pool is None or _cpu_pool._max_workers != workers:
+        if _cpu_pool is not None:
+            _cpu_pool.shutdown(wait=False)
+        _cpu_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mas-score")
+    return _cpu_pool
+
+
+def _get_numba_kernel():
+    """Compile (once per process) the Numba similarity-statistics kernel."""
+    global _numba_kernel
+    if _numba_kernel is not None:
+        return _numba_kernel
+    
+    from numba import njit, prange
+    
+    @njit(parallel=True, fastmath=True)
+    def similarity_stats(v_norm, r_norm, k, max_out, topk_out):
+        n, d = v_norm.shape
+        m = r_norm.shape[0]
+        for i in prange(n):
+            # Running top-k, kept sorted ascending (top[0] is the smallest)
+            top = np.full(k, -np.inf, dtype=np.float32)
+            best = np.float32(-np.inf)
+            for j in range(m):
+                acc = np.float32(0.0)
+                for c in range(d):
+                    acc += v_norm[i, c] * r_norm[j, c]
+                if acc > best:
+                    best = acc
+                if acc > top[0]:
+                    pos = 0
+                    while pos + 1 < k and top[pos + 1] < acc:
+                        top[pos] = top[pos + 1]
+                        pos += 1
+                    top[pos] = acc
+            max_out[i] = best
+            total = np.float32(0.0)
+            for t in range(k):
+                total += top[t]
+            topk_out[i] = total / k
+    
+    _numba_kernel = similarity_stats
+    return _numba_kernel
+
+
+def _threaded_similarity_stats(
+    v_norm: np.ndarray,
+    r_norm: np.ndarray,
+    k: int,
+    max_out: np.ndarray,
+    topk_out: np.ndarray,
+    workers: int
+) -> None:
+    """Row-block similarity statistics; each block's matmul releases the GIL."""
+    n, m = v_norm.shape[0], r_norm.shape[0]
+    block = max(256, -(-n // workers))
+    r_t = np.ascontiguousarray(r_norm.T)
+    
+    def run_block(lo: int) -> None:
+        hi = min(lo + block, n)
+        sim = v_norm[lo:hi] @ r_t
+        max_out[lo:hi] = np.max(sim, axis=1)
+        # Same values, same ascending order as argsort()[:, -k:] in the reference
+        top = np.partition(sim, m - k, axis=1)[:, m - k:]
+        top.sort(axis=1)
+        topk_out[lo:hi] = np.mean(top, axis=1)
+    
+    list(_get_cpu_pool(workers).map(run_block, range(0, n, block)))
+
+
+def parallel_cpu_batch_score(
+    vectors: np.ndarray,
+    reference: np.ndarray,
+    features: Optional[np.ndarray] = None,
+    seed: Optional[int] = None,
+    weights: Tuple[float, float, float] = (0.4, 0.3, 0.3),
+    backend: Optional[CPUBackend] = None,
+    workers: Optional[int] = None
+) -> ScoringResult:
+    """
+    Multi-core CPU batch scoring (Numba prange kernels or a thread pool).
+    
+    Uses the same seeded noise streams as cpu_batch_score, so results match
+    the reference within float tolerance. Small batches and the NUMPY backend
+    go straight to the reference implementation.
+    """
+    import time
+    start = time.perf_counter()
+    
+    backend = backend or get_cpu_backend()
+    if backend == CPUBackend.NUMPY or vectors.shape[0] < PARALLEL_MIN_ROWS or reference.shape[0] == 0:
+        return cpu_batch_score(vectors, reference, features, seed, weights)
+    
+    config = get_config()
+    seed = seed or config.seed
+    workers = workers or cpu_worker_count()
+    n = vectors.shape[0]
+    
+    v = np.ascontiguousarray(vectors, dtype=np.float32)
+    r = np.ascontiguousarray(reference, dtype=np.float32)
+    v_norm = v / (np.linalg.norm(v, axis=1, keepdims=True) + 1e-8)
+    r_norm = r / (np.linalg.norm(r, axis=1, keepdims=True) + 1e-8)
+    k = min(5, max(1, r.shape[0]))
+    
+    max_sim = np.empty(n, dtype=np.float32)
+    topk_mean = np.empty(n, dtype=np.float32)
+    
+    if backend == CPUBackend.NUMBA:
+        try:
+            _get_numba_kernel()(v_norm, r_norm, k, max_sim, topk_mean)
+            backend_used = "cpu_numba"
+        except ImportError:
+            logger.warning("Numba not importable, using threaded CPU scoring")
+            backend = CPUBackend.THREADS
+    if backend == CPUBackend.THREADS:
+        _threaded_similarity_stats(v_norm, r_norm, k, max_sim, topk_mean, workers)
+        backend_used = "cpu_threads"
+    
+    # Noise streams identical to the reference (one rng per score, full length)
+    noise_nov = np.random.default_rng(seed).uniform(-1e-6, 1e-6, size=n).astype(np.float32)
+    noise_red = np.random.default_rng(seed + 1).uniform(-1e-6, 1e-6, size=n).astype(np.float32)
+    novelty = np.clip(1.0 - max_sim + noise_nov, 0.0, 1.0)
+    redundancy = np.clip(topk_mean + noise_red, 0.0, 1.0)
+    
+    if features is None:
+        safety = np.full(n, 0.5, dtype=np.float32)
+    else:
+        danger_weights = _DANGER_WEIGHTS
+        if features.shape[1] < len(danger_weights):
+            danger_weights = danger_weights[:features.shape[1]]
+        elif features.shape[1] > len(danger_weights):
+            danger_weights = np.pad(danger_weights, (0, features.shape[1] - len(danger_weights)), constant_values=0.2)
+        danger_normalized = (features @ danger_weights) / (np.sum(danger_weights) + 1e-8)
+        noise_saf = np.random.default_rng(seed + 2).uniform(-1e-6, 1e-6, size=n).astype(np.float32)
+        safety = np.clip(1.0 - danger_normalized + noise_saf, 0.0, 1.0)
+    
+    w_nov, w_red, w_saf = weights
+    overall = (
+        w_nov * novelty +
+        w_red * (1.0 - redundancy) +
+        w_saf * safety
+    ) / (w_nov + w_red + w_saf)
+    
+    return ScoringResult(
+        novelty=novelty,
+        redundancy=redundancy,
+        safety=safety,
+        overall=overall,
+        batch_size=n,
+        compute_time_ms=(time.perf_counter() - start) * 1000,
+        backend_used=backend_used,
+        seed_used=seed
+    )
+
+
 # ============================================================================
 # GPU Implementations (CuPy/Numba)
 # ============================================================================
@@ -372,11 +547,11 @@ def batch_score(
     weights: Tuple[float, float, float] = (0.4, 0.3, 0.3)
 ) -> ScoringResult:
     """
-    Unified scoring interface - uses GPU if available, CPU otherwise.
+    Unified scoring interface - uses GPU if available, multi-core CPU otherwise.
     """
     if gpu_available():
         return gpu_batch_score(vectors, reference, features, seed, weights)
-    return cpu_batch_score(vectors, reference, features, seed, weights)
+    return parallel_cpu_batch_score(vectors, reference, features, seed, weights)
 
 
 # ============================================================================
@@ -388,10 +563,14 @@ def validate_gpu_cpu_parity(
     dim: int = 256,
     n_reference: int = 500,
     seed: int = 42,
-    tolerance: float = 1e-4
+    tolerance: float = 1e-4,
+    backend: str = "gpu"
 ) -> dict:
     """
-    Validate that GPU and CPU implementations produce equivalent results.
+    Validate that an accelerated implementation matches the CPU reference.
+    
+    Args:
+        backend: "gpu" (CuPy), or a parallel CPU backend: "numba" / "threads"
     
     Returns validation report with pass/fail and max differences.
     """
@@ -403,20 +582,34 @@ def validate_gpu_cpu_parity(
     
     cpu_result = cpu_batch_score(vectors, reference, features, seed)
     
-    if not gpu_available():
-        return {
-            "status": "skipped",
-            "reason": "GPU not available",
-            "cpu_time_ms": cpu_result.compute_time_ms
-        }
-    
-    gpu_result = gpu_batch_score(vectors, reference, features, seed)
+    if backend == "gpu":
+        if not gpu_available():
+            return {
+                "status": "skipped",
+                "reason": "GPU not available",
+                "cpu_time_ms": cpu_result.compute_time_ms
+            }
+        accel_result = gpu_batch_score(vectors, reference, features, seed)
+    else:
+        cpu_backend = CPUBackend[backend.upper()]
+        if cpu_backend == CPUBackend.NUMBA:
+            try:
+                import numba  # noqa: F401
+            except ImportError:
+                return {
+                    "status": "skipped",
+                    "reason": "Numba not installed (gpu-fallback extra)",
+                    "cpu_time_ms": cpu_result.compute_time_ms
+                }
+        if n_vectors < PARALLEL_MIN_ROWS:
+            logger.info(f"Parity batch below PARALLEL_MIN_ROWS; {backend} path uses the reference")
+        accel_result = parallel_cpu_batch_score(vectors, reference, features, seed, backend=cpu_backend)
     
     # Compare
-    novelty_diff = np.max(np.abs(cpu_result.novelty - gpu_result.novelty))
-    redundancy_diff = np.max(np.abs(cpu_result.redundancy - gpu_result.redundancy))
-    safety_diff = np.max(np.abs(cpu_result.safety - gpu_result.safety))
-    overall_diff = np.max(np.abs(cpu_result.overall - gpu_result.overall))
+    novelty_diff = np.max(np.abs(cpu_result.novelty - accel_result.novelty))
+    redundancy_diff = np.max(np.abs(cpu_result.redundancy - accel_result.redundancy))
+    safety_diff = np.max(np.abs(cpu_result.safety - accel_result.safety))
+    overall_diff = np.max(np.abs(cpu_result.overall - accel_result.overall))
     
     max_diff = max(novelty_diff, redundancy_diff, safety_diff, overall_diff)
     passed = max_diff <= tolerance
@@ -433,9 +626,10 @@ def validate_gpu_cpu_parity(
         },
         "timing": {
             "cpu_ms": cpu_result.compute_time_ms,
-            "gpu_ms": gpu_result.compute_time_ms,
-            "speedup": cpu_result.compute_time_ms / max(gpu_result.compute_time_ms, 0.001)
+            "gpu_ms": accel_result.compute_time_ms,
+            "speedup": cpu_result.compute_time_ms / max(accel_result.compute_time_ms, 0.001)
         },
+        "backend": accel_result.backend_used,
         "batch_size": n_vectors,
         "dimension": dim
     }
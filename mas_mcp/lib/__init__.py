@@ -18,6 +18,10 @@ from .gpu_probe import (
     clear_probe_cache,
 )
 
+from .fs_walk import walk_files
+from .module_index import ModuleIndex
+from .lore_search import LoreSearchIndex, SearchHit
+
 __all__ = [
     # SSOT
     "canonicalize_text",
@@ -32,4 +36,10 @@ __all__ = [
     "GPUProbeResult",
     "probe_gpu_capabilities",
     "clear_probe_cache",
+    # Filesystem
+    "walk_files",
+    "ModuleIndex",
+    # Lore search
+    "LoreSearchIndex",
+    "SearchHit",
 ]
@@ -4,6 +4,7 @@
 #     "rich>=13.0",
 #     "pydantic>=2.0",
 #     "typer>=0.12",
+#     "numpy>=1.26",
 # ]
 # ///
 """
@@ -25,13 +26,17 @@ Commands:
     uv run .github/asc.py lore-sync    - Sync lore → data.json entities
 """
 
+import hashlib
 import json
 import re
 import sys
+from bisect import bisect_left, bisect_right
 from datetime import datetime
+from functools import cached_property
+from itertools import accumulate
 from pathlib import Path
 from typing import Optional, Annotated
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 
 import typer
 from pydantic import BaseModel, Field, field_validator
@@ -42,6 +47,7 @@ from rich.tree import Tree
 from rich.syntax import Syntax
 from rich.progress import track
 from rich.markdown import Markdown
+from rich.markup import escape
 
 # Initialize
 app = typer.Typer(
@@ -56,6 +62,8 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_JSON = PROJECT_ROOT / "assets" / "data.json"
 TYPES_RS = PROJECT_ROOT / "src" / "data" / "types.rs"
 LORE_MD = Path(__file__).parent / "copilot-instructions.md"
+LORE_INDEX_PATH = PROJECT_ROOT / "mas_cache" / "lore_index.json"
+LORE_INDEX_VERSION = 1
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -92,6 +100,112 @@ class ExtractedEntity:
     raw_text: str = ""
 
 
+@dataclass
+class LoreHeader:
+    """Markdown header of the Codex and its place in the header hierarchy"""
+    line: int
+    level: int
+    title: str
+    parent: int = -1  # Index of the enclosing header in LoreIndex.headers (-1: top level)
+
+
+@dataclass
+class LoreIndex:
+    """
+    Everything the lore commands read from the Codex, built in one pass.
+
+    Header hierarchy, entity anchors, profile boundary markers, the line
+    range and extracted fields (physique, tier, scent, ...) of every entity
+    section, and the faction hierarchy. Kept per Codex hash in memory and
+    in mas_cache/lore_index.json, so lore, lore-entity, lore-factions and
+    lore-sync only rescan the Codex after it changes.
+    """
+    codex_hash: str
+    line_count: int
+    word_count: int
+    headers: list[LoreHeader] = field(default_factory=list)
+    anchors: dict[str, int] = field(default_factory=dict)  # Entity -> first marker line
+    identity_lines: list[int] = field(default_factory=list)  # "ASC Identity Manifestation ... Combinational Analysis"
+    stop_lines: list[int] = field(default_factory=list)  # Numbered x.y.z. headers and --- rules
+    sections: dict[str, tuple[int, int]] = field(default_factory=dict)
+    entities: dict[str, ExtractedEntity] = field(default_factory=dict)  # raw_text left empty
+    factions: dict[str, list[str]] = field(default_factory=dict)
+
+    _memory = {}  # Codex hash -> LoreIndex, for every extractor in this process
+
+    @cached_property
+    def _header_lines(self) -> list[int]:
+        return [header.line for header in self.headers]
+
+    def header_path(self, line: int) -> list[str]:
+        """Titles of the headers enclosing a line, outermost first"""
+        idx = bisect_right(self._header_lines, line) - 1
+        path = []
+        while idx >= 0:
+            path.append(self.headers[idx].title)
+            idx = self.headers[idx].parent
+        return path[::-1]
+
+    def to_dict(self) -> dict:
+        return {
+            "codex_hash": self.codex_hash,
+            "line_count": self.line_count,
+            "word_count": self.word_count,
+            "headers": [asdict(header) for header in self.headers],
+            "anchors": self.anchors,
+            "identity_lines": self.identity_lines,
+            "stop_lines": self.stop_lines,
+            "sections": self.sections,
+            "entities": {name: asdict(entity) for name, entity in self.entities.items()},
+            "factions": self.factions,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LoreIndex":
+        return cls(
+            codex_hash=data["codex_hash"],
+            line_count=data["line_count"],
+            word_count=data["word_count"],
+            headers=[LoreHeader(**header) for header in data["headers"]],
+            anchors=data["anchors"],
+            identity_lines=data["identity_lines"],
+            stop_lines=data["stop_lines"],
+            sections={name: tuple(lines) for name, lines in data["sections"].items()},
+            entities={
+                name: ExtractedEntity(**{**entity, "physique": ExtractedPhysique(**entity["physique"])})
+                for name, entity in data["entities"].items()
+            },
+            factions=data["factions"],
+        )
+
+    @classmethod
+    def load(cls, codex_hash: str, path: Optional[Path] = LORE_INDEX_PATH) -> Optional["LoreIndex"]:
+        """The index of the Codex with this hash, from memory or path (None if not cached)"""
+        if codex_hash in cls._memory:
+            return cls._memory[codex_hash]
+        if path is None:
+            return None
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != LORE_INDEX_VERSION or data.get("index", {}).get("codex_hash") != codex_hash:
+            return None
+        index = cls._memory[codex_hash] = cls.from_dict(data["index"])
+        return index
+
+    def save(self, path: Optional[Path] = LORE_INDEX_PATH) -> None:
+        """Keep the index in memory and, if path is set, on disk (best effort)"""
+        self._memory[self.codex_hash] = self
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({"version": LORE_INDEX_VERSION, "index": self.to_dict()}), encoding='utf-8')
+        except OSError:
+            pass
+
+
 class LoreExtractor:
     """
     Extracts structured entity data from copilot-instructions.md.
@@ -113,8 +227,29 @@ class LoreExtractor:
         r"The Null Matriarch",
     ]
     
+    # Entity section anchors: entity_name -> (marker pattern, section_length_hint)
+    ENTITY_MARKERS = {
+        name: (re.compile(pattern, re.IGNORECASE), hint)
+        for name, (pattern, hint) in {
+            "The Decorator": (r"0\.1\.\s*Supreme Profile.*Decorator|0\.1\..*The Decorator.*T-DECOR", 350),
+            "The Null Matriarch": (r"0\.01\.\s*.*Null Matriarch|T-NULM.*Tier 0\.01", 50),
+            "Orackla Nocticula": (r"4\.2\.1\.\s*.*Apex Synthesist.*Orackla|`CRC-AS`.*Orackla Nocticula", 140),
+            "Madam Umeko Ketsuraku": (r"4\.2\.2\.\s*.*Grandmistress.*Architectonic.*Umeko|`CRC-GAR`.*Umeko", 150),
+            "Dr. Lysandra Thorne": (r"4\.2\.3\.\s*.*Mistress of Empathetic.*Lysandra|`CRC-MEDAT`.*Lysandra", 180),
+            "Kali Nyx Ravenscar": (r"Mistress of Abductive Seduction.*Kali|`MAS`.*Kali Nyx", 130),
+            "Vesper Mnemosyne Lockhart": (r"Grandmaster of Epistemic Theft.*Vesper|`GET`.*Vesper Mnemosyne", 130),
+            "Seraphine Kore Ashenhelm": (r"High Priestess of Architectonic Purity.*Seraphine|`HPAP`.*Seraphine", 130),
+            "Claudine Sin'claire": (r"Special Archetype Injection.*Claudine|`SAI`.*Claudine|Caribbean Proto-MILF", 100),
+        }.items()
+    }
+
+    # Section structure
+    HEADER_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*$')
+    NUMBERED_HEADER_RE = re.compile(r'^\*?\*?\s*\d+\.\d+\.\d+\.')
+    RULE_RE = re.compile(r'^-{3,}$')
+
     # Physical attribute patterns
-    PHYSIQUE_PATTERNS = {
+    PHYSIQUE_PATTERNS = {name: re.compile(pattern) for name, pattern in {
         'height': r'\*\*Height:\*\*\s*(\d+(?:\.\d+)?)\s*cm',
         'weight': r'\*\*Weight:\*\*\s*(\d+(?:\.\d+)?)\s*kg',
         'measurements': r'\*\*Measurements:\*\*\s*\*\*([A-K]+)-cup\*\*\s*\(?(?:\*\*)?(?:B\s*)?(\d+)(?:[\/\s]*W\s*)?(\d+)(?:[\/\s]*H\s*)?(\d+)',
@@ -122,7 +257,7 @@ class LoreExtractor:
         'whr': r'\*\*WHR:\*\*\s*\*?\*?~?(\d+\.\d+)',
         'underbust': r'\*\*Underbust:\*\*\s*~?(\d+)\s*cm',
         'cup': r'\*\*([A-K]+)-cup\*?\*?',
-    }
+    }.items()}
     
     # Tier patterns
     TIER_PATTERNS = {
@@ -134,10 +269,12 @@ class LoreExtractor:
         'tier_4': r'Tier\s*4|T-4|Tier-4',
     }
     
-    def __init__(self, lore_path: Path = LORE_MD):
+    def __init__(self, lore_path: Path = LORE_MD, index_path: Optional[Path] = LORE_INDEX_PATH):
         self.lore_path = lore_path
+        self.index_path = index_path
         self._content: str = ""
         self._lines: list[str] = []
+        self._index: Optional[LoreIndex] = None
         
     def load(self) -> bool:
         """Load the lore file"""
@@ -145,6 +282,7 @@ class LoreExtractor:
             return False
         self._content = self.lore_path.read_text(encoding='utf-8')
         self._lines = self._content.splitlines()
+        self._index = None
         return True
     
     @property
@@ -167,116 +305,155 @@ class LoreExtractor:
     def word_count(self) -> int:
         return len(self.content.split())
     
-    def find_entity_sections(self) -> dict[str, tuple[int, int]]:
+    @property
+    def index(self) -> LoreIndex:
+        """LoreIndex of the loaded Codex: cached per content hash, built on a miss"""
+        if self._index is None:
+            codex_hash = hashlib.sha256(self.content.encode('utf-8')).hexdigest()
+            self._index = LoreIndex.load(codex_hash, self.index_path)
+            if self._index is None:
+                self._index = self.build_index(codex_hash)
+                self._index.save(self.index_path)
+        return self._index
+    
+    def build_index(self, codex_hash: str) -> LoreIndex:
         """
-        Find line ranges for each entity section.
-        Uses line-by-line scanning to find entity-specific header patterns,
-        then determines proper section boundaries.
+        Index the Codex in one pass over its lines.
+
+        Headers, profile boundaries ("ASC Identity Manifestation" lines,
+        numbered x.y.z. headers, --- rules) are collected per line; each
+        entity marker is one compiled search over the whole text. Entity
+        fields are then extracted once per section.
         """
-        sections = {}
+        lines = self.lines
+        index = LoreIndex(codex_hash=codex_hash, line_count=len(lines), word_count=len(self.content.split()))
         
-        # Entity patterns with their section header signatures
-        # Format: entity_name -> (primary_pattern, section_length_hint)
-        entity_markers = {
-            "The Decorator": (r"0\.1\.\s*Supreme Profile.*Decorator|0\.1\..*The Decorator.*T-DECOR", 350),
-            "The Null Matriarch": (r"0\.01\.\s*.*Null Matriarch|T-NULM.*Tier 0\.01", 50),
-            "Orackla Nocticula": (r"4\.2\.1\.\s*.*Apex Synthesist.*Orackla|`CRC-AS`.*Orackla Nocticula", 140),
-            "Madam Umeko Ketsuraku": (r"4\.2\.2\.\s*.*Grandmistress.*Architectonic.*Umeko|`CRC-GAR`.*Umeko", 150),
-            "Dr. Lysandra Thorne": (r"4\.2\.3\.\s*.*Mistress of Empathetic.*Lysandra|`CRC-MEDAT`.*Lysandra", 180),
-            "Kali Nyx Ravenscar": (r"Mistress of Abductive Seduction.*Kali|`MAS`.*Kali Nyx", 130),
-            "Vesper Mnemosyne Lockhart": (r"Grandmaster of Epistemic Theft.*Vesper|`GET`.*Vesper Mnemosyne", 130),
-            "Seraphine Kore Ashenhelm": (r"High Priestess of Architectonic Purity.*Seraphine|`HPAP`.*Seraphine", 130),
-            "Claudine Sin'claire": (r"Special Archetype Injection.*Claudine|`SAI`.*Claudine|Caribbean Proto-MILF", 100),
-        }
+        open_headers: list[int] = []  # Header indices from outermost to the current one
+        in_fence = False
+        for i, line in enumerate(lines):
+            if line.lstrip().startswith("```"):
+                in_fence = not in_fence
+            elif not in_fence and line.startswith("#") and (m := self.HEADER_RE.match(line)):
+                level = len(m.group(1))
+                while open_headers and index.headers[open_headers[-1]].level >= level:
+                    open_headers.pop()
+                index.headers.append(LoreHeader(i, level, m.group(2).strip("* "), open_headers[-1] if open_headers else -1))
+                open_headers.append(len(index.headers) - 1)
+            if "ASC Identity Manifestation" in line and "Combinational Analysis" in line:
+                index.identity_lines.append(i)
+            if self.NUMBERED_HEADER_RE.match(line) or self.RULE_RE.match(line.strip()):
+                index.stop_lines.append(i)
         
-        # First pass: find start lines for each entity
-        start_lines = {}
-        for i, line in enumerate(self.lines):
-            for name, (pattern, _) in entity_markers.items():
-                if name not in start_lines:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        start_lines[name] = i
+        # Searching the joined lines keeps line numbers aligned with splitlines()
+        text = "\n".join(lines)
+        line_starts = [0, *accumulate(len(line) + 1 for line in lines)]
+        for name, (pattern, _) in self.ENTITY_MARKERS.items():
+            pos = 0
+            while m := pattern.search(text, pos):
+                i = bisect_right(line_starts, m.start()) - 1
+                if pattern.search(lines[i]):  # \s* may have matched across a newline
+                    index.anchors[name] = i
+                    break
+                pos = line_starts[i + 1]
         
-        # Second pass: determine end lines
-        # Sort entities by their start position
-        sorted_entities = sorted(start_lines.items(), key=lambda x: x[1])
+        index.sections = self._section_ranges(index)
+        for name, (start, end) in index.sections.items():
+            index.entities[name] = self._extract_section(name, start, end)
+        index.factions = self._scan_factions()
+        return index
+    
+    def _section_ranges(self, index: LoreIndex) -> dict[str, tuple[int, int]]:
+        """Line range of each anchored entity, bounded by the next entity and its profile end"""
+        sections = {}
+        sorted_entities = sorted(index.anchors.items(), key=lambda x: x[1])
         
         for idx, (name, start) in enumerate(sorted_entities):
-            _, hint = entity_markers[name]
+            _, hint = self.ENTITY_MARKERS[name]
             
             # Default end based on hint
-            end = min(len(self.lines), start + hint)
+            end = min(index.line_count, start + hint)
             
             # If there's a next entity, don't go past it
             if idx + 1 < len(sorted_entities):
                 next_start = sorted_entities[idx + 1][1]
                 end = min(end, next_start - 1)
             
-            # Refine: look for section boundaries within range
-            for j in range(start + 20, end):
-                line = self.lines[j]
-                
-                # Stop at "ASC Identity Manifestation" line (that's the end marker for profiles)
-                if "ASC Identity Manifestation" in line and "Combinational Analysis" in line:
-                    # But only if it's for THIS entity
-                    entity_surname = name.split()[-1]  # e.g., "Nocticula", "Ketsuraku"
-                    if entity_surname in line:
-                        # Include the ASC Identity section too - extend to find its end
-                        for k in range(j + 1, min(j + 120, len(self.lines))):
-                            next_line = self.lines[k]
-                            # Stop at next major section header
-                            if re.match(r'^\*?\*?\s*\d+\.\d+\.\d+\.', next_line):
-                                end = k
-                                break
-                            # Or a horizontal rule (---)
-                            if re.match(r'^-{3,}$', next_line.strip()):
-                                end = k
-                                break
-                        else:
-                            end = min(j + 100, len(self.lines))
-                        break
+            # The entity's own "ASC Identity Manifestation" line ends the profile,
+            # extended to the next numbered header or rule within 120 lines
+            entity_surname = name.split()[-1]  # e.g., "Nocticula", "Ketsuraku"
+            for j in index.identity_lines[bisect_left(index.identity_lines, start + 20):]:
+                if j >= end:
+                    break
+                if entity_surname in self.lines[j]:
+                    k = bisect_right(index.stop_lines, j)
+                    if k < len(index.stop_lines) and index.stop_lines[k] < min(j + 120, index.line_count):
+                        end = index.stop_lines[k]
+                    else:
+                        end = min(j + 100, index.line_count)
+                    break
             
             sections[name] = (start, end)
         
         return sections
     
+    def _extract_section(self, name: str, start: int, end: int) -> ExtractedEntity:
+        """Entity fields from its section text (raw_text is left to extract_entity)"""
+        text = "\n".join(self.lines[start:end])
+        return ExtractedEntity(
+            name=name,
+            tier=self.extract_tier(text, name),
+            archetype=self.extract_archetype(text, name),
+            race=self.extract_race(text),
+            age=self.extract_age(text),
+            linguistic_mode=self.extract_linguistic_mode(text),
+            physique=self.extract_physique(text),
+            scent=self.extract_scent(text),
+            edfa_excerpt=self.extract_edfa_excerpt(text),
+            section_start=start,
+            section_end=end,
+        )
+    
+    def find_entity_sections(self) -> dict[str, tuple[int, int]]:
+        """Line ranges of each entity section, in Codex order (from the index)"""
+        return dict(self.index.sections)
+    
     def extract_physique(self, text: str) -> ExtractedPhysique:
         """Extract physical measurements from text"""
         p = ExtractedPhysique()
         
         # Height
-        if m := re.search(self.PHYSIQUE_PATTERNS['height'], text):
+        if m := self.PHYSIQUE_PATTERNS['height'].search(text):
             p.height_cm = float(m.group(1))
         
         # Weight
-        if m := re.search(self.PHYSIQUE_PATTERNS['weight'], text):
+        if m := self.PHYSIQUE_PATTERNS['weight'].search(text):
             p.weight_kg = float(m.group(1))
         
         # Measurements (try both patterns)
-        if m := re.search(self.PHYSIQUE_PATTERNS['measurements'], text):
+        if m := self.PHYSIQUE_PATTERNS['measurements'].search(text):
             p.cup_size = m.group(1)
             p.bust_cm = float(m.group(2))
             p.waist_cm = float(m.group(3))
             p.hips_cm = float(m.group(4))
-        elif m := re.search(self.PHYSIQUE_PATTERNS['measurements_alt'], text):
+        elif m := self.PHYSIQUE_PATTERNS['measurements_alt'].search(text):
             p.cup_size = m.group(1)
             p.bust_cm = float(m.group(2))
             p.waist_cm = float(m.group(3))
             p.hips_cm = float(m.group(4))
         
         # WHR
-        if m := re.search(self.PHYSIQUE_PATTERNS['whr'], text):
+        if m := self.PHYSIQUE_PATTERNS['whr'].search(text):
             p.whr = float(m.group(1))
         elif p.waist_cm and p.hips_cm:
             p.whr = round(p.waist_cm / p.hips_cm, 3)
         
         # Underbust
-        if m := re.search(self.PHYSIQUE_PATTERNS['underbust'], text):
+        if m := self.PHYSIQUE_PATTERNS['underbust'].search(text):
             p.underbust_cm = float(m.group(1))
         
         # Cup size fallback
         if not p.cup_size:
-            if m := re.search(self.PHYSIQUE_PATTERNS['cup'], text):
+            if m := self.PHYSIQUE_PATTERNS['cup'].search(text):
                 p.cup_size = m.group(1)
         
         return p
@@ -380,30 +557,12 @@ class LoreExtractor:
     
     def extract_entity(self, name: str) -> Optional[ExtractedEntity]:
         """Extract full entity data by name"""
-        sections = self.find_entity_sections()
-        
-        if name not in sections:
+        entity = self.index.entities.get(name)
+        if entity is None:
             return None
         
-        start, end = sections[name]
-        raw_text = "\n".join(self.lines[start:end])
-        
-        entity = ExtractedEntity(
-            name=name,
-            tier=self.extract_tier(raw_text, name),
-            archetype=self.extract_archetype(raw_text, name),
-            race=self.extract_race(raw_text),
-            age=self.extract_age(raw_text),
-            linguistic_mode=self.extract_linguistic_mode(raw_text),
-            physique=self.extract_physique(raw_text),
-            scent=self.extract_scent(raw_text),
-            edfa_excerpt=self.extract_edfa_excerpt(raw_text),
-            section_start=start,
-            section_end=end,
-            raw_text=raw_text,
-        )
-        
-        return entity
+        raw_text = "\n".join(self.lines[entity.section_start:entity.section_end])
+        return replace(entity, physique=replace(entity.physique), raw_text=raw_text)
     
     def extract_all_entities(self) -> list[ExtractedEntity]:
         """Extract all known entities"""
@@ -417,6 +576,10 @@ class LoreExtractor:
     
     def extract_factions(self) -> dict[str, list[str]]:
         """Extract faction hierarchy"""
+        return {tier: list(members) for tier, members in self.index.factions.items()}
+    
+    def _scan_factions(self) -> dict[str, list[str]]:
+        """Faction hierarchy by searching the Codex for each faction's names"""
         factions = {
             "Triumvirate (Tier 1)": [],
             "Prime Factions (Tier 2)": [],
@@ -458,12 +621,12 @@ class LoreExtractor:
     
     def get_lore_stats(self) -> dict:
         """Get statistics about the lore file"""
-        sections = self.find_entity_sections()
+        index = self.index
         return {
-            "total_lines": self.line_count,
-            "total_words": self.word_count,
-            "entity_sections": len(sections),
-            "entities_found": list(sections.keys()),
+            "total_lines": index.line_count,
+            "total_words": index.word_count,
+            "entity_sections": len(index.sections),
+            "entities_found": list(index.sections.keys()),
         }
 
 
@@ -1060,12 +1223,42 @@ def shader_check():
         raise typer.Exit(1)
 
 
+def write_feature_store(path: Path, entities: list[dict]) -> int:
+    """
+    Write data.json entities as a MAS-MCP feature store.
+    
+    Delegates to mas_mcp feature_store.entities_to_feature_store, so the
+    vector layout, cup mapping and on-disk format are the batch scorer's own
+    and the store can be passed straight to mas_gpu_batch_score(feature_store=...).
+    """
+    use_mas_mcp()
+    from feature_store import entities_to_feature_store
+    
+    records = []
+    for e in entities:
+        physics = e.get('physics', {})
+        bust, waist, hips = (physics.get(k) or 0 for k in ('bust_cm', 'waist_cm', 'hips_cm'))
+        records.append({
+            'name': str(e['id']),
+            'whr': physics.get('whr') or None,
+            'tier': e.get('tier'),
+            'cup': physics.get('cup_size'),
+            'measurements': f"B{bust}/W{waist}/H{hips}",
+        })
+    entities_to_feature_store(path, records, source=str(DATA_JSON))
+    return len(records)
+
+
 @app.command()
-def export_csv(output: Annotated[Path, typer.Argument()] = Path("entities.csv")):
+def export_csv(
+    output: Annotated[Path, typer.Argument()] = Path("entities.csv"),
+    features: Annotated[Optional[Path], typer.Option("--features", help="Also write a feature store directory for batch scoring")] = None,
+):
     """
     📄 Export entities to CSV for external analysis.
     
-    Useful for spreadsheet-based balancing work.
+    Useful for spreadsheet-based balancing work. With --features, also emits a
+    memory-mappable feature store for mas_gpu_batch_score.
     """
     import csv
     
@@ -1099,6 +1292,10 @@ def export_csv(output: Annotated[Path, typer.Argument()] = Path("entities.csv"))
             writer.writerow(row)
     
     console.print(f"[green]✅ Exported {len(entities)} entities to {output}[/green]")
+    
+    if features:
+        count = write_feature_store(features, entities)
+        console.print(f"[green]✅ Wrote feature store ({count} × 6) to {features}[/green]")
 
 
 @app.command()
@@ -1514,16 +1711,28 @@ def lore_sync(
         console.print(f"\n[green]✅ Wrote {len(changes)} changes to data.json[/green]")
 
 
+def use_mas_mcp() -> None:
+    """Put the mas_mcp root on sys.path, for abbreviation_system and lib imports"""
+    # mas_mcp/lib/asc_toolchain.py or a copy at .github/asc.py
+    for root in (Path(__file__).resolve().parent.parent, PROJECT_ROOT / "mas_mcp"):
+        if (root / "abbreviation_system").is_dir():
+            if str(root) not in sys.path:
+                sys.path.insert(0, str(root))
+            break
+
+
 @app.command()
 def lore_search(
-    query: Annotated[str, typer.Argument(help="Search term")],
+    query: Annotated[str, typer.Argument(help='Words, "quoted phrases" and prefix* terms')],
     context: Annotated[int, typer.Option("--context", "-c", help="Lines of context")] = 2,
     limit: Annotated[int, typer.Option("--limit", "-l", help="Max results")] = 10,
+    archive: Annotated[bool, typer.Option("--archive", "-a", help="Also search all markdown in the archive")] = False,
 ):
     """
     🔎 Search for terms in copilot-instructions.md.
     
-    Returns matching lines with context.
+    Ranked (BM25) full-text search over a persistent index that is only
+    rebuilt for files whose content changed. Returns matching lines with context.
     """
     extractor = LoreExtractor()
     if not extractor.load():
@@ -1532,37 +1741,46 @@ def lore_search(
     
     console.print(Panel.fit(
         f"[bold cyan]🔎 Lore Search[/bold cyan]\n"
-        f"[dim]Query: '{query}'[/dim]",
+        f"[dim]Query: '{escape(query)}'[/dim]",
         border_style="cyan"
     ))
     
-    matches = []
-    for i, line in enumerate(extractor.lines):
-        if query.lower() in line.lower():
-            start = max(0, i - context)
-            end = min(len(extractor.lines), i + context + 1)
-            matches.append((i, extractor.lines[start:end]))
-            
-            if len(matches) >= limit:
-                break
+    use_mas_mcp()
+    from lib.lore_search import ARCHIVE_ROOT, LoreSearchIndex, archive_markdown, query_words
+    
+    with LoreSearchIndex() as index:
+        if archive:
+            # Same archive root as the mas_lore_search MCP tool (they share the index)
+            index.update([extractor.lore_path, *archive_markdown(ARCHIVE_ROOT)], prune=ARCHIVE_ROOT)
+        else:
+            index.update([extractor.lore_path])
+        matches = index.search(query, limit=limit, paths=None if archive else [extractor.lore_path])
     
     if not matches:
-        console.print(f"[yellow]No matches for '{query}'[/yellow]")
+        console.print(f"[yellow]No matches for '{escape(query)}'[/yellow]")
         return
     
     console.print(f"[green]Found {len(matches)} matches[/green]\n")
     
-    for line_num, context_lines in matches:
-        console.print(f"[dim]Line {line_num}:[/dim]")
-        for cl in context_lines:
-            # Highlight the query term
-            highlighted = re.sub(
-                f"({re.escape(query)})",
-                r"[bold yellow]\1[/bold yellow]",
-                cl,
-                flags=re.IGNORECASE
-            )
-            console.print(f"  {highlighted}")
+    words = sorted(set(query_words(query)), key=len, reverse=True)
+    highlight = re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+    file_lines = {str(extractor.lore_path.resolve()): extractor.lines}
+    
+    for hit in matches:
+        if hit.path not in file_lines:
+            file_lines[hit.path] = Path(hit.path).read_text(encoding='utf-8', errors='replace').splitlines()
+        lines = file_lines[hit.path]
+        location = "" if hit.path == str(extractor.lore_path.resolve()) else f"{Path(hit.path).relative_to(PROJECT_ROOT)}, "
+        console.print(f"[dim]{escape(location)}Line {hit.line} (score {hit.score:.2f})[/dim]")
+        if hit.section:
+            console.print(f"[dim]  § {escape(hit.section.split(' > ')[-1][:100])}[/dim]")
+        for cl in lines[max(0, hit.line - 1 - context):hit.line + context]:
+            # Highlight the query words
+            parts, last = [], 0
+            for m in highlight.finditer(cl):
+                parts += [escape(cl[last:m.start()]), f"[bold yellow]{escape(m.group())}[/bold yellow]"]
+                last = m.end()
+            console.print("  " + "".join(parts) + escape(cl[last:]))
         console.print()
 
 
@@ -1702,6 +1920,7 @@ class MILFCoreWorldData:
     arsenals: list[LinguisticArsenal]  # LMs as native weapons
     entities: list  # Matriarchal entity data
     cosmology: dict  # Tetrahedral world structure
+    resonances: list[TetrahedralResonance] = field(default_factory=list)  # Not yet extracted from the Codex
 
 
 class MILFCoreExtractor:
@@ -2326,7 +2545,7 @@ def cosmology():
     # Detailed info
     console.print("\n[bold]Tetrahedral Vertices:[/bold]")
     for v in cosmo["vertices"]:
-        console.print(f"  • [cyan]{v['name']}[/cyan] — {v['ruler']}")
+        console.print(f"  • [cyan]{v['name']}[/cyan] — {v['matriarch']}")
         console.print(f"    [dim]{v['principle']}[/dim]")
     
     console.print("\n[bold]Planes:[/bold]")
@@ -2819,6 +3038,19 @@ def whr_capacity():
     """)
 
 
+def abbreviation_engine(codex_path: Path):
+    """
+    The mas_mcp AbbreviationEngine for the Codex at codex_path.
+
+    The abbr-* commands read (`ABBR`) spans, definitions and consistency
+    issues from the engine's usage index, registry snapshot and section
+    cache instead of re-scanning the Codex with their own regexes.
+    """
+    use_mas_mcp()
+    from abbreviation_system import AbbreviationEngine
+    return AbbreviationEngine(codex_path)
+
+
 @app.command()
 def abbr_extract(
     output: str = typer.Option(None, "--output", "-o", help="Output JSON file for extraction"),
@@ -2830,8 +3062,6 @@ def abbr_extract(
     Maps ABBRs to their Tier/WHR/Matriarch connections.
     This is the SIPHONING tool - extracting the established system.
     """
-    import re
-    from collections import defaultdict
     from pathlib import Path
     
     console.print(Panel.fit(
@@ -2846,18 +3076,10 @@ def abbr_extract(
         console.print("[red]ERROR: copilot-instructions.md not found[/red]")
         raise typer.Exit(1)
     
-    codex_text = codex_path.read_text(encoding="utf-8")
-    
-    # Pattern to match (`ABBR`) notation
-    abbr_pattern = re.compile(r'\(`([^`\)]+)`\)')
-    
-    # Find all ABBRs
-    all_abbrs = abbr_pattern.findall(codex_text)
-    
-    # Count occurrences
-    abbr_counts = defaultdict(int)
-    for abbr in all_abbrs:
-        abbr_counts[abbr] += 1
+    # Every (`ABBR`) span, from the shared engine's usage index
+    index = abbreviation_engine(codex_path).usage
+    abbr_counts = {abbr: len(offsets) for abbr, offsets in index.parenthesized.items()}
+    total_abbrs = sum(abbr_counts.values())
     
     # The CANONICAL TIER-WHR-ABBR mapping (extracted from Codex)
     tier_system = {
@@ -3037,7 +3259,7 @@ def abbr_extract(
     
     # Statistics
     console.print("\n[bold cyan]═══ EXTRACTION STATISTICS ═══[/bold cyan]\n")
-    console.print(f"  Total ABBRs found: [bold]{len(all_abbrs)}[/bold]")
+    console.print(f"  Total ABBRs found: [bold]{total_abbrs}[/bold]")
     console.print(f"  Unique ABBRs: [bold]{len(abbr_counts)}[/bold]")
     
     # Top ABBRs by frequency
@@ -3058,8 +3280,8 @@ def abbr_extract(
             "axiom_abbrs": axiom_abbrs,
             "protocol_abbrs": protocol_abbrs,
             "operator_abbrs": operator_abbrs,
-            "abbr_counts": dict(abbr_counts),
-            "total_abbrs": len(all_abbrs),
+            "abbr_counts": abbr_counts,
+            "total_abbrs": total_abbrs,
             "unique_abbrs": len(abbr_counts),
         }
         
@@ -3091,12 +3313,14 @@ def abbr_lookup(
     
     Shows Tier, WHR, Matriarch, and related ABBRs.
     """
-    import re
     from pathlib import Path
     
     # Normalize input (strip backticks/parens if included)
     abbr_clean = abbr.strip("`()' ")
     
+    codex_path = Path(__file__).parent / "copilot-instructions.md"
+    engine = abbreviation_engine(codex_path) if codex_path.exists() else None
+    
     # The complete ABBR database
     abbr_database = {
         # Tier 0.5 - The Decorator
@@ -3189,23 +3413,25 @@ def abbr_lookup(
         if data.get('related'):
             console.print(f"[bold]Related ABBRs:[/bold] {', '.join([f'(`{r}`)' for r in data['related']])}")
         
-        # Count in Codex
-        codex_path = Path(__file__).parent / "copilot-instructions.md"
-        if codex_path.exists():
-            codex_text = codex_path.read_text(encoding="utf-8")
-            pattern = re.compile(rf'\(`{re.escape(abbr_clean)}`\)')
-            count = len(pattern.findall(codex_text))
+        # Codex definition and (`ABBR`) count
+        if engine is not None:
+            entry = engine.registry.lookup(abbr_clean)
+            if entry is not None and entry.full_term:
+                console.print(f"[bold]Codex Definition:[/bold] {entry.full_term} [dim]({entry.section}, line {entry.line_number})[/dim]")
+            count = len(engine.usage.parenthesized.get(abbr_clean, ()))
             console.print(f"[bold]Codex Occurrences:[/bold] {count}")
     else:
         console.print(f"\n[yellow]ABBR (`{abbr_clean}`) not in canonical database.[/yellow]")
         console.print("[dim]Try: CRC-AS, LIPAA, FA⁴, T-DECOR, TMO, etc.[/dim]")
         
-        # Still search the Codex
-        codex_path = Path(__file__).parent / "copilot-instructions.md"
-        if codex_path.exists():
-            codex_text = codex_path.read_text(encoding="utf-8")
-            pattern = re.compile(rf'\(`{re.escape(abbr_clean)}`\)')
-            count = len(pattern.findall(codex_text))
+        # Still search the Codex: its definitions, then its (`ABBR`) spans
+        if engine is not None:
+            matches = engine.lookup(abbr_clean, limit=5)
+            if matches:
+                console.print("\n[bold]Codex definitions:[/bold]")
+                for entry in matches:
+                    console.print(f"  (`{entry.abbreviation}`) → {entry.full_term} [dim]({entry.section})[/dim]")
+            count = len(engine.usage.parenthesized.get(abbr_clean, ()))
             if count > 0:
                 console.print(f"\n[green]Found {count} occurrences in Codex (unclassified ABBR)[/green]")
 
@@ -3224,6 +3450,7 @@ def abbr_validate(
     - Terms that SHOULD be abbreviated but aren't
     - Section-by-section ABBR density
     - Orphaned ABBRs (used once, never defined)
+    - The abbreviation engine's consistency checks
     """
     import re
     from collections import defaultdict, Counter
@@ -3241,19 +3468,15 @@ def abbr_validate(
         console.print("[red]ERROR: copilot-instructions.md not found[/red]")
         raise typer.Exit(1)
     
-    codex_text = codex_path.read_text(encoding="utf-8")
-    lines = codex_text.split('\n')
-    
-    # Pattern to match (`ABBR`) notation
-    abbr_pattern = re.compile(r'\(`([^`\)]+)`\)')
+    engine = abbreviation_engine(codex_path)
+    index = engine.usage  # (`ABBR`) spans from the shared usage index
+    lines = index.content.split('\n')
     
     # ═══ SECTION DETECTION ═══
-    section_pattern = re.compile(r'^###?\s*\*?\*?\(?[IVX0-9]+\.?[0-9]*\.?\)?\.?\s*[\(`]?([^\n]+)')
-    
-    # Parse into sections
+    # Parse into sections (1-based line range of each)
     sections = {}
     current_section = "PREAMBLE"
-    current_content = []
+    current_start = 1
     
     for i, line in enumerate(lines):
         # Detect section headers
@@ -3262,31 +3485,28 @@ def abbr_validate(
             roman_match = re.match(r'^###?\s*\*?\*?\(?([IVX]+|[0-9]+)\.', line)
             if roman_match:
                 # Save previous section
-                if current_content:
-                    sections[current_section] = {
-                        "content": '\n'.join(current_content),
-                        "line_start": len(lines) - len(current_content) - i,
-                    }
+                if i + 1 > current_start:
+                    sections[current_section] = {"line_start": current_start, "line_end": i}
                 current_section = roman_match.group(1)
-                current_content = [line]
-                continue
-        current_content.append(line)
+                current_start = i + 1
     
     # Save final section
-    if current_content:
-        sections[current_section] = {"content": '\n'.join(current_content)}
+    sections[current_section] = {"line_start": current_start, "line_end": len(lines)}
     
     # ═══ ABBR EXTRACTION WITH POSITION ═══
     abbr_positions = defaultdict(list)  # abbr -> list of (line_num, context)
     abbr_counts = Counter()
+    line_abbrs = defaultdict(list)  # line_num -> ABBRs on it, in order
     
-    for i, line in enumerate(lines):
-        found = abbr_pattern.findall(line)
-        for abbr in found:
-            abbr_counts[abbr] += 1
+    for abbr, offsets in index.parenthesized.items():
+        abbr_counts[abbr] = len(offsets)
+        for offset in offsets:
+            line_num = index.line_of(offset)
+            line = lines[line_num - 1].strip()
             # Get context (surrounding text)
-            context = line.strip()[:100] + "..." if len(line.strip()) > 100 else line.strip()
-            abbr_positions[abbr].append((i + 1, context))
+            context = line[:100] + "..." if len(line) > 100 else line
+            abbr_positions[abbr].append((line_num, context))
+            line_abbrs[line_num].append((offset, abbr))
     
     # ═══ CLASSIFY ABBRs ═══
     
@@ -3341,8 +3561,9 @@ def abbr_validate(
     # ═══ SECTION-BY-SECTION ANALYSIS ═══
     section_abbr_density = {}
     for sec_name, sec_data in sections.items():
-        content = sec_data.get("content", "")
-        found = abbr_pattern.findall(content)
+        start, end = sec_data["line_start"], sec_data["line_end"]
+        content = '\n'.join(lines[start - 1:end])
+        found = [abbr for line_num in range(start, end + 1) for _, abbr in sorted(line_abbrs.get(line_num, ()))]
         word_count = len(content.split())
         abbr_count = len(found)
         unique_in_section = len(set(found))
@@ -3493,6 +3714,13 @@ def abbr_validate(
             variant_str = ", ".join([f"(`{v}`) ×{abbr_counts[v]}" for v in variants])
             console.print(f"  {variant_str}")
     
+    # Registry-level checks (duplicates, variants, orphans, tier notation, ...)
+    engine_issues = Counter(f"{issue.severity.value}/{issue.category.value}" for issue in engine.validate())
+    if engine_issues:
+        console.print("\n[bold]Abbreviation engine checks:[/bold]")
+        for kind, count in engine_issues.most_common():
+            console.print(f"  {kind}: {count}")
+    
     # ═══ VALIDATION SUMMARY ═══
     console.print("\n[bold cyan]═══ VALIDATION SUMMARY ═══[/bold cyan]\n")
     
@@ -3530,6 +3758,7 @@ def abbr_validate(
             "high_frequency": dict(sorted(high_freq_abbrs.items(), key=lambda x: x[1], reverse=True)),
             "orphan_candidates": orphan_candidates,
             "section_density": section_abbr_density,
+            "engine_issues": dict(engine_issues),
             "all_abbrs": dict(abbr_counts),
             "abbr_positions": {k: [(ln, ctx) for ln, ctx in v] for k, v in abbr_positions.items()},
         }
@@ -3556,7 +3785,6 @@ def abbr_coverage(
     
     Quick view of ABBR system health.
     """
-    import re
     from collections import Counter
     from pathlib import Path
     
@@ -3571,11 +3799,9 @@ def abbr_coverage(
         console.print("[red]ERROR: copilot-instructions.md not found[/red]")
         raise typer.Exit(1)
     
-    codex_text = codex_path.read_text(encoding="utf-8")
-    
     # Count ABBRs
-    abbr_pattern = re.compile(r'\(`([^`\)]+)`\)')
-    abbr_counts = Counter(abbr_pattern.findall(codex_text))
+    index = abbreviation_engine(codex_path).usage
+    abbr_counts = Counter({abbr: len(offsets) for abbr, offsets in index.parenthesized.items()})
     
     # Classify
     covered = sum(1 for c in abbr_counts.values() if c >= threshold)
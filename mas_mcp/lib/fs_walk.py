@@ -0,0 +1,82 @@
+"""
+Filesystem Walker: Single-Pass Pruned Tree Traversal
+=====================================================
+
+`Path.rglob('*')` materializes every path in the tree - including everything
+under node_modules, target, .git and virtualenvs - before callers filter
+exclusions out, and each `is_file()`/`stat()` on the results is another
+syscall. This walker is built on `os.scandir`:
+
+- Excluded directories are pruned by name before descending
+- Files are yielded as `os.DirEntry`, whose `is_file()`/`stat()` results are
+  cached (free on Windows, one stat per file on POSIX)
+- Void directories (empty, or only dot-entries) are reported from the same
+  listing, without a second `iterdir()`
+- Entries are visited in sorted name order, so output is deterministic
+  across filesystems
+
+Usage:
+    from lib.fs_walk import walk_files
+
+    void_dirs = []
+    for entry in walk_files(root, exclude_dirs={"node_modules", ".git"}, void_dirs=void_dirs):
+        size = entry.stat().st_size
+
+Used by the DCRP scanner, mas_scan, _compute_directory_fingerprint and the
+background FileWatcher.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import AbstractSet, Iterator, List, Optional, Union
+
+
+def walk_files(
+    root: Union[str, Path],
+    exclude_dirs: AbstractSet[str] = frozenset(),
+    exclude_files: AbstractSet[str] = frozenset(),
+    void_dirs: Optional[List[Path]] = None,
+) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every regular file under root.
+
+    Args:
+        root: Directory to walk (not itself reported as void)
+        exclude_dirs: Directory names never descended into
+        exclude_files: File names never yielded
+        void_dirs: If given, directories that are empty or contain only
+            dot-entries are appended to it
+
+    Symlinked directories are not followed. Unreadable directories are
+    skipped silently.
+    """
+    root_str = os.fspath(root)
+    stack = [root_str]
+
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        if void_dirs is not None and current != root_str:
+            if all(e.name.startswith('.') for e in entries):
+                void_dirs.append(Path(current))
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude_dirs:
+                        subdirs.append(entry.path)
+                elif entry.name not in exclude_files and entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+
+        # Reverse so the first subdirectory is walked next (sorted pre-order)
+        stack.extend(reversed(subdirs))
@@ -0,0 +1,329 @@
+"""
+Lore Search: Ranked Full-Text Index over the Codex
+===================================================
+
+`asc lore-search` lowercased every line of copilot-instructions.md on each
+query and returned the first N substring hits in file order. LoreSearchIndex
+keeps a SQLite FTS5 index of the Codex (and, on request, every markdown file
+in the archive) in mas_cache/lore_search.sqlite:
+
+- Files are split into blocks (runs of non-blank lines, at most BLOCK_LINES
+  long), each stored with its path, line range and enclosing header path
+- Results are BM25-ranked; queries support "quoted phrases" and prefix*
+  terms, and any other punctuation separates words, so user input is never
+  an FTS5 syntax error
+- Hits carry a highlighted snippet, so callers (the MCP tool in particular)
+  get an answer without loading the whole file
+- update() re-indexes only files whose SHA-256 changed (files whose mtime
+  and size are unchanged are not even read), one file at a time, so memory
+  stays bounded by the largest file rather than the archive
+
+Usage:
+    from lib.lore_search import LoreSearchIndex
+
+    with LoreSearchIndex() as index:
+        index.update([codex_path])
+        for hit in index.search('"apex synthesis" orack*', limit=5):
+            print(hit.path, hit.line, hit.section, hit.snippet)
+
+Used by asc_toolchain.lore_search and the mas_lore_search MCP tool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from .fs_walk import walk_files
+
+PathLike = str | os.PathLike[str]
+
+INDEX_PATH = Path(__file__).resolve().parent.parent / "mas_cache" / "lore_search.sqlite"
+ARCHIVE_ROOT = Path(__file__).resolve().parents[2]  # Repository root, shared by every caller
+SCHEMA_VERSION = 1
+BLOCK_LINES = 12
+ARCHIVE_EXCLUDE_DIRS = frozenset({
+    ".git", "node_modules", "target", ".venv", "venv", "__pycache__", "mas_cache", "backups",
+})
+
+HEADER_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
+QUERY_TERM_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+WORD_PATTERN = re.compile(r"\w+")
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE documents (
+    path TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    first_block INTEGER NOT NULL,
+    blocks INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE blocks USING fts5(
+    body, path UNINDEXED, start UNINDEXED, stop UNINDEXED, section UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+@dataclass
+class SearchHit:
+    """One ranked match: a block of a file, located by its best line."""
+
+    path: str
+    line: int  # 1-based line of the block that contains a query word
+    start: int  # 1-based first line of the block
+    stop: int  # 1-based last line of the block
+    section: str  # Enclosing headers, outermost first, joined with " > "
+    snippet: str  # Block excerpt with matches wrapped in the highlight markers
+    score: float  # BM25 relevance (higher is better)
+
+
+def parse_query(query: str) -> list[tuple[list[str], bool]]:
+    """
+    Terms of a user query as (words, is_prefix).
+
+    A "quoted phrase" is one term; `word*` is a prefix term; a bare token
+    with punctuation (e.g. CRC-AS) is the phrase of its words.
+    """
+    terms = []
+    for phrase, token in QUERY_TERM_PATTERN.findall(query):
+        words = WORD_PATTERN.findall(phrase or token)
+        if words:
+            terms.append((words, bool(token) and token.endswith("*")))
+    return terms
+
+
+def compile_query(query: str) -> str:
+    """FTS5 MATCH expression for a user query (implicit AND of its terms, "" if it has no words)."""
+    return " ".join(
+        '"' + " ".join(words) + '"' + ("*" if prefix else "")
+        for words, prefix in parse_query(query)
+    )
+
+
+def query_words(query: str) -> list[str]:
+    """Every word of a user query, lowercased (for locating and highlighting matches)."""
+    return [word.lower() for words, _ in parse_query(query) for word in words]
+
+
+def split_blocks(text: str, block_lines: int = BLOCK_LINES) -> Iterator[tuple[int, int, str, str]]:
+    """
+    Yield (start, stop, section, body) blocks of a markdown text.
+
+    Lines are 1-based. Blank lines and headers end a block; a header opens
+    the next one. Headers inside ``` fences are ordinary lines.
+    """
+    open_headers: list[tuple[int, str]] = []  # (level, title) from outermost to current
+    block: list[str] = []
+    block_start = 0
+    section = ""
+    in_fence = False
+
+    for number, line in enumerate(text.splitlines(), 1):
+        header = None
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith("#"):
+            header = HEADER_PATTERN.match(line)
+
+        if block and (header or not line.strip() or len(block) >= block_lines):
+            yield block_start, block_start + len(block) - 1, section, "\n".join(block)
+            block = []
+        if header:
+            level = len(header.group(1))
+            while open_headers and open_headers[-1][0] >= level:
+                open_headers.pop()
+            open_headers.append((level, header.group(2).strip("* ")))
+        if line.strip():
+            if not block:
+                block_start = number
+                section = " > ".join(title for _, title in open_headers)
+            block.append(line)
+
+    if block:
+        yield block_start, block_start + len(block) - 1, section, "\n".join(block)
+
+
+def archive_markdown(root: PathLike = ARCHIVE_ROOT) -> Iterator[Path]:
+    """Every markdown file under root, skipping build, VCS and cache directories."""
+    for entry in walk_files(root, exclude_dirs=ARCHIVE_EXCLUDE_DIRS):
+        if entry.name.endswith(".md"):
+            yield Path(entry.path)
+
+
+class LoreSearchIndex:
+    """SQLite FTS5 index of markdown files, updated per file by content hash."""
+
+    def __init__(self, path: PathLike | None = INDEX_PATH):
+        """
+        Args:
+            path: Database file (None keeps the index in memory)
+        """
+        if path is None:
+            self.db = sqlite3.connect(":memory:")
+        else:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self.db = sqlite3.connect(os.fspath(path))
+        self._ensure_schema()
+
+    def __enter__(self) -> LoreSearchIndex:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.db.close()
+
+    def _ensure_schema(self) -> None:
+        """Create the tables, or recreate them if they are from another schema version."""
+        try:
+            row = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        if row and row[0] == str(SCHEMA_VERSION):
+            return
+        with self.db:
+            for table in ("meta", "documents", "blocks"):
+                self.db.execute(f"DROP TABLE IF EXISTS {table}")
+            self.db.executescript(SCHEMA)
+            self.db.execute("INSERT INTO meta VALUES ('version', ?)", (str(SCHEMA_VERSION),))
+
+    def documents(self) -> dict[str, str]:
+        """Indexed path -> SHA-256 of the content it was indexed from."""
+        return dict(self.db.execute("SELECT path, sha256 FROM documents"))
+
+    def update(self, paths: Iterable[PathLike], prune: PathLike | None = None) -> dict[str, int]:
+        """
+        Bring the index up to date with paths.
+
+        Files whose mtime and size match the index are skipped unread; the
+        rest are hashed and re-indexed only if their content changed.
+        Missing files are dropped from the index.
+
+        Args:
+            paths: Files to index
+            prune: Directory (usually ARCHIVE_ROOT) whose indexed files are
+                dropped when not in paths; files elsewhere are kept
+
+        Returns:
+            Counts of indexed, unchanged and removed files
+        """
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+        seen = set()
+        with self.db:
+            for path in paths:
+                key = os.fspath(Path(path).resolve())
+                if key in seen:
+                    continue
+                seen.add(key)
+                row = self.db.execute(
+                    "SELECT sha256, mtime_ns, size FROM documents WHERE path = ?", (key,)
+                ).fetchone()
+                try:
+                    stat = os.stat(key)
+                    if row and (row[1], row[2]) == (stat.st_mtime_ns, stat.st_size):
+                        counts["unchanged"] += 1
+                        continue
+                    data = Path(key).read_bytes()
+                except OSError:
+                    if row:
+                        self._remove(key)
+                        counts["removed"] += 1
+                    continue
+
+                digest = hashlib.sha256(data).hexdigest()
+                if row and row[0] == digest:
+                    self.db.execute(
+                        "UPDATE documents SET mtime_ns = ?, size = ? WHERE path = ?",
+                        (stat.st_mtime_ns, stat.st_size, key),
+                    )
+                    counts["unchanged"] += 1
+                    continue
+                if row:
+                    self._remove(key)
+                self._insert(key, data.decode("utf-8", errors="replace"), digest, stat)
+                counts["indexed"] += 1
+
+            if prune is not None:
+                prefix = os.path.join(os.fspath(Path(prune).resolve()), "")
+                for (key,) in self.db.execute("SELECT path FROM documents").fetchall():
+                    if key not in seen and key.startswith(prefix):
+                        self._remove(key)
+                        counts["removed"] += 1
+        return counts
+
+    def _insert(self, key: str, text: str, digest: str, stat: os.stat_result) -> None:
+        # Blocks of one file get consecutive rowids, so removal is a range delete
+        first = self.db.execute("SELECT COALESCE(MAX(rowid), 0) + 1 FROM blocks").fetchone()[0]
+        count = 0
+        rows = []
+        for start, stop, section, body in split_blocks(text):
+            rows.append((first + count, body, key, start, stop, section))
+            count += 1
+        self.db.executemany(
+            "INSERT INTO blocks (rowid, body, path, start, stop, section) VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+        self.db.execute(
+            "INSERT INTO documents VALUES (?, ?, ?, ?, ?, ?)",
+            (key, digest, stat.st_mtime_ns, stat.st_size, first, count),
+        )
+
+    def _remove(self, key: str) -> None:
+        first, count = self.db.execute(
+            "SELECT first_block, blocks FROM documents WHERE path = ?", (key,)
+        ).fetchone()
+        self.db.execute("DELETE FROM blocks WHERE rowid >= ? AND rowid < ?", (first, first + count))
+        self.db.execute("DELETE FROM documents WHERE path = ?", (key,))
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        paths: Sequence[PathLike] | None = None,
+        highlight: tuple[str, str] = ("«", "»"),
+        snippet_tokens: int = 16,
+    ) -> list[SearchHit]:
+        """
+        BM25-ranked blocks matching every term of query.
+
+        Args:
+            query: Words, "quoted phrases" and prefix* terms
+            limit: Maximum hits
+            paths: Only search these files (default: everything indexed)
+            highlight: Markers placed around matched words in snippets
+            snippet_tokens: Approximate snippet length in words
+        """
+        match = compile_query(query)
+        if not match or limit <= 0:
+            return []
+
+        sql = (
+            "SELECT path, start, stop, section, body, snippet(blocks, 0, ?, ?, '…', ?), rank"
+            " FROM blocks WHERE blocks MATCH ?"
+        )
+        params: list = [highlight[0], highlight[1], snippet_tokens, match]
+        if paths is not None:
+            keys = [os.fspath(Path(path).resolve()) for path in paths]
+            sql += f" AND path IN ({', '.join('?' * len(keys))})"
+            params += keys
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        words = query_words(query)
+        hits = []
+        for path, start, stop, section, body, snippet, rank in self.db.execute(sql, params):
+            line = start
+            for offset, text in enumerate(body.lower().split("\n")):
+                if any(word in text for word in words):
+                    line = start + offset
+                    break
+            hits.append(SearchHit(path, line, start, stop, section, snippet, -rank))
+        return hits
@@ -0,0 +1,137 @@
+"""
+Module Index: Import Resolution Without Filesystem Probes
+==========================================================
+
+The DCRP scripts resolved every import by probing candidates with
+`Path.exists()` - `pkg/mod.py`, then `pkg/mod/__init__.py` for Python,
+`x.rs`, then `x/mod.rs` for Rust, and up to nine extension/index candidates
+per TypeScript specifier. That is one or more stat calls per import, per file,
+per run.
+
+ModuleIndex is built once from the same directory walk that discovers the
+files, and answers all of those questions with set/dict lookups:
+
+- python_modules: dotted module name -> file (`a.b` -> a/b.py or a/b/__init__.py)
+- rust_modules: crate path -> file (`crate::a::b` -> src/a/b.rs or src/a/b/mod.rs)
+- is_file()/is_dir(): existence checks for relative imports (super::, from ..,
+  ./specifier) and the TypeScript resolver
+
+Files under excluded directories are not indexed, so imports into them do not
+resolve - they are never graph nodes anyway.
+
+Usage:
+    from lib.module_index import ModuleIndex
+
+    index = ModuleIndex.build(repo_root, exclude_dirs={"node_modules", ".git"})
+    index.python_module("mas_mcp.server")              # Path or None
+    index.module_file(pkg_dir, ["utils"], ".py", "__init__.py")
+
+Used by decorator_cross_ref_production.py, decorator_cross_ref_maximum.py and
+(through is_file/is_dir) typescript_dependency_resolver.py.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterable, Optional, Sequence, Set, Union
+
+from .fs_walk import walk_files
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class ModuleIndex:
+    """Set of known files plus Python/Rust module-name maps, rooted at one directory."""
+
+    def __init__(self, root: PathLike, paths: Iterable[PathLike], crate_root: str = "src"):
+        """
+        Args:
+            root: Repository root (absolute)
+            paths: Every file found by the walk (absolute)
+            crate_root: Directory under root that `crate::` paths resolve from
+        """
+        self.root = os.path.normpath(os.fspath(root))
+        self.files: Set[str] = set()
+        self.dirs: Set[str] = {self.root}
+        self.python_modules: Dict[str, Path] = {}
+        self.rust_modules: Dict[str, Path] = {}
+
+        crate_dir = os.path.join(self.root, crate_root)
+        for path in paths:
+            path = os.path.normpath(os.fspath(path))
+            self.files.add(path)
+            directory = os.path.dirname(path)
+            while directory not in self.dirs and len(directory) > len(self.root):
+                self.dirs.add(directory)
+                directory = os.path.dirname(directory)
+
+            stem, ext = os.path.splitext(path)
+            if ext == ".py":
+                self._add_module(self.python_modules, self.root, stem, "__init__", ".", path)
+            elif ext == ".rs" and path.startswith(crate_dir + os.sep):
+                self._add_module(self.rust_modules, crate_dir, stem, "mod", "::", path, prefix="crate")
+
+    @staticmethod
+    def _add_module(
+        modules: Dict[str, Path],
+        base: str,
+        stem: str,
+        package_stem: str,
+        sep: str,
+        path: str,
+        prefix: str = "",
+    ) -> None:
+        if not stem.startswith(base + os.sep):
+            return
+        parts = stem[len(base) + 1:].split(os.sep)
+        if parts[-1] == package_stem:
+            # Package file: lower priority than a sibling module file
+            name = sep.join(([prefix] if prefix else []) + parts[:-1])
+            modules.setdefault(name, Path(path))
+        else:
+            name = sep.join(([prefix] if prefix else []) + parts)
+            modules[name] = Path(path)
+
+    @classmethod
+    def build(
+        cls,
+        root: PathLike,
+        exclude_dirs: AbstractSet[str] = frozenset(),
+        exclude_files: AbstractSet[str] = frozenset(),
+    ) -> "ModuleIndex":
+        """Walk root once and index every file (for callers without their own walk)."""
+        return cls(root, (entry.path for entry in walk_files(root, exclude_dirs, exclude_files)))
+
+    def is_file(self, path: PathLike) -> bool:
+        return os.path.normpath(os.fspath(path)) in self.files
+
+    def is_dir(self, path: PathLike) -> bool:
+        return os.path.normpath(os.fspath(path)) in self.dirs
+
+    def python_module(self, dotted: str) -> Optional[Path]:
+        """File for an absolute dotted module name (module file before package __init__)."""
+        return self.python_modules.get(dotted)
+
+    def rust_module(self, crate_path: str) -> Optional[Path]:
+        """File for a `crate::a::b` path (a/b.rs before a/b/mod.rs)."""
+        return self.rust_modules.get(crate_path)
+
+    def module_file(
+        self,
+        base_dir: PathLike,
+        parts: Sequence[str],
+        suffix: str,
+        package_file: str,
+    ) -> Optional[Path]:
+        """
+        Resolve base_dir/parts as `<target><suffix>`, then `<target>/<package_file>`.
+
+        For relative imports, where the module name is anchored at a
+        directory rather than the index root.
+        """
+        target = os.path.normpath(os.path.join(os.fspath(base_dir), *parts))
+        for candidate in (target + suffix, os.path.join(target, package_file)):
+            if candidate in self.files:
+                return Path(candidate)
+        return None
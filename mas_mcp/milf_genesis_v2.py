@@ -995,6 +995,14 @@ class MILFGenesisEngineV2:
         
         return {k: str(v) for k, v in paths.items()}
     
+    def write_feature_store(self, path: Optional[Path] = None) -> Path:
+        """Write accepted entities as a memory-mapped feature store for batch scoring."""
+        from feature_store import entities_to_feature_store, genesis_entity_record
+        
+        path = path or self.artifacts_dir / "features"
+        records = [genesis_entity_record(e.to_dict()) for e in self.generated_entities]
+        return entities_to_feature_store(path, records, source=f"genesis:{self.mpw_hash}")
+    
     def get_environment(self) -> Dict[str, Any]:
         """Get environment fingerprint."""
         return {
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+MAS-MCP Tile Size Autotuner
+Sweeps tile sizes for the 'score', 'hierarchy' and 'edges' workloads on the
+current host (CPU or GPU) and stores the winners in the tile profile file,
+keyed by hardware fingerprint. get_score_tiler()/get_hierarchy_tiler() and
+every TiledBatchProcessor pick the tuned sizes up at startup.
+
+Run OUTSIDE VS Code on Windows laptops (large sweeps approach the TDR limit).
+
+Usage:
+  python scripts/autotune_tiles.py [--workloads score hierarchy edges]
+                                   [--profile PATH] [--repeats N] [--dry-run]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+MAS_MCP_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(MAS_MCP_ROOT))
+
+from gpu_orchestrator import (  # noqa: E402
+    TILE_PROFILE_PATH,
+    TiledBatchProcessor,
+    _entity_to_vector,
+    hardware_fingerprint,
+    save_tile_profile,
+)
+
+# Candidate sizes per workload (ascending; the sweep stops at the first
+# candidate that blows the per-tile budget)
+SWEEP_SIZES = {
+    "score": [500, 1000, 2500, 5000, 10000, 20000, 40000, 80000],
+    "hierarchy": [250, 500, 1000, 2000, 4000, 8000],
+    "edges": [5000, 10000, 25000, 50000, 100000, 200000, 400000],
+}
+
+# Only accept sizes that leave this much of MAX_TILE_MS as headroom
+BUDGET_FRACTION = 0.8
+
+# A hierarchy pass in mas_gpu_hierarchy runs iterations // 2 layout steps
+HIERARCHY_PASS_STEPS = 50
+HIERARCHY_SAMPLE_STEPS = 2
+
+# Node count used to isolate edge-attraction cost in the 'edges' workload
+EDGE_WORKLOAD_NODES = 256
+
+# Width of the entity feature vectors mas_gpu_batch_score scores
+SCORE_FEATURE_DIM = _entity_to_vector("").shape[0]
+
+
+def _score_workload(size: int, rng: np.random.Generator) -> Callable[[], None]:
+    from gpu_scores import batch_score
+
+    # Same shapes and call as a mas_gpu_batch_score tile
+    vectors = rng.random((size, SCORE_FEATURE_DIM)).astype(np.float32)
+    reference = rng.random((500, SCORE_FEATURE_DIM)).astype(np.float32)
+    return lambda: batch_score(vectors, reference, features=vectors, seed=42)
+
+
+def _layout_workload(
+    nodes: int,
+    edges: int,
+    steps: int,
+    rng: np.random.Generator
+) -> Callable[[], None]:
+    from gpu_forces import LayoutConfig, initialize_layout, layout_step
+
+    node_ids = [f"n{i}" for i in range(nodes)]
+    tiers = rng.choice([1.0, 2.0, 3.0, 4.0], size=nodes).astype(np.float32)
+    src = rng.integers(0, nodes, size=edges)
+    tgt = rng.integers(0, nodes, size=edges)
+    edge_list = [(int(a), int(b), 1.0) for a, b in zip(src, tgt, strict=True)]
+    config = LayoutConfig(max_iterations=steps, seed=42)
+
+    def run() -> None:
+        state = initialize_layout(node_ids, tiers.tolist(), edge_list, seed=42)
+        for _ in range(steps):
+            state = layout_step(state, config, tiers)
+
+    return run
+
+
+def _hierarchy_workload(size: int, rng: np.random.Generator) -> Callable[[], None]:
+    return _layout_workload(size, size * 2, HIERARCHY_SAMPLE_STEPS, rng)
+
+
+def _edges_workload(size: int, rng: np.random.Generator) -> Callable[[], None]:
+    return _layout_workload(EDGE_WORKLOAD_NODES, size, 1, rng)
+
+
+WORKLOADS = {
+    "score": (_score_workload, 1.0),
+    "hierarchy": (_hierarchy_workload, HIERARCHY_PASS_STEPS / HIERARCHY_SAMPLE_STEPS),
+    "edges": (_edges_workload, 1.0),
+}
+
+
+def sweep_workload(workload: str, repeats: int = 3, seed: int = 42) -> dict:
+    """
+    Time each candidate tile size and pick the fastest one within budget.
+
+    Returns {"tile_size": int, "sweep": [{tile_size, tile_ms, items_per_second}]};
+    tile_size is None when even the smallest candidate exceeds the budget.
+    """
+    build, scale = WORKLOADS[workload]
+    budget_ms = TiledBatchProcessor.MAX_TILE_MS * BUDGET_FRACTION
+    rng = np.random.default_rng(seed)
+
+    sweep = []
+    best = None
+    for size in SWEEP_SIZES[workload]:
+        run = build(size, rng)
+        run()  # Warm-up (JIT, allocator, CUDA context)
+
+        samples = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            run()
+            samples.append((time.perf_counter() - t0) * 1000 * scale)
+        tile_ms = statistics.median(samples)
+
+        point = {
+            "tile_size": size,
+            "tile_ms": round(tile_ms, 2),
+            "items_per_second": round(size / tile_ms * 1000, 1) if tile_ms > 0 else 0.0,
+        }
+        sweep.append(point)
+        print(f"   {workload:<10} {size:>8,}  {tile_ms:9.1f} ms  {point['items_per_second']:>14,.0f}/s")
+
+        if tile_ms > budget_ms:
+            break
+        if best is None or point["items_per_second"] >= best["items_per_second"]:
+            best = point
+
+    return {"tile_size": best["tile_size"] if best else None, "sweep": sweep}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MAS-MCP tile size autotuner")
+    parser.add_argument("--workloads", nargs="+", choices=sorted(WORKLOADS),
+                        default=["score", "hierarchy", "edges"],
+                        help="Workloads to sweep")
+    parser.add_argument("--profile", type=Path, default=TILE_PROFILE_PATH,
+                        help="Tile profile JSON to update")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="Timed runs per candidate (median is used)")
+    parser.add_argument("--probe", action="store_true",
+                        help="Attach the full GPU probe result to the host entry")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print results without saving")
+    args = parser.parse_args()
+
+    key, descriptor = hardware_fingerprint()
+    print("🎛️  MAS-MCP Tile Autotune")
+    print(f"   Host: {key} ({descriptor['backend']}, {descriptor['device_name']})")
+    print(f"   Budget: {TiledBatchProcessor.MAX_TILE_MS * BUDGET_FRACTION:.0f} ms per tile")
+    print()
+
+    tile_sizes = {}
+    sweeps = {}
+    for workload in args.workloads:
+        result = sweep_workload(workload, repeats=args.repeats)
+        sweeps[workload] = result["sweep"]
+        if result["tile_size"] is None:
+            # Persisting a floor value would look like a measured optimum
+            print(f"   ⚠️  {workload}: no candidate fits the budget, keeping the current size")
+        else:
+            tile_sizes[workload] = result["tile_size"]
+            print(f"   → {workload}: {result['tile_size']:,}")
+        print()
+
+    if not tile_sizes:
+        print("⚠️  No workload produced a tuned size; profile not updated")
+        return 1
+
+    if args.dry_run:
+        print("--- DRY RUN: Tuned sizes ---")
+        print(json.dumps(tile_sizes, indent=2))
+        return 0
+
+    probe = None
+    if args.probe:
+        from lib.gpu_probe import probe_gpu_capabilities
+        probe = probe_gpu_capabilities().to_dict()
+
+    path = save_tile_profile(tile_sizes, sweeps=sweeps, path=args.profile, extra_hardware=probe)
+    print(f"💾 Profile saved: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
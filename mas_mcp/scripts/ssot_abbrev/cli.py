@@ -1,6 +1,10 @@
 """
 SSOT Abbreviation System CLI — Command-line interface.
 
+Every command runs on abbreviation_system.AbbreviationEngine (single-pass
+parser, registry snapshot, per-section scan cache), shared with
+`python -m abbreviation_system.cli` and the asc_toolchain abbr-* commands.
+
 Usage:
     uv run python -m mas_mcp.scripts.ssot_abbrev.cli [command] [options]
 
@@ -13,11 +17,15 @@ Commands:
 """
 
 import argparse
+import hashlib
 import sys
 from datetime import datetime
 from pathlib import Path
 from shutil import copy2
 
+from ...abbreviation_system.engine import AbbreviationEngine
+from ...abbreviation_system.models import IssueCategory
+
 
 def get_ssot_path() -> Path:
     """Get path to SSOT document."""
@@ -39,66 +47,50 @@ def get_ssot_path() -> Path:
     return ssot_path
 
 
+def save_glossary_files(engine: AbbreviationEngine, output_dir: Path) -> dict[str, Path]:
+    """Write the markdown glossary and the registry JSON to output_dir."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    reporter = engine.reporter
+
+    glossary_path = output_dir / "ABBREVIATION_GLOSSARY.md"
+    glossary_path.write_text(reporter.generate_glossary(), encoding="utf-8")
+
+    return {
+        "glossary": glossary_path,
+        "registry": reporter.registry.export_json(output_dir / "abbreviation_registry.json"),
+    }
+
+
 def cmd_audit(args):
     """Run full abbreviation audit."""
-    from .parser import SSOTParser
-    from .registry import AbbreviationRegistry
-    from .reporter import AbbreviationReporter
-    from .validator import AbbreviationValidator
-
     print("\n🔍 SSOT Abbreviation Audit Starting...\n")
 
     ssot_path = get_ssot_path()
     print(f"📄 Reading: {ssot_path}")
 
-    content = ssot_path.read_text(encoding="utf-8")
-
-    # Parse
-    parser = SSOTParser()
-    entries = parser.parse_document(content)
-    print(f"✅ Parsed {len(entries)} abbreviation entries")
-
-    # Build registry
-    registry = AbbreviationRegistry()
-    for entry in entries:
-        registry.add_entry(entry)
-
-    # Validate
-    validator = AbbreviationValidator(registry)
-    issues = validator.validate_all()
-
-    # Report
-    reporter = AbbreviationReporter(registry)
-    print(reporter.console_summary())
+    report = AbbreviationEngine(ssot_path).report()
+    print(f"✅ Parsed {report.total_abbreviations} abbreviation entries")
+    print()
+    print(report.summary())
 
     if args.recommendations:
-        print(reporter.standardization_recommendations())
+        print("📋 Standardization Recommendations:")
+        for recommendation in report.recommendations:
+            print(f"   {recommendation}")
 
     return 0
 
 
 def cmd_glossary(args):
     """Generate master glossary."""
-    from .generator import save_glossary_files
-    from .parser import SSOTParser
-    from .registry import AbbreviationRegistry
-
     print("\n📚 Generating Master Glossary...\n")
 
     ssot_path = get_ssot_path()
-    content = ssot_path.read_text(encoding="utf-8")
-
-    parser = SSOTParser()
-    entries = parser.parse_document(content)
-
-    registry = AbbreviationRegistry()
-    for entry in entries:
-        registry.add_entry(entry)
 
     # Output directory
     output_dir = Path(args.output) if args.output else ssot_path.parent / "glossary"
 
-    files = save_glossary_files(registry, output_dir)
+    files = save_glossary_files(AbbreviationEngine(ssot_path), output_dir)
 
     print("✅ Generated glossary files:")
     for name, path in files.items():
@@ -109,46 +101,27 @@ def cmd_glossary(args):
 
 def cmd_validate(args):
     """Validate abbreviation consistency."""
-    from .parser import SSOTParser
-    from .registry import AbbreviationRegistry
-    from .validator import AbbreviationValidator
-
     print("\n🔎 Validating Abbreviation Consistency...\n")
 
-    ssot_path = get_ssot_path()
-    content = ssot_path.read_text(encoding="utf-8")
-
-    parser = SSOTParser()
-    entries = parser.parse_document(content)
-
-    registry = AbbreviationRegistry()
-    for entry in entries:
-        registry.add_entry(entry)
-
-    validator = AbbreviationValidator(registry)
-    results = validator.validate_all()
+    issues = AbbreviationEngine(get_ssot_path()).validate()
 
-    total_issues = sum(len(v) for v in results.values())
-
-    if total_issues == 0:
+    if not issues:
         print("✅ All validations passed! Abbreviation system is architectonically sound.")
         return 0
-    else:
-        print(f"⚠️ {total_issues} issues detected:\n")
-        for category, issues in results.items():
-            if issues:
-                print(f"  {category}:")
-                for issue in issues:
-                    print(f"    • {issue['abbreviation']}: {issue['message']}")
-        return 1
+
+    print(f"⚠️ {len(issues)} issues detected:\n")
+    for category in IssueCategory:
+        in_category = [issue for issue in issues if issue.category == category]
+        if in_category:
+            print(f"  {category.value}:")
+            for issue in in_category:
+                affected = ", ".join(e.abbreviation for e in issue.affected_entries) or issue.issue_id
+                print(f"    • {affected}: {issue.description}")
+    return 1
 
 
 def cmd_backup(args):
     """Create SSOT backup."""
-    from .parser import SSOTParser
-    from .registry import AbbreviationRegistry
-    from .reporter import AbbreviationReporter
-
     print("\n💾 Creating SSOT Backup...\n")
 
     ssot_path = get_ssot_path()
@@ -164,21 +137,28 @@ def cmd_backup(args):
     print(f"✅ Copied SSOT to: {backup_ssot}")
 
     # Generate glossary in backup
-    content = ssot_path.read_text(encoding="utf-8")
-    parser = SSOTParser()
-    entries = parser.parse_document(content)
-
-    registry = AbbreviationRegistry()
-    for entry in entries:
-        registry.add_entry(entry)
-
-    from .generator import save_glossary_files
-    files = save_glossary_files(registry, backup_dir)
+    engine = AbbreviationEngine(ssot_path)
+    files = save_glossary_files(engine, backup_dir)
 
     # Generate manifest
-    reporter = AbbreviationReporter(registry)
-    manifest = reporter.generate_backup_manifest(backup_dir)
-    (backup_dir / "MANIFEST.md").write_text(manifest, encoding="utf-8")
+    report = engine.report()
+    manifest = [
+        "# SSOT Backup Manifest",
+        "",
+        f"**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"**Source:** `{ssot_path}`",
+        f"**SHA-256:** `{hashlib.sha256(ssot_path.read_bytes()).hexdigest()}`",
+        f"**Abbreviations:** {report.total_abbreviations}",
+        f"**Issues:** {len(report.critical_issues)} critical, {len(report.warning_issues)} warnings, "
+        f"{len(report.info_issues)} info",
+        "",
+        "## Files",
+        "",
+        f"- `{backup_ssot.name}`",
+        *(f"- `{path.name}`" for path in files.values()),
+        "",
+    ]
+    (backup_dir / "MANIFEST.md").write_text("\n".join(manifest), encoding="utf-8")
 
     print(f"✅ Backup complete: {backup_dir}")
     print(f"   📄 Files: {len(files) + 2}")
@@ -188,28 +168,31 @@ def cmd_backup(args):
 
 def cmd_report(args):
     """Generate specific reports."""
-    from .parser import SSOTParser
-    from .registry import AbbreviationRegistry
-    from .reporter import AbbreviationReporter
-
-    ssot_path = get_ssot_path()
-    content = ssot_path.read_text(encoding="utf-8")
-
-    parser = SSOTParser()
-    entries = parser.parse_document(content)
-
-    registry = AbbreviationRegistry()
-    for entry in entries:
-        registry.add_entry(entry)
-
-    reporter = AbbreviationReporter(registry)
+    report = AbbreviationEngine(get_ssot_path()).report()
 
     if args.category:
-        print(reporter.detailed_category_report(args.category))
+        in_category = [issue for issue in report.issues if issue.category.value == args.category]
+        print(f"📂 {args.category}: {len(in_category)} issues\n")
+        for issue in in_category:
+            print(f"  [{issue.severity.value}] {issue.issue_id}: {issue.description}")
+            if issue.recommendation:
+                print(f"      → {issue.recommendation}")
     elif args.issue:
-        print(reporter.issue_drill_down(args.issue))
+        matches = [issue for issue in report.issues if issue.issue_id == args.issue]
+        if not matches:
+            print(f"❌ No issue with id: {args.issue}")
+            return 1
+        issue = matches[0]
+        print(f"🔬 {issue.issue_id} [{issue.severity.value}/{issue.category.value}]")
+        print(f"   {issue.description}")
+        for entry in issue.affected_entries:
+            print(f"   • `{entry.abbreviation}` = {entry.full_term} ({entry.section}, line {entry.line_number})")
+        if issue.line_numbers:
+            print(f"   Lines: {', '.join(map(str, issue.line_numbers))}")
+        if issue.recommendation:
+            print(f"   → {issue.recommendation}")
     else:
-        print(reporter.console_summary())
+        print(report.summary())
 
     return 0
 
@@ -234,7 +217,7 @@ def main():
     glossary_parser.add_argument("-o", "--output", help="Output directory")
 
     # Validate command
-    validate_parser = subparsers.add_parser("validate", help="Validate abbreviation consistency")
+    subparsers.add_parser("validate", help="Validate abbreviation consistency")
 
     # Backup command
     backup_parser = subparsers.add_parser("backup", help="Create SSOT backup")
@@ -242,8 +225,9 @@ def main():
 
     # Report command
     report_parser = subparsers.add_parser("report", help="Generate specific reports")
-    report_parser.add_argument("-c", "--category", help="Report on specific category")
-    report_parser.add_argument("-i", "--issue", help="Drill down on specific issue type")
+    report_parser.add_argument("-c", "--category", choices=[c.value for c in IssueCategory],
+                               help="Report on one issue category")
+    report_parser.add_argument("-i", "--issue", help="Drill down on one issue id (e.g. ISSUE-001)")
 
     args = parser.parse_args()
 
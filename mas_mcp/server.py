@@ -559,6 +559,62 @@ def mas_ssot_bookend(start_hash: str = "") -> dict:
         }
 
 
+@mcp.tool()
+def mas_lore_search(query: str, limit: int = 10, include_archive: bool = False) -> dict:
+    """
+    🔎 Ranked full-text search over the SSOT (copilot-instructions.md).
+
+    Searches a persistent FTS5 index (mas_cache/lore_search.sqlite) that is
+    re-indexed only for files whose content hash changed, so the SSOT never
+    has to be loaded into the session to find a passage.
+
+    Args:
+        query: Words (all must match), "quoted phrases" and prefix* terms
+        limit: Maximum number of hits (BM25-ranked)
+        include_archive: Also search every markdown file in the archive
+
+    Returns:
+        Hits with file, line, block line range, enclosing section, highlighted
+        «snippet» and score
+    """
+    from lib.lore_search import ARCHIVE_ROOT, LoreSearchIndex, archive_markdown
+    from lib.ssot_handler import get_ssot_path
+
+    try:
+        ssot_path = get_ssot_path()
+        with LoreSearchIndex() as index:
+            if include_archive:
+                updated = index.update([ssot_path, *archive_markdown(ARCHIVE_ROOT)], prune=ARCHIVE_ROOT)
+            else:
+                updated = index.update([ssot_path])
+            hits = index.search(query, limit=limit, paths=None if include_archive else [ssot_path])
+
+        return {
+            "status": "success",
+            "query": query,
+            "count": len(hits),
+            "hits": [
+                {
+                    "file": Path(hit.path).relative_to(PROJECT_ROOT).as_posix()
+                    if Path(hit.path).is_relative_to(PROJECT_ROOT) else hit.path,
+                    "line": hit.line,
+                    "lines": [hit.start, hit.stop],
+                    "section": hit.section,
+                    "snippet": hit.snippet,
+                    "score": round(hit.score, 3),
+                }
+                for hit in hits
+            ],
+            "index": updated,
+            "timestamp": datetime.now().isoformat(),
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": str(e),
+        }
+
+
 @mcp.tool()
 def mas_gpu_probe() -> dict:
     """
@@ -612,21 +668,24 @@ def mas_scan(target: str = ".") -> dict:
     
     logger.info(f"Starting scan from: {root}")
     
+    from lib.fs_walk import walk_files
+    
     all_signals: list[Signal] = []
     files_scanned = 0
     files_skipped = 0
     bytes_processed = 0
     
-    for file_path in root.rglob("*"):
-        if not file_path.is_file():
-            continue
-        if should_skip_path(file_path):
+    # SKIP_DIRS are pruned before descending, so files_skipped counts
+    # binary-extension files only
+    for entry in walk_files(root, exclude_dirs=SKIP_DIRS):
+        file_path = Path(entry.path)
+        if file_path.suffix.lower() in SKIP_EXTENSIONS:
             files_skipped += 1
             continue
         
         try:
-            bytes_processed += file_path.stat().st_size
-        except:
+            bytes_processed += entry.stat().st_size
+        except OSError:
             pass
         
         signals = scan_file(file_path, PROJECT_ROOT, REGISTRY)
@@ -1829,30 +1888,30 @@ def _compute_directory_fingerprint(root: Path, extensions: set = None) -> dict:
         }
     }
     
+    from lib.fs_walk import walk_files
+    
+    # Skip target/, .git/, __pycache__/, etc. (pruned, never descended)
+    skip_dirs = {"target", ".git", "__pycache__", "node_modules", ".uv", "venv"}
+    
     try:
-        for path in root.rglob("*"):
-            if path.is_file():
-                # Skip target/, .git/, __pycache__/, etc.
-                skip_dirs = {"target", ".git", "__pycache__", "node_modules", ".uv", "venv"}
-                if any(skip in path.parts for skip in skip_dirs):
-                    continue
+        for entry in walk_files(root, exclude_dirs=skip_dirs):
+            path = Path(entry.path)
+            ext = path.suffix.lower()
+            if ext in extensions or not extensions:
+                rel_path = str(path.relative_to(root))
+                file_hash = _compute_file_hash(path)
+                file_size = entry.stat().st_size
                 
-                ext = path.suffix.lower()
-                if ext in extensions or not extensions:
-                    rel_path = str(path.relative_to(root))
-                    file_hash = _compute_file_hash(path)
-                    file_size = path.stat().st_size
-                    
-                    fingerprint["files"][rel_path] = {
-                        "hash": file_hash,
-                        "size": file_size,
-                        "ext": ext
-                    }
-                    
-                    fingerprint["summary"]["total_files"] += 1
-                    fingerprint["summary"]["total_size"] += file_size
-                    fingerprint["summary"]["by_extension"][ext] = \
-                        fingerprint["summary"]["by_extension"].get(ext, 0) + 1
+                fingerprint["files"][rel_path] = {
+                    "hash": file_hash,
+                    "size": file_size,
+                    "ext": ext
+                }
+                
+                fingerprint["summary"]["total_files"] += 1
+                fingerprint["summary"]["total_size"] += file_size
+                fingerprint["summary"]["by_extension"][ext] = \
+                    fingerprint["summary"]["by_extension"].get(ext, 0) + 1
     except Exception as e:
         fingerprint["error"] = str(e)
     
@@ -3664,7 +3723,14 @@ def mas_gpu_score(
 
 
 @mcp.tool()
-def mas_gpu_batch_score(entities: list) -> dict:
+def mas_gpu_batch_score(
+    entities: Optional[list] = None,
+    layout: str = "rows",
+    page: int = 0,
+    page_size: Optional[int] = None,
+    feature_store: Optional[str] = None,
+    output_path: Optional[str] = None
+) -> dict:
     """
     🚀 GPU-accelerated batch entity scoring.
     
@@ -3673,6 +3739,15 @@ def mas_gpu_batch_score(entities: list) -> dict:
     
     Args:
         entities: List of entity dicts with keys: name, whr, tier, cup, measurements
+        layout: "rows" for per-entity dicts, "columnar" for parallel score arrays
+                (cheaper for large batches)
+        page: Zero-based page of the row view
+        page_size: Rows per page (omit for all rows in "rows" layout)
+        feature_store: Path to a memory-mapped feature store (vectors.npy +
+                       ids.npy) to score instead of entities - use for
+                       large jobs
+        output_path: Write score columns to this .npz file instead of
+                     returning them inline
     
     Returns:
         Batch results with individual scores and aggregate statistics
@@ -3684,7 +3759,10 @@ def mas_gpu_batch_score(entities: list) -> dict:
             "reason": orchestrator.get("error", "Unknown error"),
             "entity_count": len(entities) if entities else 0
         }
-    return orchestrator["batch"](entities)
+    return orchestrator["batch"](
+        entities, layout=layout, page=page, page_size=page_size,
+        feature_store=feature_store, output_path=output_path
+    )
 
 
 @mcp.tool()
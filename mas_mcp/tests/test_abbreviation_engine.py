@@ -0,0 +1,101 @@
+"""Tests for the shared AbbreviationEngine and its scale benchmark."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from abbreviation_system.benchmark import STAGES, compare, run_benchmark, synthetic_ssot  # noqa: E402
+from abbreviation_system.engine import AbbreviationEngine  # noqa: E402
+from abbreviation_system.parser import SSOTParser  # noqa: E402
+from abbreviation_system.registry import AbbreviationRegistry  # noqa: E402
+from abbreviation_system.usage import UsageIndex  # noqa: E402
+from abbreviation_system.validator import ConsistencyValidator  # noqa: E402
+
+SSOT = """Intro names `ASC` before any section.
+
+## **I. Foundations**
+
+**(`Apex Synthesis Core`):→(`ASC`)** anchors (`ASC`) and CRC-MAL.
+NOTATION GUIDE for section I.
+
+---
+
+### **II. Entities**
+
+**(`Primal Substrate`):→(`PS`)** meets (`PS`), (`ASC`) and `UNDEF`.
+"""
+
+
+def make_engine(tmp_path: Path, content: str = SSOT) -> AbbreviationEngine:
+    ssot_path = tmp_path / "ssot.md"
+    ssot_path.write_text(content, encoding="utf-8")
+    return AbbreviationEngine(
+        ssot_path, sections_path=tmp_path / "sections.json", snapshot_path=tmp_path / "registry.json"
+    )
+
+
+def full_issues(content: str) -> list[tuple]:
+    registry = AbbreviationRegistry()
+    registry.add_entries(SSOTParser().parse_text(content))
+    issues = ConsistencyValidator(registry).validate_all(content)
+    return [(i.category, i.description, i.line_numbers) for i in issues]
+
+
+def test_validate_matches_full_audit_and_follows_edits(tmp_path):
+    engine = make_engine(tmp_path)
+    assert [(i.category, i.description, i.line_numbers) for i in engine.validate()] == full_issues(SSOT)
+
+    edited = SSOT.replace("`UNDEF`", "`UNDEF` and (`NEW`)")
+    engine.ssot_path.write_text(edited, encoding="utf-8")
+    assert [(i.category, i.description, i.line_numbers) for i in engine.validate()] == full_issues(edited)
+    assert engine.report().total_abbreviations == len(engine.registry.all_abbreviations())
+
+
+def test_lookup_exact_then_reverse(tmp_path):
+    engine = make_engine(tmp_path)
+
+    assert [e.full_term for e in engine.lookup("ASC")] == ["Apex Synthesis Core"]
+    assert [e.abbreviation for e in engine.lookup("Primal")] == ["PS"]
+    assert engine.lookup("nothing like it") == []
+    assert (tmp_path / "registry.json").exists()
+
+
+def test_parenthesized_index_survives_join_and_round_trip():
+    index = UsageIndex(SSOT)
+    assert sorted(index.parenthesized) == ["ASC", "Apex Synthesis Core", "PS", "Primal Substrate"]
+    assert [SSOT[o:o + 7] for o in index.parenthesized["ASC"]] == ["(`ASC`)"] * 3
+
+    split = SSOT.index("### **II.")
+    joined = UsageIndex.join([UsageIndex(SSOT[:split]), UsageIndex(SSOT[split:])])
+    assert joined.parenthesized == index.parenthesized
+    assert UsageIndex.from_dict(index.to_dict(), SSOT).parenthesized == index.parenthesized
+
+
+def test_synthetic_ssot_is_deterministic_and_parses():
+    content = synthetic_ssot(20_000, seed=3)
+
+    assert len(content) >= 20_000
+    assert content == synthetic_ssot(20_000, seed=3)
+    assert content != synthetic_ssot(20_000, seed=4)
+    assert len(SSOTParser().parse_text(content)) > 0
+
+
+def test_run_benchmark_and_compare():
+    results = run_benchmark([1, 2], base_chars=5_000, repeat=1)
+
+    assert list(results) == ["1", "2"]
+    assert all(set(stages) == set(STAGES) for stages in results.values())
+    assert compare(results, results, tolerance=1.5) == []
+
+    baseline = {"1": {"parse": results["1"]["parse"] / 10}}
+    regressions = compare(results, baseline, tolerance=1.5)
+    assert len(regressions) == 1 and regressions[0].startswith("1x parse")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
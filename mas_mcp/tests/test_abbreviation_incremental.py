@@ -0,0 +1,125 @@
+"""Tests for the per-section cache behind incremental re-audits."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from abbreviation_system.incremental import SectionCache  # noqa: E402
+from abbreviation_system.parser import SSOTParser  # noqa: E402
+from abbreviation_system.registry import AbbreviationRegistry  # noqa: E402
+from abbreviation_system.reporter import AuditReporter  # noqa: E402
+from abbreviation_system.validator import ConsistencyValidator  # noqa: E402
+
+SLASHES = "\n".join(f"Use (`A{i}`/`B{i}`) here." for i in range(6))
+
+SSOT = f"""Intro names `ASC` and Tier 1 before any section.
+
+## **I. Foundations**
+
+**(`Apex Synthesis Core`):→(`ASC`)** anchors CRC-MAL and `ASC`.
+NOTATION GUIDE for section I.
+
+---
+
+Between headers: T-2 and CRC-MAL, plus `UNDEF`.
+
+### **II. Entities**
+
+**(`Primal Substrate`):→(`PS`)** and **(`Primal Substrates`):→(`PSS`)**.
+{SLASHES}
+
+---
+
+Between headers: T-2 and CRC-MAL, plus `UNDEF`.
+
+### **III. Notes**
+
+Tier-3 closes with `PS`, ASC and 🔥 = Fire, 🔥.
+"""
+
+
+def full_audit(content: str) -> tuple[list[dict], list[tuple]]:
+    entries = SSOTParser().parse_text(content)
+    registry = AbbreviationRegistry()
+    registry.add_entries(entries)
+    issues = ConsistencyValidator(registry).validate_all(content)
+    return [asdict(e) for e in entries], [(i.category, i.description, i.line_numbers) for i in issues]
+
+
+def cached_audit(cache: SectionCache, content: str) -> tuple[list[dict], list[tuple]]:
+    entries, index = cache.scan(content)
+    registry = AbbreviationRegistry()
+    registry.add_entries(entries)
+    issues = ConsistencyValidator(registry).validate_index(index)
+    return [asdict(e) for e in entries], [(i.category, i.description, i.line_numbers) for i in issues]
+
+
+EDITS = [
+    lambda text: text.replace("T-2 and", "T-4 and", 1),
+    lambda text: text.replace("### **III. Notes**", "### **III. Notes**\n\n**(`Meta Core`):→(`MC`)**"),
+    lambda text: text.replace("NOTATION GUIDE for section I.\n", ""),
+    lambda text: text + "\n## **IV. Appendix**\n\n`ASC` again.\n",
+]
+
+
+def test_split_pieces_join_back():
+    pieces = SectionCache().split(SSOT)
+
+    assert "".join(pieces) == SSOT
+    assert all(piece.endswith("\n") for piece in pieces)
+    assert len(pieces) == 6
+
+
+@pytest.mark.parametrize("edit", EDITS)
+def test_rescan_matches_full_audit_and_only_scans_edits(edit):
+    cache = SectionCache()
+    assert cached_audit(cache, SSOT) == full_audit(SSOT)
+    assert (cache.scanned, cache.reused) == (5, 1)  # Repeated section is scanned once
+
+    edited = edit(SSOT)
+    assert cached_audit(cache, edited) == full_audit(edited)
+    assert 1 <= cache.scanned <= 2
+    assert cache.reused >= 5
+
+
+def test_saved_scans_load_without_parsing(tmp_path, monkeypatch):
+    path = tmp_path / "sections.json"
+    expected = cached_audit(SectionCache(path=path), SSOT)
+    assert path.exists()
+
+    def fail(self, content):
+        raise AssertionError("section re-parsed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(SSOTParser, "parse_text", fail)
+        cache = SectionCache.load(path)
+        assert cached_audit(cache, SSOT) == expected
+    assert cache.scanned == 0
+
+
+def test_reporter_refresh_picks_up_edits(tmp_path):
+    ssot = tmp_path / "ssot.md"
+    ssot.write_text(SSOT, encoding="utf-8")
+    reporter = AuditReporter.from_ssot(str(ssot), sections_path=tmp_path / "sections.json")
+    report = reporter.generate_full_report()
+
+    assert reporter.registry.lookup("PS").full_term == "Primal Substrate"
+    assert [(i.category, i.description, i.line_numbers) for i in report.issues] == full_audit(SSOT)[1]
+
+    edited = EDITS[1](SSOT)
+    ssot.write_text(edited, encoding="utf-8")
+    report = reporter.generate_full_report()
+
+    assert reporter.registry.lookup("MC").section == "Section III"
+    assert reporter.sections.scanned == 1
+    assert [(i.category, i.description, i.line_numbers) for i in report.issues] == full_audit(edited)[1]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
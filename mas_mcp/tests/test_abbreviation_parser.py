@@ -0,0 +1,76 @@
+"""Tests for the single-pass SSOT abbreviation parser."""
+
+from __future__ import annotations
+
+import re
+import sys
+from dataclasses import astuple
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from abbreviation_system.parser import SSOTParser  # noqa: E402
+
+SAMPLE = "\n".join([
+    "Intro mentions `ASC` and FA¹ before any section.",
+    "### **I. Foundations",
+    "**(`Framework Components`): → (`FRW-COMP`):** and **(`FA²`)** plus FA¹⁻⁵",
+    "(`Eternal Sadhana`) - (`ET-S`) (`Term`) → (`ABBR`) (`MSP-RSG-X`)",
+    "CRC-AS meets CRC-GAR in Tier 0.5 and T-1; Ω-Set, ΦΩΨ, Ψ-Protocol",
+    "$matriarch${Orackla} under EULP-AA, TMO, TTG, OMCA, BOS and AAA",
+    "`AB``CD` (`TRM-VRT`/`TR-VRT`) (`A`/`B`/`C`)",
+    "SAI: Sister Ferrum Scoriae (SFS)",
+    "## II. Second",
+    "👑 = Supreme authority, 💀 = Death",
+    "SAI: Broken",
+    "(SFS) Tier",
+    "   ###  III.2. Indented header text",
+    "CRC-MEDAT\r",
+])
+
+
+def line_by_line(parser: SSOTParser, content: str) -> list[tuple]:
+    """Reference: every pattern over every line, sections tracked per line."""
+    section = "Preamble"
+    entries = []
+    for line_num, line in enumerate(content.split("\n"), start=1):
+        header = parser._section_pattern.search(line)
+        if header and (header.group(1) or header.group(2)):
+            section = f"Section {header.group(1) or header.group(2)}"
+        for pattern in parser.patterns:
+            for match in re.finditer(pattern.regex, line):
+                entry = parser._make_entry(pattern, match.groups(), section, line_num, line)
+                if entry is not None:
+                    entries.append(astuple(entry))
+    return entries
+
+
+def test_single_pass_matches_line_by_line_scan():
+    parser = SSOTParser()
+    entries = [astuple(e) for e in parser.parse_text(SAMPLE)]
+
+    assert entries == line_by_line(parser, SAMPLE)
+    assert {e[0] for e in entries} >= {"FRW-COMP", "FA²", "ET-S", "SFS", "👑", "TRM-VRT/TR-VRT"}
+
+
+def test_matches_do_not_span_lines():
+    parser = SSOTParser()
+    content = "SAI: Name\n(SFS)\n👑 =\nmeaning\n(`Term`) -\n(`ABBR`)"
+
+    assert parser.parse_text(content) == []
+
+
+def test_fallback_without_lead_chars_is_identical():
+    parser = SSOTParser()
+    expected = [astuple(e) for e in parser.parse_text(SAMPLE)]
+    for pattern in parser.patterns:
+        pattern.lead_chars = ""
+    parser._combined, parser._dispatch = parser._compile_combined()
+
+    assert [astuple(e) for e in parser.parse_text(SAMPLE)] == expected
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
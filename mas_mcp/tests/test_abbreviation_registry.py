@@ -0,0 +1,98 @@
+"""Tests for indexed reverse lookup and registry export."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from abbreviation_system.models import AbbreviationEntry, NotationPatternType  # noqa: E402
+from abbreviation_system.parser import SSOTParser  # noqa: E402
+from abbreviation_system.registry import AbbreviationRegistry  # noqa: E402
+
+TERMS = {
+    "ASC": "Apex Synthesis Core",
+    "ASP": "Autopoietic Synthesis Protocol",
+    "MSP": "Meta-Synthesis Protocol",
+    "ET-S": "Eternal Sadhana",
+    "PS": "Primal Substrate",
+    "AI": "AI",
+}
+
+
+@pytest.fixture
+def registry():
+    registry = AbbreviationRegistry()
+    for abbrev, term in TERMS.items():
+        registry.add(AbbreviationEntry(abbrev, term, NotationPatternType.BACKTICK_INLINE, line_number=1))
+    return registry
+
+
+def test_reverse_lookup_exact_substring_containment_and_fuzzy(registry):
+    assert registry.reverse_lookup("apex synthesis core") == ["ASC"]
+    assert registry.reverse_lookup("synthesis protocol") == ["MSP", "ASP"]
+    assert registry.reverse_lookup("synthesis", limit=2) == ["ASC", "MSP"]
+    assert registry.reverse_lookup("the eternal sadhana of the ai") == ["ET-S", "AI"]
+    assert registry.reverse_lookup("eternal sadhna") == ["ET-S"]
+    assert registry.reverse_lookup("zzzz") == []
+
+
+def test_index_is_rebuilt_after_new_terms(registry):
+    assert registry.reverse_lookup("obductors") == []
+    registry.add(AbbreviationEntry("TMO", "The MILF Obductors", NotationPatternType.FACTION_ABBREVIATION))
+
+    assert registry.reverse_lookup("obductors") == ["TMO"]
+
+
+def test_export_round_trip_keeps_index(registry, tmp_path):
+    registry.record_usage({"ASC": [3, 7]})
+    loaded = AbbreviationRegistry.load_json(registry.export_json(tmp_path / "registry.json"))
+
+    assert loaded._term_index is not None
+    assert loaded.term_index().postings == registry.term_index().postings
+    assert loaded.lookup("ET-S") == registry.lookup("ET-S")
+    assert loaded.get_usage("ASC") == [1, 3, 7]
+    assert loaded.reverse_lookup("synthesis protocol") == ["MSP", "ASP"]
+
+
+SSOT = """# Glossary
+
+**(`Apex Synthesis Core`):→(`ASC`)**
+**(`Primal Substrate`):→(`PS`)**
+"""
+
+
+def test_from_ssot_snapshot_reused_until_ssot_changes(tmp_path, monkeypatch):
+    ssot = tmp_path / "ssot.md"
+    snapshot = tmp_path / "cache" / "registry.json"
+    ssot.write_text(SSOT, encoding="utf-8")
+    parsed = AbbreviationRegistry.from_ssot(ssot, snapshot_path=snapshot)
+    assert snapshot.exists()
+
+    def fail(self, path):
+        raise AssertionError("SSOT re-parsed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(SSOTParser, "parse_file", fail)
+        loaded = AbbreviationRegistry.from_ssot(ssot, snapshot_path=snapshot)
+    assert loaded.to_dict() == parsed.to_dict()
+    assert loaded.lookup("PS") == parsed.lookup("PS")
+
+    ssot.write_text(SSOT + "**(`Meta-Synthesis Protocol`):→(`MSP`)**\n", encoding="utf-8")
+    assert AbbreviationRegistry.from_ssot(ssot, snapshot_path=snapshot).lookup("MSP")
+
+
+def test_from_ssot_without_snapshot(tmp_path):
+    ssot = tmp_path / "ssot.md"
+    ssot.write_text(SSOT, encoding="utf-8")
+    registry = AbbreviationRegistry.from_ssot(ssot, snapshot_path=None)
+
+    assert registry.lookup("ASC")
+    assert list(tmp_path.iterdir()) == [ssot]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,66 @@
+"""Tests for the SSOT usage index and the checks answered from it."""
+
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from abbreviation_system.models import AbbreviationEntry, IssueCategory, NotationPatternType  # noqa: E402
+from abbreviation_system.registry import AbbreviationRegistry  # noqa: E402
+from abbreviation_system.usage import UsageIndex  # noqa: E402
+from abbreviation_system.validator import ConsistencyValidator  # noqa: E402
+
+CONTENT = "\n".join([
+    "The `ASC` drives ASC-CORE; (`ASC`) is not BASC or ASC_X.",
+    "CRC-AS and CRC-AS-X appear, A-A-A twice: A-A-A.",
+    "The Decorator met The Decorators and the Decorator.",
+    "🔥 marks 🔥 twice, `UNDEF` and `ZZZ` are backtick-only.",
+    "Tier 1 first, then T-2, and later `UNDEF` again.",
+])
+
+
+@pytest.fixture
+def index():
+    return UsageIndex(CONTENT, ConsistencyValidator.TIER_PATTERNS)
+
+
+@pytest.mark.parametrize("abbrev", ["ASC", "CRC-AS", "A-A", "The Decorator", "UNDEF", "BASC"])
+def test_occurrences_match_word_boundary_regex(index, abbrev):
+    expected = [m.start() for m in re.finditer(rf"\b{re.escape(abbrev)}\b", CONTENT)]
+
+    assert index.occurrences(abbrev) == expected
+
+
+def test_forms_lines_and_non_word_abbreviations(index):
+    assert index.forms("ASC") == {"bare": 1, "backtick": 1, "parenthesized": 1}
+    assert index.lines("UNDEF") == [4, 5]
+    assert index.count("🔥") == 2
+    assert list(index.tier_styles) == ["Tier X", "T-X", "Tier-X"]
+
+
+def test_validator_checks_use_index_and_feed_registry():
+    registry = AbbreviationRegistry()
+    for abbrev, line in (("ASC", 1), ("ZZZ", 4), ("ONLYDEF", 0)):
+        registry.add(AbbreviationEntry(abbrev, "term", NotationPatternType.BACKTICK_INLINE, line_number=line))
+    issues = ConsistencyValidator(registry).validate_all(CONTENT)
+
+    orphans = {i.description for i in issues if i.category == IssueCategory.ORPHAN}
+    undefined = [i for i in issues if i.category == IssueCategory.MISSING_DEFINITION and i.line_numbers]
+    assert orphans == {
+        "Abbreviation 'ZZZ' appears only 1 time(s)",
+        "Abbreviation 'ONLYDEF' appears only 0 time(s)",
+    }
+    assert [(i.description, i.line_numbers) for i in undefined] == [
+        ("Abbreviation 'UNDEF' is used but not defined in registry", [4, 5]),
+    ]
+    assert registry.get_usage("ASC") == [1]
+    assert any(i.category == IssueCategory.PATTERN_MISMATCH for i in issues)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,67 @@
+"""Tests for blocked fuzzy-variant detection in the consistency validator."""
+
+from __future__ import annotations
+
+import random
+import string
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from abbreviation_system.models import AbbreviationEntry, NotationPatternType  # noqa: E402
+from abbreviation_system.registry import AbbreviationRegistry  # noqa: E402
+from abbreviation_system.validator import ConsistencyValidator, _within_indel_distance  # noqa: E402
+
+
+def variant_registry(seed: int) -> AbbreviationRegistry:
+    """Random abbreviations plus near-variants (edits, case changes) with related terms."""
+    rng = random.Random(seed)
+    registry = AbbreviationRegistry()
+    for _ in range(60):
+        base = "".join(rng.choice(string.ascii_uppercase + "-") for _ in range(rng.randint(2, 12)))
+        term = " ".join(rng.choice(["Core", "Protocol", "Synthesis", "Engine", "Matrix"]) for _ in range(2))
+        for _ in range(3):
+            chars = list(base)
+            for _ in range(rng.randint(0, 2)):
+                position = rng.randrange(len(chars))
+                action = rng.choice(["insert", "delete", "replace", "lower"])
+                if action == "insert":
+                    chars.insert(position, rng.choice("AEX-"))
+                elif action == "delete" and len(chars) > 1:
+                    del chars[position]
+                elif action == "replace":
+                    chars[position] = rng.choice("AEX-")
+                else:
+                    chars[position] = chars[position].lower()
+            abbrev = "".join(chars)
+            registry.add(AbbreviationEntry(abbrev, term + rng.choice(["", "s", " X"]), NotationPatternType.BACKTICK_INLINE))
+    return registry
+
+
+def fuzzy_issues(registry: AbbreviationRegistry, blocked: bool) -> list[str]:
+    validator = ConsistencyValidator(registry)
+    validator._check_fuzzy_variants(registry.all_abbreviations(), blocked=blocked)
+    return [issue.description for issue in validator._issues]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_blocked_matches_brute_force(seed):
+    registry = variant_registry(seed)
+    brute_force = fuzzy_issues(registry, blocked=False)
+
+    assert brute_force
+    assert fuzzy_issues(registry, blocked=True) == brute_force
+
+
+def test_within_indel_distance():
+    assert _within_indel_distance("TRM-VRT", "TR-VRT", 1)
+    assert not _within_indel_distance("ABCD", "ABDC", 1)
+    assert _within_indel_distance("ABCD", "ABDC", 2)
+    assert not _within_indel_distance("A", "B", -1)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,65 @@
+"""Tests for the DCRP compact .npz graph format (repository root module)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+nx = pytest.importorskip("networkx")
+
+from dcrp_compact_graph import load_compact_graph, write_compact_graph  # noqa: E402
+
+
+def make_graph():
+    graph = nx.DiGraph()
+    for name, role, exports in [
+        ("src/main.rs", "🦀 CORE", 3),
+        ("src/lib.rs", "🦀 CORE", 0),
+        ("docs/Ästhetik.md", "📜 DOCUMENTATION", 0),
+        ("empty.toml", None, 0),
+    ]:
+        graph.add_node(name, spectral_freq="RED", role=role, essence=f"{name} — essence", exports_count=exports)
+    graph.add_edge("src/main.rs", "src/lib.rs", method="AST")
+    graph.add_edge("src/lib.rs", "src/main.rs", method="AST")
+    graph.add_edge("docs/Ästhetik.md", "src/main.rs", method="link")
+    graph.add_edge("docs/Ästhetik.md", "docs/Ästhetik.md", method="link")
+    return graph
+
+
+def test_round_trip_nodes_edges_and_attributes(tmp_path):
+    graph = make_graph()
+    scc_of = {"src/main.rs": 7, "src/lib.rs": 7, "docs/Ästhetik.md": 3, "empty.toml": 9}
+    path = write_compact_graph(graph, scc_of, [7, 3], tmp_path / "graph.npz")
+
+    compact = load_compact_graph(path)
+
+    assert compact.nodes() == list(graph.nodes())
+    assert compact.number_of_edges == 4
+    assert compact.successors("docs/Ästhetik.md") == ["src/main.rs", "docs/Ästhetik.md"]
+    assert compact.node_scc.tolist() == [0, 0, 1, 2]
+    assert compact.cyclic_sccs.tolist() == [0, 1]
+
+    rebuilt = compact.to_networkx()
+    expected = dict(graph.nodes(data=True))
+    expected["empty.toml"] = {**expected["empty.toml"], "role": ""}  # None is stored as ""
+    assert dict(rebuilt.nodes(data=True)) == expected
+    assert sorted(rebuilt.edges(data=True)) == sorted(graph.edges(data=True))
+
+
+def test_string_table_is_utf8_blob(tmp_path):
+    path = write_compact_graph(make_graph(), dict.fromkeys(make_graph(), 0), [], tmp_path / "graph.npz")
+
+    with np.load(path) as data:
+        assert data["string_data"].dtype == np.uint8
+        assert data["string_offsets"].dtype == np.int32
+        assert data["string_offsets"][-1] == len(data["string_data"])
+        assert "strings" not in data.files
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
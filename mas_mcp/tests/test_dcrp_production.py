@@ -0,0 +1,314 @@
+"""Tests for the DCRP production cross-reference protocol (repository root script)."""
+
+from __future__ import annotations
+
+import multiprocessing
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+pytest.importorskip("networkx")
+
+import decorator_cross_ref_production as dcrp  # noqa: E402
+from typescript_dependency_resolver import TypeScriptRegexExtractor  # noqa: E402
+
+FIXTURE_TREE = {
+    "main.py": "import pkg.core\n",
+    "pkg/__init__.py": "",
+    "pkg/core.py": "import pkg.util\n\ndef run():\n    pass\n",
+    "pkg/util.py": "import pkg.core\n\nclass Helper:\n    pass\n",
+    "README.md": "# Fixture\n\nSee [main](main.py) and [core](pkg/core.py).\n",
+    "web/app.ts": "import { lib } from './lib';\n",
+    "web/lib.ts": "export const lib = 1;\n",
+    "config.toml": "[tool]\nname = 'fixture'\n",
+}
+
+
+def make_identities(rel_paths) -> dict:
+    return {
+        rel: dcrp.FileIdentity(
+            path=dcrp.REPO_ROOT / rel, spectral_freq="WHITE", primary_purpose="", architectural_role="",
+            theatrical_essence="",
+        )
+        for rel in rel_paths
+    }
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    """Stub dependency extraction: a.py imports b.py, b.py imports c.py, ..."""
+    calls = []
+
+    def extract(path, content=None):
+        calls.append(path.name)
+        return {dcrp.REPO_ROOT / f"{chr(ord(path.stem) + 1)}.py"}
+
+    monkeypatch.setattr(dcrp.DependencyExtractor, "extract_dependencies", staticmethod(extract))
+    return calls
+
+
+def test_cached_edges_follow_the_directory_listing(tmp_path, extractor):
+    state_path = tmp_path / "state.json"
+    state = dcrp.ProcessingState()
+    for rel in ("a.py", "b.py", "c.py"):
+        state.file_states[rel] = {"mtime": 1.0, "hash": rel, "identity": {}}
+
+    graph = dcrp.DependencyGraphBuilder.build_graph(make_identities(["a.py", "b.py", "c.py"]), state=state)
+    assert sorted(graph.edges) == [("a.py", "b.py"), ("b.py", "c.py")]
+    assert len(extractor) == 3
+    state.save(state_path)
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    # Unchanged tree: every edge comes from the saved state
+    state = dcrp.ProcessingState.load(state_path)
+    graph = dcrp.DependencyGraphBuilder.build_graph(make_identities(["a.py", "b.py", "c.py"]), state=state)
+    assert sorted(graph.edges) == [("a.py", "b.py"), ("b.py", "c.py")]
+    assert len(extractor) == 3
+
+    # A removed file changes the listing: edges are re-resolved
+    graph = dcrp.DependencyGraphBuilder.build_graph(make_identities(["a.py", "c.py"]), state=state)
+    assert sorted(graph.edges) == []
+    assert len(extractor) == 5
+
+    # So does an added one
+    graph = dcrp.DependencyGraphBuilder.build_graph(make_identities(["a.py", "b.py", "c.py", "d.py"]), state=state)
+    assert sorted(graph.edges) == [("a.py", "b.py"), ("b.py", "c.py"), ("c.py", "d.py")]
+    assert len(extractor) == 9
+
+
+@pytest.fixture
+def fixture_repo(tmp_path, monkeypatch):
+    root = tmp_path.resolve()
+    for rel, text in FIXTURE_TREE.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text, encoding="utf-8")
+    monkeypatch.setattr(dcrp, "REPO_ROOT", root)
+    monkeypatch.setattr(dcrp, "MODULE_INDEX", None)
+    monkeypatch.setattr(dcrp, "TS_EXTRACTOR", TypeScriptRegexExtractor())
+    return root
+
+
+def build(jobs: int = 1, state=None):
+    state = state or dcrp.ProcessingState()
+    identities, void_dirs = dcrp.RepositoryScanner.scan_repository(use_cache=False, state=state, jobs=jobs)
+    return identities, dcrp.DependencyGraphBuilder.build_graph(identities, state=state), void_dirs
+
+
+def scan(jobs: int):
+    identities, graph, _ = build(jobs)
+    rows = {rel: {k: v for k, v in asdict(identity).items() if k != "last_updated"}
+            for rel, identity in identities.items()}
+    return list(identities), rows, sorted(graph.edges)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="workers must inherit the patched REPO_ROOT")
+def test_jobs_match_serial_scan(fixture_repo):
+    order, identities, edges = scan(jobs=1)
+
+    assert ("pkg/core.py", "pkg/util.py") in edges and ("pkg/util.py", "pkg/core.py") in edges
+    assert ("README.md", "main.py") in edges and ("web/app.ts", "web/lib.ts") in edges
+    assert scan(jobs=3) == (order, identities, edges)
+
+
+def test_fresh_edges_are_scoped_to_one_scan(fixture_repo):
+    state = dcrp.ProcessingState()
+    identities, _ = dcrp.RepositoryScanner.scan_repository(state=state)
+    assert set(state.fresh_edges) == set(identities)
+
+    dcrp.DependencyGraphBuilder.build_graph(identities, state=state)
+    dcrp.RepositoryScanner.scan_repository(state=state)  # Every file cached
+    assert state.fresh_edges == {}
+
+
+def components(analysis) -> tuple:
+    assert all(analysis.scc_of[v] == scc_id for scc_id, members in analysis.components.items() for v in members)
+    return (
+        {frozenset(members) for members in analysis.components.values()},
+        {frozenset(analysis.components[scc_id]) for scc_id in analysis.cyclic},
+    )
+
+
+def assert_matches_full_rebuild(watcher):
+    identities, graph, _ = build()
+    assert sorted(watcher.graph.edges) == sorted(graph.edges)
+    assert {rel: identity.dependents for rel, identity in watcher.identities.items()} == \
+        {rel: identity.dependents for rel, identity in identities.items()}
+    assert components(watcher.analysis) == components(dcrp.CircularDependencyResolver.analyze_components(graph))
+
+
+def test_watcher_splits_and_merges_components(fixture_repo, monkeypatch):
+    monkeypatch.setattr(dcrp.DependencyWatcher, "OUTPUT_FILES", {fixture_repo / "graph.json"})
+    state = dcrp.ProcessingState()
+    identities, graph, void_dirs = build(state=state)
+    watcher = dcrp.DependencyWatcher(
+        identities, graph, state, dcrp.CircularDependencyResolver.analyze_components(graph), void_dirs,
+        save_state=False,
+    )
+    assert components(watcher.analysis)[1] == {frozenset({"pkg/core.py", "pkg/util.py"})}
+
+    # Removing util -> core splits the cycle
+    (fixture_repo / "pkg/util.py").write_text("class Helper:\n    pass\n", encoding="utf-8")
+    watcher.apply_change("pkg/util.py", 1.0)
+    assert components(watcher.analysis)[1] == set()
+    assert watcher.identities["pkg/core.py"].dependents == {"main.py", "README.md"}
+    assert_matches_full_rebuild(watcher)
+
+    # util -> main closes main -> core -> util -> main
+    (fixture_repo / "pkg/util.py").write_text("import main\n", encoding="utf-8")
+    watcher.apply_change("pkg/util.py", 2.0)
+    assert components(watcher.analysis)[1] == {frozenset({"main.py", "pkg/core.py", "pkg/util.py"})}
+    assert watcher.identities["main.py"].scc_id == watcher.analysis.scc_of["main.py"]
+    assert_matches_full_rebuild(watcher)
+
+
+@pytest.fixture
+def evolution(tmp_path, monkeypatch):
+    tracker = dcrp.EvolutionTracker
+    monkeypatch.setattr(tracker, "HISTORY_FILE", tmp_path / "evolution.jsonl")
+    monkeypatch.setattr(tracker, "SUMMARY_FILE", tmp_path / "evolution.summary")
+    monkeypatch.setattr(tracker, "LEGACY_HISTORY_FILE", tmp_path / "evolution.json")
+    return tracker
+
+
+def snapshot(files: int) -> dict:
+    return {
+        "timestamp": f"2026-01-01T00:{files // 60 % 60:02d}:{files % 60:02d}", "total_files": files,
+        "total_dependencies": 2 * files, "circular_cycles": files % 3, "cache_hit_rate": 95.0,
+        "spectral_distribution": {"WHITE": files}, "top_dependencies": [["a.py", 4]], "largest_cluster_size": 2,
+    }
+
+
+def test_record_snapshot_appends_one_line_and_one_record(evolution):
+    graph = dcrp.nx.DiGraph([("a.py", "b.py")])
+    identities = make_identities(["a.py", "b.py"])
+
+    evolution.record_snapshot(identities, graph, [], [], 50.0)
+    first = evolution.HISTORY_FILE.read_bytes()
+    evolution.record_snapshot(identities, graph, [["a.py", "b.py"]], [], 75.0)
+
+    history = evolution.HISTORY_FILE.read_bytes()
+    assert history.startswith(first) and history.count(b"\n") == 2
+    assert evolution.SUMMARY_FILE.stat().st_size == 2 * evolution.SUMMARY_RECORD.size
+    assert [row["circular_cycles"] for row in evolution.load_summary()] == [0, 1]
+
+
+def test_summary_records_stay_fixed_size(evolution):
+    for files in range(5):
+        evolution._append(snapshot(files))
+    with open(evolution.SUMMARY_FILE, "ab") as f:
+        f.write(b"torn")  # Interrupted write
+    evolution._append(snapshot(5))
+
+    assert evolution.SUMMARY_FILE.stat().st_size == 6 * evolution.SUMMARY_RECORD.size
+    assert evolution.snapshot_count() == 6
+    assert [row["total_files"] for row in evolution.load_summary(limit=3)] == [3, 4, 5]
+
+
+def test_report_reads_only_the_tail_window(evolution, monkeypatch):
+    for files in range(3000):
+        evolution._append(snapshot(files))
+    history_size = evolution.HISTORY_FILE.stat().st_size
+
+    read_bytes = []
+
+    class CountingFile:
+        def __init__(self, f):
+            self.f = f
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.f.close()
+
+        def __getattr__(self, name):
+            return getattr(self.f, name)
+
+        def read(self, size=-1):
+            data = self.f.read(size)
+            read_bytes.append(len(data))
+            return data
+
+    monkeypatch.setattr(dcrp, "open", lambda *args, **kwargs: CountingFile(open(*args, **kwargs)), raising=False)
+
+    history = evolution.load_history(limit=10)
+    summary = evolution.load_summary(limit=10)
+
+    assert [s["total_files"] for s in history] == list(range(2990, 3000))
+    assert [row["total_files"] for row in summary] == list(range(2990, 3000))
+    assert sum(read_bytes) < history_size / 4
+    report = evolution.generate_evolution_report(summary, evolution.snapshot_count())
+    assert "**Snapshots Recorded:** 3000" in report and "**Window:** last 10 snapshots" in report
+
+
+def test_watcher_edit_survives_rebuild(fixture_repo, monkeypatch):
+    monkeypatch.setattr(dcrp.DependencyWatcher, "OUTPUT_FILES", {fixture_repo / "graph.json"})
+    (fixture_repo / "alpha.py").write_text("", encoding="utf-8")
+    (fixture_repo / "beta.py").write_text("", encoding="utf-8")
+    state = dcrp.ProcessingState()
+    identities, graph, void_dirs = build(state=state)
+    watcher = dcrp.DependencyWatcher(
+        identities, graph, state, dcrp.CircularDependencyResolver.analyze_components(graph), void_dirs,
+        save_state=False,
+    )
+
+    alpha = fixture_repo / "alpha.py"
+    alpha.write_text("import beta\n", encoding="utf-8")
+    watcher.apply_change("alpha.py", alpha.stat().st_mtime)
+    assert ("alpha.py", "beta.py") in watcher.graph.edges
+
+    # A new file forces a full rebuild; the cached alpha.py must keep its edit
+    (fixture_repo / "gamma.py").write_text("import alpha\n", encoding="utf-8")
+    watcher.rebuild()
+    assert ("alpha.py", "beta.py") in watcher.graph.edges
+    assert ("gamma.py", "alpha.py") in watcher.graph.edges
+    assert_matches_full_rebuild(watcher)
+
+
+BOXED_MODULE = '''#!/usr/bin/env python3
+"""
+╔══════════════════════════════╗
+║  BOXED TITLE - THE PURPOSE   ║
+╚══════════════════════════════╝
+"""
+
+
+def first():
+    pass
+'''
+
+
+def test_inject_skip_then_splice(fixture_repo):
+    path = fixture_repo / "boxed.py"
+    path.write_text(BOXED_MODULE, encoding="utf-8")
+    state = dcrp.ProcessingState()
+    identities, graph, _ = build(state=state)
+    identity = identities["boxed.py"]
+
+    assert dcrp.HeaderInjector.inject_file(identity, graph, "boxed.py", state) == "injected"
+    injected = path.read_text(encoding="utf-8")
+    assert injected.startswith("#!/usr/bin/env python3\n# ╔")
+    assert "Purpose: BOXED TITLE - THE PURPOSE " in injected
+    assert dcrp.HeaderInjector.strip_header(injected, ".py") == BOXED_MODULE
+
+    mtime = path.stat().st_mtime_ns
+    assert dcrp.HeaderInjector.inject_file(identity, graph, "boxed.py", state) == "unchanged"
+    assert path.stat().st_mtime_ns == mtime
+
+    # An edit that changes the header: only the header region is replaced
+    path.write_text(injected + "\n\ndef second():\n    pass\n", encoding="utf-8")
+    identity, _, _ = dcrp.analyze_file(path)
+    assert dcrp.HeaderInjector.inject_file(identity, graph, "boxed.py", state) == "updated"
+    updated = path.read_text(encoding="utf-8")
+    assert updated.count(dcrp.HeaderInjector.MARKER) == 1
+    assert "Exports: first, second" in updated
+    assert dcrp.HeaderInjector.strip_header(updated, ".py") == BOXED_MODULE + "\n\ndef second():\n    pass\n"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
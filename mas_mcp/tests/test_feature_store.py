@@ -0,0 +1,100 @@
+"""Feature store round-trip and memory-mapped batch scoring tests."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from feature_store import (  # noqa: E402
+    entities_to_feature_store,
+    genesis_to_feature_store,
+    open_feature_store,
+    write_feature_store,
+)
+from gpu_orchestrator import mas_gpu_batch_score  # noqa: E402
+
+
+def test_round_trip_is_memory_mapped(tmp_path):
+    vectors = np.random.default_rng(3).random((40, 8)).astype(np.float32)
+    write_feature_store(tmp_path / "store", vectors, [f"id{i}" for i in range(40)])
+
+    store = open_feature_store(tmp_path / "store")
+
+    assert isinstance(store.vectors, np.memmap)
+    assert store.meta["count"] == 40 and store.dim == 8
+    np.testing.assert_array_equal(store.vectors, vectors)
+    assert store.id_column[5:7].tolist() == ["id5", "id6"]
+
+
+def test_bare_npy_gets_synthetic_ids(tmp_path):
+    np.save(tmp_path / "vectors.npy", np.zeros((4, 3), dtype=np.float32))
+
+    store = open_feature_store(tmp_path / "vectors.npy")
+
+    assert store.id_column[1:3] == ["e1", "e2"]
+
+
+def test_rejects_non_float32(tmp_path):
+    np.save(tmp_path / "vectors.npy", np.zeros((4, 3)))
+    with pytest.raises(ValueError):
+        open_feature_store(tmp_path / "vectors.npy")
+
+
+def test_store_scores_match_json_entities(tmp_path):
+    entities = [
+        {"name": f"n{i}", "whr": 0.5 + i * 0.01, "tier": 1 + i % 4, "cup": "G",
+         "measurements": f"B{100 + i}/W{60 + i % 5}/H{105 + i % 7}"}
+        for i in range(300)
+    ]
+    entities_to_feature_store(tmp_path / "store", entities)
+
+    inline = mas_gpu_batch_score(entities, seed=42, tile_size=64, layout="columnar")
+    mapped = mas_gpu_batch_score(
+        feature_store=str(tmp_path / "store"), seed=42, tile_size=64, layout="columnar"
+    )
+
+    assert mapped["columns"] == inline["columns"]
+    assert mapped["aggregate"] == inline["aggregate"]
+
+
+def test_output_path_keeps_columns_on_disk(tmp_path):
+    vectors = np.random.default_rng(5).random((500, 8)).astype(np.float32)
+    write_feature_store(tmp_path / "store", vectors)
+
+    result = mas_gpu_batch_score(
+        feature_store=str(tmp_path / "store"), seed=1, page=1, page_size=10,
+        output_path=str(tmp_path / "scores"),
+    )
+
+    assert "columns" not in result
+    assert result["output_path"] == str(tmp_path / "scores.npz")
+    assert [row["id"] for row in result["scores"]] == [f"e{i}" for i in range(10, 20)]
+    saved = np.load(tmp_path / "scores.npz")
+    assert saved["overall"].shape == (500,)
+    assert saved["ids"][10] == "e10"
+    assert saved["overall"][10] == pytest.approx(result["scores"][0]["overall"])
+
+
+def test_genesis_artifacts_to_store(tmp_path):
+    entity = {
+        "genesis_hash": "abc123", "tier": 2, "whr": 0.55,
+        "physique": {"cup_size": "H", "bust_cm": 110, "waist_cm": 60, "hip_cm": 108},
+    }
+    artifact = tmp_path / "artifacts" / "20260101_000000" / "abc123"
+    artifact.mkdir(parents=True)
+    (artifact / "entity.json").write_text(json.dumps(entity))
+
+    store = open_feature_store(genesis_to_feature_store(tmp_path / "store", tmp_path / "artifacts"))
+
+    assert store.id_column[:].tolist() == ["abc123"]
+    np.testing.assert_allclose(store.vectors[0], [0.55, 2.0, 0.8, 110 / 150, 60 / 80, 108 / 130])
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,34 @@
+"""Tests for the pruned scandir walker."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lib.fs_walk import walk_files  # noqa: E402
+
+
+def test_prunes_excludes_and_reports_void_dirs(tmp_path):
+    for rel in ("b.py", "a/z.md", "a/y.rs", "node_modules/pkg/index.js", "a/.DS_Store"):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("x")
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "hidden_only").mkdir()
+    (tmp_path / "hidden_only" / ".keep").write_text("")
+
+    void_dirs = []
+    found = [
+        Path(e.path).relative_to(tmp_path).as_posix()
+        for e in walk_files(tmp_path, {"node_modules"}, {".DS_Store"}, void_dirs=void_dirs)
+    ]
+
+    assert found == ["b.py", "a/y.rs", "a/z.md", "hidden_only/.keep"]
+    assert sorted(p.name for p in void_dirs) == ["empty", "hidden_only"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
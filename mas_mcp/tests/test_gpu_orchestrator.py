@@ -0,0 +1,122 @@
+"""Tiling and result-assembly tests for the GPU orchestrator.
+
+These run on the CPU lane, so they do not need CuPy or CUDA.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from gpu_orchestrator import (  # noqa: E402
+    PipelinedTileExecutor,
+    TiledBatchProcessor,
+    hardware_fingerprint,
+    load_tile_profile,
+    mas_gpu_batch_score,
+    save_tile_profile,
+)
+
+
+def _vector_entities(n: int, dim: int = 8, seed: int = 7) -> list:
+    rng = np.random.default_rng(seed)
+    return [{"id": f"e{i}", "vec": v.tolist()} for i, v in enumerate(rng.random((n, dim)))]
+
+
+def test_columnar_matches_rows():
+    entities = _vector_entities(1200)
+
+    rows = mas_gpu_batch_score(entities, seed=42, tile_size=250)
+    cols = mas_gpu_batch_score(entities, seed=42, tile_size=250, layout="columnar")
+
+    assert rows["tiling"]["tile_count"] == 5
+    assert rows["tiling"]["tile_size"] == 250  # Partition size, not the tiler's grown size
+    assert "scores" not in cols
+    columns = cols["columns"]
+    assert columns["ids"] == [s["id"] for s in rows["scores"]]
+    for key in ("novelty", "redundancy", "safety", "overall", "meets_thresholds"):
+        assert columns[key] == [s[key] for s in rows["scores"]]
+    assert cols["aggregate"] == rows["aggregate"]
+
+
+def test_paged_row_view():
+    entities = _vector_entities(105)
+
+    full = mas_gpu_batch_score(entities, seed=42)
+    paged = mas_gpu_batch_score(entities, seed=42, layout="columnar", page=2, page_size=50)
+
+    assert paged["page"] == {"page": 2, "page_size": 50, "total_pages": 3}
+    assert paged["scores"] == full["scores"][100:105]
+    assert len(paged["columns"]["ids"]) == 105
+
+
+def test_unknown_layout_rejected():
+    result = mas_gpu_batch_score(_vector_entities(3), layout="tabular")
+    assert "error" in result
+
+
+def test_adapt_tile_size_is_aimd():
+    tiler = TiledBatchProcessor(tile_size=1000, mode="score")
+
+    tiler.adapt_tile_size(1000.0)  # 2x over budget -> multiplicative decrease
+    assert tiler.tile_size == 450
+
+    tiler.adapt_tile_size(10.0)  # well under budget -> additive increase
+    assert tiler.tile_size == 550
+
+    for _ in range(200):
+        tiler.adapt_tile_size(1.0)
+    assert tiler.tile_size == 1000 * TiledBatchProcessor.MAX_GROWTH
+
+
+def test_pipelined_executor_cpu_path():
+    tiler = TiledBatchProcessor(tile_size=100, mode="score")
+    executor = PipelinedTileExecutor(tiler, use_gpu=False)
+    arr = np.arange(5000, dtype=np.float32)
+
+    out = np.empty_like(arr)
+    bounds = []
+    for tile_idx, start, stop, result in executor.run(arr, lambda tile, idx: tile * 2):
+        out[start:stop] = result
+        bounds.append((tile_idx, start, stop))
+
+    assert executor.backend == "cpu_threads"
+    np.testing.assert_array_equal(out, arr * 2)
+    assert [b[0] for b in bounds] == list(range(len(bounds)))
+    assert all(prev[2] == nxt[1] for prev, nxt in zip(bounds[:-1], bounds[1:], strict=True))
+    # Fast tiles grow the size while the run is in flight
+    assert bounds[-2][2] - bounds[-2][1] > 100
+    assert tiler.last_metrics.tile_count == len(bounds)
+
+
+def test_pipelined_executor_stages_owned_copies(tmp_path):
+    arr = np.lib.format.open_memmap(tmp_path / "vectors.npy", mode="w+", dtype=np.float32, shape=(300, 4))
+    arr[:] = 1.0
+    executor = PipelinedTileExecutor(TiledBatchProcessor(tile_size=100, mode="score"), use_gpu=False,
+                                     adapt_in_flight=False)
+
+    staged = [result for _, _, _, result in executor.run(arr, lambda tile, idx: tile)]
+
+    assert all(type(tile) is np.ndarray and tile.flags.owndata for tile in staged)
+    assert executor.tiler.last_metrics.tile_size == 100
+
+
+def test_tile_profile_round_trip(tmp_path):
+    path = tmp_path / "tile_profiles.json"
+    assert load_tile_profile(path) == {}
+
+    save_tile_profile({"score": 12000, "hierarchy": 1500}, path=path)
+    save_tile_profile({"edges": 80000}, path=path)
+
+    assert load_tile_profile(path) == {"score": 12000, "hierarchy": 1500, "edges": 80000}
+    key, _ = hardware_fingerprint()
+    assert key == hardware_fingerprint()[0]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
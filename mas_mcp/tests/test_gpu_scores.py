@@ -0,0 +1,36 @@
+"""Parity tests for the parallel CPU scoring backends.
+
+The single-threaded NumPy implementation is the reference; the Numba and
+thread-pool backends must match it within the GPU parity tolerance.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from gpu_scores import PARALLEL_MIN_ROWS, validate_gpu_cpu_parity  # noqa: E402
+
+
+def test_threaded_backend_parity():
+    report = validate_gpu_cpu_parity(n_vectors=PARALLEL_MIN_ROWS * 2, dim=64, backend="threads")
+
+    assert report["backend"] == "cpu_threads"
+    assert report["status"] == "passed", report["differences"]
+
+
+def test_numba_backend_parity():
+    pytest.importorskip("numba")
+
+    report = validate_gpu_cpu_parity(n_vectors=PARALLEL_MIN_ROWS * 2, dim=64, backend="numba")
+
+    assert report["backend"] == "cpu_numba"
+    assert report["status"] == "passed", report["differences"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,111 @@
+"""Tests for the cached one-pass LoreIndex behind the asc lore commands."""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("typer")
+pytest.importorskip("rich")
+
+from lib.asc_toolchain import LoreExtractor, LoreIndex  # noqa: E402
+
+FILL = "Filler prose line."
+CODEX = "\n".join([
+    "# Codex",
+    "",
+    "See section 0.1.",  # 2: the Decorator marker's \s* only matches across this newline
+    "Supreme Profile notes for The Decorator follow.",
+    "",
+    "## 0.1. Supreme Profile of The Decorator",  # 5: the real anchor
+    "**Height:** 190 cm",
+    "---",
+    "",
+    "### 4.2.1. The Apex Synthesist: Orackla Nocticula",  # 9
+    "**Race:** Succubus",
+    "**Age:** Timeless",
+    "**Height:** 178 cm",
+    "**Measurements:** **J-cup** (B 124/W 56/H 116)",
+    "**WHR:** 0.483",
+    "**Scent:** Ozone and myrrh",
+    *[FILL] * 16,
+    "**ASC Identity Manifestation (Nocticula) - Combinational Analysis**",  # 32
+    FILL,
+    "**4.2.2. Next numbered block**",  # 34: ends Orackla's profile
+    FILL,
+    "### 4.2.2. The Grandmistress of Architectonic Refinement: Madam Umeko Ketsuraku",  # 36
+    "**Height:** 165 cm",
+    "The Thieves Guild pays tribute.",
+])
+
+
+@pytest.fixture
+def codex(tmp_path, monkeypatch):
+    monkeypatch.setattr(LoreIndex, "_memory", {})
+    path = tmp_path / "codex.md"
+    path.write_text(CODEX, encoding="utf-8")
+    return path
+
+
+def test_sections_anchor_on_whole_lines_and_stop_at_profile_end(codex, tmp_path):
+    extractor = LoreExtractor(codex, index_path=tmp_path / "index.json")
+
+    assert extractor.find_entity_sections() == {
+        "The Decorator": (5, 8),  # Bounded by the next entity
+        "Orackla Nocticula": (9, 34),  # Identity line -> next numbered header
+        "Madam Umeko Ketsuraku": (36, 39),
+    }
+    assert extractor.index.header_path(12) == [
+        "Codex",
+        "0.1. Supreme Profile of The Decorator",
+        "4.2.1. The Apex Synthesist: Orackla Nocticula",
+    ]
+    assert extractor.extract_factions()["Prime Factions (Tier 2)"] == ["The Thieves Guild (TTG)"]
+
+
+def test_extract_entity_fields_and_raw_text(codex, tmp_path):
+    extractor = LoreExtractor(codex, index_path=tmp_path / "index.json")
+
+    orackla = extractor.extract_entity("Orackla Nocticula")
+    assert (orackla.tier, orackla.race, orackla.age) == (1.0, "Succubus", "Timeless")
+    assert orackla.scent == "Ozone and myrrh"
+    physique = orackla.physique
+    assert (physique.cup_size, physique.bust_cm, physique.waist_cm, physique.hips_cm) == ("J", 124.0, 56.0, 116.0)
+    assert (physique.height_cm, physique.whr) == (178.0, 0.483)
+    assert orackla.raw_text == "\n".join(CODEX.splitlines()[9:34])
+
+    # Callers get copies; the cached index is untouched
+    orackla.physique.height_cm = 0.0
+    assert extractor.extract_entity("Orackla Nocticula").physique.height_cm == 178.0
+    assert extractor.extract_entity("Nobody") is None
+
+
+def test_cached_index_round_trips(codex, tmp_path, monkeypatch):
+    index_path = tmp_path / "index.json"
+    extractor = LoreExtractor(codex, index_path=index_path)
+    built = extractor.index
+    expected = extractor.extract_all_entities()
+    codex_hash = hashlib.sha256(CODEX.encode("utf-8")).hexdigest()
+
+    monkeypatch.setattr(LoreIndex, "_memory", {})
+    loaded = LoreIndex.load(codex_hash, index_path)
+    assert loaded == built
+    assert LoreIndex.load("other-hash", index_path) is None
+
+    # A fresh extractor answers from the cache without rebuilding
+    monkeypatch.setattr(LoreIndex, "_memory", {})
+    monkeypatch.setattr(LoreExtractor, "build_index", lambda self, codex_hash: pytest.fail("rebuilt"))
+    cached = LoreExtractor(codex, index_path=index_path)
+    assert cached.extract_all_entities() == expected
+    assert [entity.name for entity in expected] == [
+        "The Decorator", "Orackla Nocticula", "Madam Umeko Ketsuraku",
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,112 @@
+"""Tests for the FTS5 lore search index."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lib.lore_search import LoreSearchIndex, compile_query, split_blocks  # noqa: E402
+
+CODEX = """# Codex
+
+## I. Triumvirate
+
+Orackla Nocticula is the Apex Synthesist.
+Her WHR is 0.491.
+
+### Profile
+
+```
+# not a header
+```
+Umeko keeps the architectonic refinement.
+
+## II. Factions
+
+The Thieves Guild answers to Vesper.
+"""
+
+
+@pytest.fixture
+def index():
+    with LoreSearchIndex(None) as index:
+        yield index
+
+
+def test_blocks_track_lines_and_header_path():
+    blocks = list(split_blocks(CODEX))
+
+    assert [(start, stop) for start, stop, _, _ in blocks] == [(1, 1), (3, 3), (5, 6), (8, 8), (10, 13), (15, 15), (17, 17)]
+    assert blocks[4][2] == "Codex > I. Triumvirate > Profile"
+    assert blocks[6][2] == "Codex > II. Factions"
+    assert list(split_blocks("a\nb\nc\n", block_lines=2))[1][:2] == (3, 3)
+
+
+def test_compile_query_is_always_valid_fts5():
+    assert compile_query('"apex synthesis" orack* CRC-AS') == '"apex synthesis" "orack"* "CRC AS"'
+    assert compile_query('(( " - *') == ""
+
+
+def test_ranked_phrase_and_prefix_search(index, tmp_path):
+    codex = tmp_path / "codex.md"
+    codex.write_text(CODEX, encoding="utf-8")
+    index.update([codex])
+
+    hits = index.search("orack* whr")
+    assert [(hit.line, hit.start, hit.stop) for hit in hits] == [(5, 5, 6)]
+    assert hits[0].section == "Codex > I. Triumvirate"
+    assert "«Orackla»" in hits[0].snippet and "«WHR»" in hits[0].snippet
+
+    assert [hit.line for hit in index.search('"thieves guild"')] == [17]
+    assert index.search('"guild thieves"') == []
+    assert index.search('vesper) OR "(') == []
+
+
+def test_update_reindexes_only_changed_files(index, tmp_path):
+    codex, notes = tmp_path / "codex.md", tmp_path / "notes.md"
+    codex.write_text(CODEX, encoding="utf-8")
+    notes.write_text("Vesper steals epistemes.\n", encoding="utf-8")
+
+    assert index.update([codex, notes]) == {"indexed": 2, "unchanged": 0, "removed": 0}
+    assert index.update([codex, notes]) == {"indexed": 0, "unchanged": 2, "removed": 0}
+    assert len(index.search("vesper")) == 2
+    assert len(index.search("vesper", paths=[notes])) == 1
+
+    codex.write_text(CODEX.replace("Vesper", "Seraphine"), encoding="utf-8")
+    assert index.update([codex, notes]) == {"indexed": 1, "unchanged": 1, "removed": 0}
+    assert [Path(hit.path).name for hit in index.search("vesper")] == ["notes.md"]
+
+    assert index.update([codex], prune=tmp_path) == {"indexed": 0, "unchanged": 1, "removed": 1}
+    assert index.search("vesper") == []
+    assert len(index.search("seraphine")) == 1
+
+
+def test_prune_only_drops_files_under_its_root(index, tmp_path):
+    (tmp_path / "archive").mkdir()
+    (tmp_path / "archive-2").mkdir()
+    inside, sibling = tmp_path / "archive" / "a.md", tmp_path / "archive-2" / "b.md"
+    inside.write_text("Vesper inside.\n", encoding="utf-8")
+    sibling.write_text("Vesper beside.\n", encoding="utf-8")
+    index.update([inside, sibling])
+
+    assert index.update([], prune=tmp_path / "archive")["removed"] == 1
+    assert [Path(hit.path).name for hit in index.search("vesper")] == ["b.md"]
+
+
+def test_index_persists_between_connections(tmp_path):
+    codex = tmp_path / "codex.md"
+    codex.write_text(CODEX, encoding="utf-8")
+    with LoreSearchIndex(tmp_path / "search.sqlite") as index:
+        index.update([codex])
+
+    with LoreSearchIndex(tmp_path / "search.sqlite") as index:
+        assert index.update([codex])["unchanged"] == 1
+        assert len(index.search("umeko")) == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
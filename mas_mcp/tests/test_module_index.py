@@ -0,0 +1,48 @@
+"""Tests for the module-resolution index."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lib.module_index import ModuleIndex  # noqa: E402
+
+
+@pytest.fixture
+def index(tmp_path):
+    for rel in (
+        "pkg/__init__.py", "pkg/mod.py", "pkg/sub/__init__.py", "pkg/sub.py",
+        "src/lib.rs", "src/net/mod.rs", "src/net/tcp.rs", "node_modules/x/index.js",
+        "web/components/index.ts",
+    ):
+        (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / rel).write_text("")
+    return ModuleIndex.build(tmp_path, exclude_dirs={"node_modules"})
+
+
+def test_python_modules_prefer_module_file_over_package(index, tmp_path):
+    assert index.python_module("pkg") == tmp_path / "pkg/__init__.py"
+    assert index.python_module("pkg.mod") == tmp_path / "pkg/mod.py"
+    assert index.python_module("pkg.sub") == tmp_path / "pkg/sub.py"
+    assert index.python_module("os.path") is None
+
+
+def test_rust_crate_paths_and_relative_lookups(index, tmp_path):
+    assert index.rust_module("crate::net") == tmp_path / "src/net/mod.rs"
+    assert index.rust_module("crate::net::tcp") == tmp_path / "src/net/tcp.rs"
+    assert index.module_file(tmp_path / "src/net", ["..", "net", "tcp"], ".rs", "mod.rs") == tmp_path / "src/net/tcp.rs"
+    assert index.module_file(tmp_path / "pkg", ["sub"], ".py", "__init__.py") == tmp_path / "pkg/sub.py"
+
+
+def test_existence_checks_skip_excluded_dirs(index, tmp_path):
+    assert index.is_dir(tmp_path / "web/components")
+    assert index.is_file(tmp_path / "web/components/index.ts")
+    assert not index.is_file(tmp_path / "node_modules/x/index.js")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -47,6 +47,13 @@ ASSETS_PATH = PROJECT_ROOT / "assets"
 LOGS_PATH = PROJECT_ROOT / "logs"
 CACHE_PATH = PROJECT_ROOT / ".cache"
 
+# Directories the file watcher never descends into
+WATCH_EXCLUDE_DIRS = {"target", ".venv", "node_modules", ".git"}
+
+# Shared pruned scandir walker (mas_mcp/lib/fs_walk.py)
+sys.path.insert(0, str(PROJECT_ROOT / "mas_mcp"))
+from lib.fs_walk import walk_files  # noqa: E402
+
 # Ensure directories exist
 LOGS_PATH.mkdir(exist_ok=True)
 CACHE_PATH.mkdir(exist_ok=True)
@@ -195,21 +202,23 @@ class FileWatcher:
         # Could trigger: glslangValidator, shader compilation
     
     def scan_changes(self) -> list[Path]:
-        """Scan for changed files."""
+        """Scan for changed files (one pruned walk for all watch patterns)."""
         changed = []
+        handlers = {pattern[1:]: handler for pattern, handler in self.watch_patterns}
         
-        for pattern, handler in self.watch_patterns:
-            for path in PROJECT_ROOT.rglob(pattern):
-                if "target" in str(path) or ".venv" in str(path) or "node_modules" in str(path):
-                    continue
-                    
-                current_hash = self._hash_file(path)
-                if path not in self.file_hashes:
-                    self.file_hashes[path] = current_hash
-                elif self.file_hashes[path] != current_hash:
-                    self.file_hashes[path] = current_hash
-                    changed.append(path)
-                    handler(path)
+        for entry in walk_files(PROJECT_ROOT, exclude_dirs=WATCH_EXCLUDE_DIRS):
+            handler = handlers.get(os.path.splitext(entry.name)[1])
+            if handler is None:
+                continue
+            
+            path = Path(entry.path)
+            current_hash = self._hash_file(path)
+            if path not in self.file_hashes:
+                self.file_hashes[path] = current_hash
+            elif self.file_hashes[path] != current_hash:
+                self.file_hashes[path] = current_hash
+                changed.append(path)
+                handler(path)
         
         return changed
 
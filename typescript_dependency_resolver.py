@@ -9,9 +9,10 @@ Author: The Decorator (Session 3, Phase 2)
 Date: 2026-01-01
 """
 
+import os
 import re
 from pathlib import Path
-from typing import Set
+from typing import Dict, Optional, Set, Tuple
 
 
 class TypeScriptRegexExtractor:
@@ -25,61 +26,93 @@ class TypeScriptRegexExtractor:
     - Bun path aliases (@/ → mas_mcp/frontend/)
     - Relative imports (./path, ../path)
     - Index file resolution (./components → ./components/index.ts)
+    
+    One extractor instance memoizes resolution by (base dir, specifier) and
+    caches directory listings, so reuse it across files. Call clear_cache()
+    after files are added or removed. Given a module index (anything with
+    is_file()/is_dir(), e.g. mas_mcp lib.module_index.ModuleIndex) it answers
+    existence checks from the index instead of listing directories.
     """
     
-    # Import/export patterns (non-greedy, handles multi-line)
-    IMPORT_PATTERNS = [
-        # import { X, Y } from "./path"
-        # import { X as Y, Z } from "@/path"
-        r'import\s+\{[^}]*\}\s+from\s+["\']([^"\']+)["\']',
-        
-        # import * as Module from "./path"
-        r'import\s+\*\s+as\s+\w+\s+from\s+["\']([^"\']+)["\']',
-        
-        # import Default from "./path"
-        # import Default, { Named } from "./path"
-        r'import\s+\w+(?:\s*,\s*\{[^}]*\})?\s+from\s+["\']([^"\']+)["\']',
-        
+    # Every import/export form as one alternation, applied in a single pass.
+    # The pattern starts with the literal "port" (then checks im/ex with a
+    # lookbehind) so the regex engine can use its fast literal-prefix search
+    # instead of trying the alternation at every offset.
+    # Groups: 1 static import, 2 dynamic import(), 3 re-export
+    IMPORT_RE = re.compile(
+        r'port(?:'
+        r'(?<=\bimport)(?:'
+        # import { X, Y } from "./path"        import type { X } from "./path"
+        # import * as Module from "./path"     import Default, { Named } from "./path"
+        r'\s+(?:type\s+)?(?:\{[^}]*\}|\*\s+as\s+\w+|\w+(?:\s*,\s*\{[^}]*\})?)'
+        r'\s+from\s+["\']([^"\']+)["\']'
         # const X = await import("./path")
-        # const X = import("./path")
-        r'import\s*\(\s*["\']([^"\']+)["\']\s*\)',
-        
-        # export { X } from "./path"
-        # export { X as Y } from "./path"
-        r'export\s+\{[^}]*\}\s+from\s+["\']([^"\']+)["\']',
-        
-        # export * from "./path"
-        # export * as Namespace from "./path"
-        r'export\s+\*(?:\s+as\s+\w+)?\s+from\s+["\']([^"\']+)["\']',
-        
-        # import type { X } from "./path" (TypeScript type-only imports)
-        r'import\s+type\s+\{[^}]*\}\s+from\s+["\']([^"\']+)["\']',
-    ]
+        r'|\s*\(\s*["\']([^"\']+)["\']\s*\)'
+        r')'
+        # export { X as Y } from "./path"      export * as Namespace from "./path"
+        r'|(?<=\bexport)\s+(?:\{[^}]*\}|\*(?:\s+as\s+\w+)?)'
+        r'\s+from\s+["\']([^"\']+)["\']'
+        r')'
+    )
+    
+    EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+    
+    def __init__(self, index=None):
+        self.index = index
+        self._resolved: Dict[Tuple[str, str], Optional[Path]] = {}
+        self._listings: Dict[str, Optional[Dict[str, bool]]] = {}
+    
+    def use_index(self, index) -> None:
+        """Switch to a (new) module index and drop memoized resolutions."""
+        self.index = index
+        self.clear_cache()
+    
+    def clear_cache(self) -> None:
+        """Forget memoized resolutions and directory listings."""
+        self._resolved.clear()
+        self._listings.clear()
     
-    def extract_imports(self, ts_file: Path) -> Set[str]:
+    def extract_imports(self, ts_file: Path, content: Optional[str] = None) -> Set[str]:
         """
         Extract all import paths from TS/TSX file.
         
         Args:
             ts_file: Path to TypeScript source file
+            content: File text, if the caller already read it
         
         Returns:
             Set of import path strings (unresolved)
         """
-        try:
-            content = ts_file.read_text(encoding='utf-8')
-        except Exception as e:
-            # Silently skip unreadable files (binary, permission issues)
-            return set()
-        
-        imports = set()
-        
-        # Apply all patterns
-        for pattern in self.IMPORT_PATTERNS:
-            matches = re.findall(pattern, content, re.MULTILINE)
-            imports.update(matches)
+        if content is None:
+            try:
+                content = ts_file.read_text(encoding='utf-8')
+            except Exception as e:
+                # Silently skip unreadable files (binary, permission issues)
+                return set()
         
-        return imports
+        return {static or dynamic or reexport for static, dynamic, reexport in self.IMPORT_RE.findall(content)}
+    
+    def _listing(self, directory: str) -> Optional[Dict[str, bool]]:
+        """Cached {name: is_file} for a directory (None if it does not exist)."""
+        if directory not in self._listings:
+            try:
+                with os.scandir(directory) as it:
+                    listing = {}
+                    for entry in it:
+                        try:
+                            listing[entry.name] = entry.is_file()
+                        except OSError:
+                            listing[entry.name] = False
+            except OSError:
+                listing = None
+            self._listings[directory] = listing
+        return self._listings[directory]
+    
+    def _is_file(self, path: str) -> bool:
+        if self.index is not None:
+            return self.index.is_file(path)
+        listing = self._listing(os.path.dirname(path))
+        return bool(listing and listing.get(os.path.basename(path)))
     
     def resolve_import_path(
         self,
@@ -124,35 +157,36 @@ class TypeScriptRegexExtractor:
         else:
             return None
         
+        key = (str(base), relative_path)
+        if key not in self._resolved:
+            self._resolved[key] = self._resolve_uncached(base, relative_path)
+        return self._resolved[key]
+    
+    def _resolve_uncached(self, base: Path, relative_path: str) -> Path | None:
+        """Extension and index-file probing against cached directory listings."""
+        target = Path(os.path.abspath(base / relative_path))
+        
         # Try file with various extensions
-        for ext in ['.ts', '.tsx', '.js', '.jsx', '']:
-            if relative_path.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                # Already has extension
-                candidate = base / relative_path
-            else:
-                # Append extension
-                candidate = (base / relative_path).with_suffix(ext)
-            
-            # Normalize and check existence
+        if relative_path.endswith(self.EXTENSIONS):
+            candidates = [target]  # Already has extension
+        else:
             try:
-                candidate = candidate.resolve()
-                if candidate.exists() and candidate.is_file():
-                    return candidate
-            except (OSError, RuntimeError):
-                # resolve() can fail on invalid paths
-                continue
+                candidates = [target.with_suffix(ext) for ext in self.EXTENSIONS + ('',)]
+            except ValueError:
+                # with_suffix() rejects names like ".." - fall through to index files
+                candidates = []
+        
+        for candidate in candidates:
+            if self._is_file(str(candidate)):
+                return candidate.resolve()
         
         # Try index file resolution (./components → ./components/index.ts)
-        index_dir = base / relative_path
-        if index_dir.is_dir():
-            for ext in ['.ts', '.tsx', '.js', '.jsx']:
-                index_file = index_dir / f'index{ext}'
-                try:
-                    index_file = index_file.resolve()
-                    if index_file.exists() and index_file.is_file():
-                        return index_file
-                except (OSError, RuntimeError):
-                    continue
+        index_dir = str(target)
+        if self.index.is_dir(index_dir) if self.index is not None else self._listing(index_dir) is not None:
+            for ext in self.EXTENSIONS:
+                index_file = os.path.join(index_dir, f'index{ext}')
+                if self._is_file(index_file):
+                    return Path(index_file).resolve()
         
         # Resolution failed
         return None
@@ -160,7 +194,8 @@ class TypeScriptRegexExtractor:
     def extract_and_resolve(
         self,
         ts_file: Path,
-        repo_root: Path
+        repo_root: Path,
+        content: Optional[str] = None
     ) -> Set[Path]:
         """
         Extract and resolve all dependencies from TS file.
@@ -170,11 +205,12 @@ class TypeScriptRegexExtractor:
         Args:
             ts_file: TypeScript source file
             repo_root: Repository root
+            content: File text, if the caller already read it
         
         Returns:
             Set of resolved dependency Paths
         """
-        import_paths = self.extract_imports(ts_file)
+        import_paths = self.extract_imports(ts_file, content)
         
         dependencies = set()
         for import_path in import_paths: